@@ -0,0 +1,59 @@
+"""
+Compares Homer's readability engine with textstat, both on speed and on the scores they give.
+
+> python benchmarks/bench_readability.py tests/moby_dick.txt tests/python_paradox.txt
+
+The readability engine is timed on an already built Article, as it is used by ArticlePrinter: the article scores
+followed by the scores of every paragraph.
+"""
+import sys
+import timeit
+import textstat
+from homer.analyzer import Article
+from homer.readability import TOLERANCE
+
+TEXTSTAT_SCORES = {
+    'flesch_reading_ease': textstat.flesch_reading_ease,
+    'flesch_kincaid_grade': textstat.flesch_kincaid_grade,
+    'gunning_fog': textstat.gunning_fog,
+    'smog_index': textstat.smog_index,
+    'coleman_liau_index': textstat.coleman_liau_index,
+    'automated_readability_index': textstat.automated_readability_index,
+    'dale_chall_score': textstat.dale_chall_readability_score,
+}
+
+
+def score_with_textstat(article):
+    for text in [article.text] + [paragraph.paragraph for paragraph in article.paragraphs]:
+        for score in TEXTSTAT_SCORES.values():
+            score(text)
+
+
+def score_with_homer(article):
+    # Start from cold counts, so that the time includes counting syllables and summing paragraphs.
+    for paragraph in article.paragraphs:
+        paragraph._readability_counts = None
+        for sentence in paragraph.sentences:
+            sentence._readability_counts = None
+    article._readability_counts = None
+    article.get_readability_scores()
+    for paragraph in article.paragraphs:
+        paragraph.get_readability_scores()
+
+
+def main(file_paths, repeat=5):
+    for file_path in file_paths:
+        article = Article(file_path, '', open(file_path, encoding='utf-8').read())
+        homer_time = min(timeit.repeat(lambda: score_with_homer(article), number=1, repeat=repeat))
+        # textstat caches its results per text, so only its first, cold run is timed.
+        textstat_time = min(timeit.repeat(lambda: score_with_textstat(article), number=1, repeat=1))
+        print('%s: homer %.4fs, textstat %.4fs' % (file_path, homer_time, textstat_time))
+        scores = article.get_readability_scores()
+        for name, textstat_score in TEXTSTAT_SCORES.items():
+            expected = textstat_score(article.text)
+            flag = '' if abs(expected - scores[name]) <= TOLERANCE[name] else '  (outside tolerance)'
+            print('    %-30s homer %7.2f  textstat %7.2f%s' % (name, scores[name], expected, flag))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
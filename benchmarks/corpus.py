@@ -0,0 +1,46 @@
+"""
+Reproducible synthetic texts for the benchmarks.
+
+Texts are made of sentences of 5 to 35 words and paragraphs of 1 to 9 sentences, drawn with a fixed seed from a small
+vocabulary that includes intensifiers, compulsive hedgers, vague words and 'and', so that every stat has work to do.
+"""
+import random
+from homer.constants import INTENSIFIERS, COMPULSIVE_HEDGERS, VAGUE_WORDS
+
+COMMON_WORDS = (
+    'the of to in is was he for it with as his on be at by had are but from or have an they which one you were her all '
+    'she there would their we him been has when who will more no if out so said what up its about into than them can '
+    'only other new some could time these two may then do first any my now such like our over man me even most made '
+    'after also did many before must through back years where much your way well down should because each just those '
+    'people how too little state good very make world still own see men work long get here between both life being '
+    'under never day same another know while last might us great old year off come since against go came right used '
+    'take three whale ship sea captain water voyage harbour island evening morning particularly deliberately '
+    'considerable circumambulate involuntarily metaphysical programming language readability paragraph'
+).split()
+VOCABULARY = COMMON_WORDS * 8 + ['and'] * 40 + INTENSIFIERS + COMPULSIVE_HEDGERS + VAGUE_WORDS
+
+SIZES = {
+    '1KB': 1024,
+    '100KB': 100 * 1024,
+    '10MB': 10 * 1024 * 1024,
+}
+
+
+def generate_sentence(rng):
+    words = [rng.choice(VOCABULARY) for _ in range(rng.randint(5, 35))]
+    words[0] = words[0].capitalize()
+    if len(words) > 12:
+        words[len(words) // 2] += ','
+    return ' '.join(words) + rng.choice('...?!')
+
+
+def generate_text(size, seed=0):
+    """A text of about `size` characters. The same size and seed always give the same text."""
+    rng = random.Random(seed)
+    paragraphs = []
+    length = 0
+    while length < size:
+        paragraph = ' '.join(generate_sentence(rng) for _ in range(rng.randint(1, 9)))
+        paragraphs.append(paragraph)
+        length += len(paragraph) + 2
+    return '\n\n'.join(paragraphs)[:size].rsplit(' ', 1)[0] + '.'
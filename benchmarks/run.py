@@ -0,0 +1,121 @@
+"""
+Times the stages of an analysis on synthetic texts of 1KB, 100KB and 10MB and on the texts in `tests/`, and writes the
+results as JSON.
+
+> python benchmarks/run.py --output bench_output.json
+> python benchmarks/run.py --corpus 1KB --corpus moby_dick.txt --memory
+> python benchmarks/run.py --tokenizer regex
+
+Each stage runs on a freshly built Article, so caches filled by an earlier stage only help where they would in a real
+run, e.g. the process-wide CMUdict index. With `--memory` every stage is run a second time under tracemalloc to record
+its peak memory. The timings come from the first run, which is not slowed down by tracing.
+"""
+import io
+import os
+import sys
+import json
+import time
+import platform
+import tracemalloc
+import contextlib
+import click
+from corpus import SIZES, generate_text
+from homer.analyzer import Article
+from homer.resources import warmup
+from homer.tokenizers import TOKENIZERS, DEFAULT_TOKENIZER
+from homer.cmdline_printer import ArticlePrinter
+
+TESTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'tests')
+TEST_TEXTS = ('moby_dick.txt', 'python_paradox.txt')
+
+
+def build_article(text, tokenizer=None):
+    article = Article('benchmark', 'homer', text, tokenizer)
+    article.paragraphs
+    return article
+
+
+def score_readability(article):
+    article.get_flesch_reading_score()
+    article.get_dale_chall_reading_score()
+    for paragraph in article.paragraphs:
+        paragraph.get_flesch_reading_score()
+        paragraph.get_dale_chall_reading_score()
+
+
+def print_report(article):
+    with contextlib.redirect_stdout(io.StringIO()):
+        printer = ArticlePrinter(article)
+        printer.print_article_stats()
+        printer.print_paragraph_stats()
+
+
+# Every stage but the first gets the text and an Article built from it that nothing has been asked of yet.
+STAGES = [
+    ('build_article', lambda text, article: build_article(text)),
+    ('readability', lambda text, article: score_readability(article)),
+    ('ten_words_with_most_syllables', lambda text, article: article.ten_words_with_most_syllables()),
+    ('get_n_most_repeated_words', lambda text, article: article.get_n_most_repeated_words(20)),
+    ('article_printer', lambda text, article: print_report(article)),
+]
+
+
+def load_corpora(names):
+    for name in names:
+        if name in SIZES:
+            yield 'synthetic-%s' % name, generate_text(SIZES[name])
+        else:
+            with open(os.path.join(TESTS_DIR, name), encoding='utf-8') as f:
+                yield name, f.read()
+
+
+def measure(stage, text, memory, tokenizer=None):
+    run = dict(STAGES)[stage]
+    if stage == 'build_article':
+        run = lambda text, article: build_article(text, tokenizer)
+    new_article = (lambda: None) if stage == 'build_article' else (lambda: build_article(text, tokenizer))
+    article = new_article()
+    start = time.perf_counter()
+    run(text, article)
+    result = {'seconds': time.perf_counter() - start}
+    if memory:
+        article = new_article()
+        tracemalloc.start()
+        run(text, article)
+        result['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result
+
+
+@click.command()
+@click.option('--corpus', 'corpora', multiple=True, help='A synthetic size (%s) or a file in tests/. Defaults to all.'
+                                                         % ', '.join(SIZES))
+@click.option('--stage', 'stages', multiple=True, type=click.Choice([name for name, _ in STAGES]),
+              help='Stages to run. Defaults to all.')
+@click.option('--tokenizer', type=click.Choice(sorted(TOKENIZERS)), default=DEFAULT_TOKENIZER,
+              help='Tokenizer the articles are built with.')
+@click.option('--memory', is_flag=True, help='Also record the peak memory of every stage.')
+@click.option('--output', type=click.Path(), help='File to write the JSON results to. Printed when not given.')
+def main(corpora, stages, tokenizer, memory, output):
+    corpora = corpora or list(SIZES) + list(TEST_TEXTS)
+    stages = stages or [name for name, _ in STAGES]
+    # Loads the NLTK models, so that the first stage measured does not pay for it.
+    warmup()
+    results = []
+    for corpus, text in load_corpora(corpora):
+        for stage in stages:
+            result = {'corpus': corpus, 'characters': len(text), 'stage': stage, 'tokenizer': tokenizer}
+            result.update(measure(stage, text, memory, tokenizer))
+            print('%-20s %-30s %8.3fs' % (corpus, stage, result['seconds']), file=sys.stderr)
+            results.append(result)
+    report = json.dumps({'python': platform.python_version(), 'platform': platform.platform(), 'results': results},
+                        indent=2)
+    if output:
+        with open(output, 'w') as f:
+            f.write(report)
+    else:
+        print(report)
+
+
+if __name__ == '__main__':
+    main()
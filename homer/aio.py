@@ -0,0 +1,125 @@
+"""
+Analyzes texts from asyncio code without blocking the event loop.
+
+> analysis = await analyze_async(text, name='Moby Dick', timeout=0.5)
+> analysis.summary['reading_time'], analysis.complete
+
+Tokenizing and scoring run in the threads of a bounded executor, one paragraph at a time. Between paragraphs the
+worker checks whether the caller gave up: when the timeout expires it stops and the paragraphs analyzed so far are
+returned, with `complete` set to False and no summary, since computing one may take long, e.g. to load CMUdict. An
+analysis which has not started by then, because every thread is busy, is dropped and returned without paragraphs. When
+the awaiting task is cancelled it stops as well, and the cancellation goes on to the caller.
+
+At most `max_pending` analyses are handed to the executor at once. Callers beyond that wait for a slot, so a burst of
+requests queues up in the event loop rather than in memory held by the executor. A slot is only free again once its
+worker thread is done, so a timeout or a cancellation never lets more analyses run at once.
+"""
+import asyncio
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from homer.analyzer import Article, Paragraph
+from homer.batch import summarize
+from homer.lexicon import get_lexicon
+from homer.tokenizers import get_tokenizer
+
+# `article` is an `Article` of the paragraphs analyzed, `summary` its `homer.batch.summarize` stats, or None when the
+# analysis was stopped or no paragraph was analyzed, and `complete` tells whether every paragraph of the text was.
+Analysis = namedtuple('Analysis', ['article', 'summary', 'complete'])
+
+DEFAULT_WORKERS = 4
+
+
+def analyze(text, name='', author='', stop=None, tokenizer=None, lexicon=None):
+    """
+    Analyzes `text` paragraph by paragraph, until done or until the `threading.Event` `stop` is set, in which case
+    nothing is summarized. Returns an `Analysis`. This is what the executor of an `AsyncAnalyzer` runs.
+    """
+    tokenizer = get_tokenizer(tokenizer)
+    lexicon = get_lexicon(lexicon)
+    paragraphs = []
+    complete = True
+    for paragraph_text in tokenizer.paragraphs(text):
+        if stop is not None and stop.is_set():
+            complete = False
+            break
+        paragraphs.append(Paragraph(paragraph_text, tokenizer, lexicon=lexicon))
+    article = Article.from_paragraphs(name, author, paragraphs, tokenizer, lexicon)
+    if not paragraphs or (stop is not None and stop.is_set()):
+        return Analysis(article, None, complete)
+    return Analysis(article, summarize(article), complete)
+
+
+class AsyncAnalyzer(object):
+    """
+    Runs analyses in a pool of `workers` threads, with at most `max_pending` of them, by default twice as many as
+    there are workers, submitted at once. Texts are split by `tokenizer`, see `homer.tokenizers`, and searched for the
+    words of `lexicon`, see `homer.lexicon`.
+    """
+
+    def __init__(self, workers=DEFAULT_WORKERS, max_pending=None, tokenizer=None, lexicon=None):
+        self.workers = workers
+        self.max_pending = max_pending or 2 * workers
+        self.tokenizer = get_tokenizer(tokenizer)
+        self.lexicon = get_lexicon(lexicon)
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._slots = None
+
+    async def analyze(self, text, name='', author='', timeout=None):
+        """
+        `Analysis` of `text`. After `timeout` seconds the analysis stops at the end of the paragraph it is on, and
+        returns what it has. An analysis still waiting for a worker thread by then is dropped, and has no paragraphs.
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+        loop = asyncio.get_running_loop()
+        await self._slots.acquire()
+        stop = threading.Event()
+        try:
+            worker = self._executor.submit(analyze, text, name, author, stop, self.tokenizer, self.lexicon)
+        except BaseException:
+            self._slots.release()
+            raise
+        # Released when the thread is done rather than when the caller stops waiting for it.
+        worker.add_done_callback(lambda _: self._release(loop))
+        future = asyncio.wrap_future(worker)
+        try:
+            await asyncio.wait([future], timeout=timeout)
+            stop.set()
+            if not future.done() and worker.cancel():
+                # Still queued behind other analyses, so there is no thread to wait for.
+                article = Article.from_paragraphs(name, author, [], self.tokenizer, self.lexicon)
+                return Analysis(article, None, False)
+            return await future
+        except asyncio.CancelledError:
+            stop.set()
+            raise
+
+    def _release(self, loop):
+        try:
+            loop.call_soon_threadsafe(self._slots.release)
+        except RuntimeError:
+            # The loop is closed, nothing waits for the slot any more.
+            pass
+
+    def close(self):
+        """Stops the worker threads, once they are done with the analyses they are running."""
+        self._executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+        return False
+
+
+_default_analyzer = None
+
+
+async def analyze_async(text, name='', author='', timeout=None):
+    """`Analysis` of `text`, made by an `AsyncAnalyzer` shared by the process. See `AsyncAnalyzer.analyze`."""
+    global _default_analyzer
+    if _default_analyzer is None:
+        _default_analyzer = AsyncAnalyzer()
+    return await _default_analyzer.analyze(text, name, author, timeout)
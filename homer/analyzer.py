@@ -15,45 +15,83 @@ sentence level stats.
 Author: Waqas Younas
 Email: waqas.younas@gmail.com
 """
+import weakref
 import operator
 import itertools
-import nltk
-from nltk.corpus import cmudict
-from functools import lru_cache
+from collections import Counter, namedtuple
+from homer import ranking
+from homer.tokenizers import get_tokenizer, align_tokens
 from homer.utils import FleschReading, DaleChall
-from homer.constants import INTENSIFIERS, COMPULSIVE_HEDGERS, VAGUE_WORDS, MAX_WORDS_IN_SENTENCE,\
-    MAX_SENTENCES_IN_PARAGRAPH, WORDS_ONE_READS_PER_MINUTE
+from homer.profiling import stage, count
+from homer.readability import ReadabilityCounts
+from homer.syllables import count_syllables
+from array import array
+from homer.vocabulary import VOCABULARY, IS_WORD, IS_AND
+from homer.lexicon import Lexicon, DEFAULT_LEXICON, CATEGORIES, INTENSIFIER, COMPULSIVE_HEDGER, VAGUE_WORD
+from homer.lexicon import LexiconReport, get_lexicon
+from homer.mapped import MappedText
+from homer.constants import MAX_WORDS_IN_SENTENCE, MAX_SENTENCES_IN_PARAGRAPH, WORDS_ONE_READS_PER_MINUTE
 
 
 class Word(object):
     """
     An abstraction of a 'word'. It determines whether a word is a compulsive hedger, an intensifier or a vague word.
 
+    A `Word` is a thin view of an entry of `homer.vocabulary.VOCABULARY`. Sentences keep vocabulary ids, and `get_word`
+    hands out one shared `Word` per distinct word and lexicon.
+
+    `lexicon` is a `homer.lexicon.Lexicon` or the path of a lexicon pack, Homer's word lists by default. The lists
+    given as `intensifiers`, `compulsive_hedgers` or `vague_words` replace its own.
+
     The idea to look for compulsive hedgers, intensifiers and vague words came from the following works:
     - Steven Pinker's book `The Sense of Style: The Thinking Person's Guide to Writing in the 21st Century`.
     - https://litlab.stanford.edu/LiteraryLabPamphlet9.pdf
     """
+    __slots__ = ('id', 'lexicon')
+
+    def __init__(self, word, intensifiers=None, compulsive_hedgers=None, vague_words=None, lexicon=None):
+        self.id = VOCABULARY.intern(word.strip().lower())
+        lexicon = get_lexicon(lexicon)
+        if intensifiers is None and compulsive_hedgers is None and vague_words is None:
+            self.lexicon = lexicon
+        else:
+            self.lexicon = Lexicon(
+                intensifiers=lexicon.intensifiers if intensifiers is None else intensifiers,
+                compulsive_hedgers=lexicon.compulsive_hedgers if compulsive_hedgers is None
+                else compulsive_hedgers,
+                vague_words=lexicon.vague_words if vague_words is None else vague_words)
+
+    @property
+    def word(self):
+        return VOCABULARY.strings[self.id]
+
+    @property
+    def intensifiers(self):
+        return self.lexicon.intensifiers
 
-    def __init__(self, word, intensifiers=INTENSIFIERS, compulsive_hedgers=COMPULSIVE_HEDGERS,
-                 vague_words=VAGUE_WORDS):
-        self.syllables = None
-        self.word = word.strip().lower()
-        self.intensifiers = intensifiers
-        self.compulsive_hedgers = compulsive_hedgers
-        self.vague_words = vague_words
+    @property
+    def compulsive_hedgers(self):
+        return self.lexicon.compulsive_hedgers
+
+    @property
+    def vague_words(self):
+        return self.lexicon.vague_words
+
+    @property
+    def syllables(self):
+        return VOCABULARY.syllables(self.id, count_syllables)
 
     def is_and(self):
-            word_and = 'and'
-            return self.word == word_and
+        return bool(VOCABULARY.flags[self.id] & IS_AND)
 
     def is_compulsive_hedger(self):
-        return self.word in self.compulsive_hedgers
+        return self.word in self.lexicon.compulsive_hedgers
 
     def is_intensifier(self):
-        return self.word in self.intensifiers
+        return self.word in self.lexicon.intensifiers
 
     def is_vague_word(self):
-        return self.word in self.vague_words
+        return self.word in self.lexicon.vague_words
 
     def __repr__(self):
         return 'Word(%r)' % self.word
@@ -62,43 +100,225 @@ class Word(object):
         return self.word
 
 
-@lru_cache(maxsize=256)
-def get_word(word):
-    return Word(word)
+# One shared Word per vocabulary id, created on first use, and as many for every other lexicon in use.
+_words = {}
+_lexicon_words = weakref.WeakKeyDictionary()
+VOCABULARY.on_clear(_words.clear)
+VOCABULARY.on_clear(_lexicon_words.clear)
+
+
+def _words_of(lexicon):
+    return _words if lexicon is DEFAULT_LEXICON else _lexicon_words.setdefault(lexicon, {})
+
+
+def word_of(word_id, lexicon=DEFAULT_LEXICON):
+    """The shared `Word` of the vocabulary entry `word_id` with the `homer.lexicon.Lexicon` `lexicon`."""
+    words = _words_of(lexicon)
+    word = words.get(word_id)
+    if word is None:
+        word = words.setdefault(word_id, Word(VOCABULARY.strings[word_id], lexicon=lexicon))
+    return word
+
+
+def words_of(word_ids, lexicon=DEFAULT_LEXICON):
+    """The shared `Word`s of the vocabulary entries `word_ids`, see `word_of`."""
+    words = _words_of(lexicon)
+    result = []
+    for word_id in word_ids:
+        word = words.get(word_id)
+        if word is None:
+            word = words.setdefault(word_id, Word(VOCABULARY.strings[word_id], lexicon=lexicon))
+        result.append(word)
+    return result
+
+
+def get_word(word, lexicon=None):
+    return word_of(VOCABULARY.intern(word.strip().lower()), get_lexicon(lexicon))
+
+
+# Totals of a paragraph and of an article, computed in one pass over their sentences or paragraphs.
+ParagraphTotals = namedtuple('ParagraphTotals', ['words', 'and_words', 'longest_sentence'])
+ArticleTotals = namedtuple('ArticleTotals', ['sentences', 'words', 'and_words', 'len_of_longest_paragraph',
+                                             'longest_sentence'])
+
+# Something worth pointing out in the text: a long paragraph, a long sentence or a word of the lexicon. `text` is
+# `Article.text[start:end]`, `paragraph` and `sentence` are positions in the article and in the paragraph, `sentence`
+# being None for a paragraph.
+Finding = namedtuple('Finding', ['kind', 'start', 'end', 'text', 'paragraph', 'sentence'])
+LONG_PARAGRAPH = 'long_paragraph'
+LONG_SENTENCE = 'long_sentence'
+FINDINGS = (LONG_PARAGRAPH, LONG_SENTENCE) + CATEGORIES
+
+
+def _check_findings(kinds):
+    unknown = [kind for kind in kinds if kind not in FINDINGS]
+    if unknown:
+        raise ValueError('Unknown findings: %s. Known findings are: %s.' % (', '.join(unknown), ', '.join(FINDINGS)))
 
 
 class Sentence(object):
     """
     An abstraction that represents a sentence and gives various stats.
+
+    Its tokens are kept as vocabulary ids in `buffer`, an `array('I')` shared by the sentences of a paragraph, from
+    `start` to `end`. `tokens` and `words` are built from there when asked for.
+
+    `tokens` are the tokens of the sentence, when the tokenizer that found the sentence gave them already, with their
+    `token_spans`. Otherwise the sentence is tokenized by `tokenizer`, see `homer.tokenizers`.
+
+    The start and end of every token are kept in `spans`, two entries per token. They point into the text of
+    `paragraph`, the `Paragraph` the sentence belongs to, whose `spans` it shares, or into `sentence` when it has none.
+    A sentence of a paragraph does not keep its text either, it is sliced from the paragraph's when asked for.
+
+    Intensifiers, compulsive hedgers and vague words are those of the lexicon of `paragraph`, or of `lexicon` when it
+    has none, see `Word`.
     """
-    def __init__(self, sentence):
-        self.sentence = sentence
-        words = nltk.word_tokenize(sentence)
-        words = [word for word in words if word.isalpha() or word.isdigit()]
-        self._words = [get_word(word) for word in words]
+    __slots__ = ('_sentence', '_sentence_end', 'buffer', 'spans', 'paragraph', 'lexicon', 'start', 'end', '_length',
+                 '_total_and_words', '_readability_counts', '_lexicon_matches')
+
+    def __init__(self, sentence, buffer=None, tokens=None, tokenizer=None, token_spans=None, paragraph=None,
+                 lexicon=None):
+        self._sentence = sentence
+        self.buffer = array('I') if buffer is None else buffer
+        self.paragraph = paragraph
+        self.spans = array('I') if paragraph is None else paragraph.spans
+        self.lexicon = get_lexicon(lexicon) if paragraph is None else paragraph.lexicon
+        self.start = len(self.buffer)
+        if tokens is None:
+            tokens = get_tokenizer(tokenizer).words(sentence)
+        if token_spans is None:
+            token_spans = align_tokens(sentence, tokens)
+        elif paragraph is not None and token_spans and paragraph.paragraph.startswith(sentence, token_spans[0]):
+            # The sentence is where its first token is in the paragraph, see `sentence`.
+            self._sentence = None
+            self._sentence_end = token_spans[0] + len(sentence)
+        self.buffer.extend(VOCABULARY.intern(token) for token in tokens)
+        self.spans.extend(token_spans)
+        self.end = len(self.buffer)
+        count('tokens', self.end - self.start)
+        flags = VOCABULARY.flags
+        length = total_and_words = 0
+        for token_id in self.token_ids:
+            token_flags = flags[token_id]
+            if token_flags & IS_WORD:
+                length += 1
+                if token_flags & IS_AND:
+                    total_and_words += 1
+        self._length = length
+        self._total_and_words = total_and_words
+        self._readability_counts = None
+        self._lexicon_matches = None
+
+    @property
+    def sentence(self):
+        """The text of the sentence."""
+        if self._sentence is not None:
+            return self._sentence
+        return self._text_in(self.paragraph.paragraph)
+
+    def _text_in(self, paragraph_text):
+        if self._sentence is not None:
+            return self._sentence
+        return paragraph_text[self.spans[2 * self.start]:self._sentence_end]
+
+    @property
+    def token_ids(self):
+        return self.buffer[self.start:self.end]
+
+    @property
+    def word_ids(self):
+        """Vocabulary ids of the lowercased words of the sentence."""
+        flags = VOCABULARY.flags
+        normalized = VOCABULARY.normalized
+        return [normalized[token_id] for token_id in self.token_ids if flags[token_id] & IS_WORD]
+
+    @property
+    def tokens(self):
+        strings = VOCABULARY.strings
+        return [strings[token_id] for token_id in self.token_ids]
+
+    @property
+    def offset(self):
+        return 0 if self.paragraph is None else self.paragraph.offset
+
+    @property
+    def token_spans(self):
+        """`(start, end)` of every token in the text of the article, or in `sentence` when it is not part of one."""
+        offset = self.offset
+        spans = self.spans
+        return [(offset + spans[2 * i], offset + spans[2 * i + 1]) for i in range(self.start, self.end)]
+
+    @property
+    def span(self):
+        """`(start, end)` of the sentence, from its first token to its last, see `token_spans`."""
+        offset = self.offset
+        if self.end == self.start:
+            return offset, offset
+        return offset + self.spans[2 * self.start], offset + self.spans[2 * self.end - 1]
+
+    @property
+    def word_spans(self):
+        """`(start, end)` of every word of `words`, see `token_spans`."""
+        flags = VOCABULARY.flags
+        return [span for token_id, span in zip(self.token_ids, self.token_spans) if flags[token_id] & IS_WORD]
 
     @property
     def words(self):
-        return self._words
+        return words_of(self.word_ids, self.lexicon)
+
+    @property
+    def lexicon_matches(self):
+        """Intensifiers, compulsive hedgers and vague words of the sentence, keyed by category, as `(word, index)`
+        pairs where `index` is the position of the word in `words`. A phrase such as 'sort of' is found as one
+        `Word`."""
+        if self._lexicon_matches is None:
+            self._lexicon_matches = {category: [] for category in CATEGORIES}
+            word_ids = self.word_ids
+            lexicon = self.lexicon
+            for category, start, end in lexicon.find_ids(word_ids):
+                if end - start == 1:
+                    word = word_of(word_ids[start], lexicon)
+                else:
+                    word = get_word(' '.join(VOCABULARY.strings[word_id] for word_id in word_ids[start:end]), lexicon)
+                self._lexicon_matches[category].append((word, start))
+        return self._lexicon_matches
+
+    def _get_lexicon_words(self, category):
+        return (word for word, _ in self.lexicon_matches[category])
+
+    def lexicon_spans(self, category):
+        """The words of `category` in the sentence as `(word, start, end)`, see `token_spans`."""
+        matches = self.lexicon_matches[category]
+        if not matches:
+            return []
+        word_spans = self.word_spans
+        return [(word, word_spans[index][0], word_spans[index + len(word.word.split()) - 1][1])
+                for word, index in matches]
+
+    @property
+    def readability_counts(self):
+        if self._readability_counts is None:
+            self._readability_counts = ReadabilityCounts.from_words(self.words)
+        return self._readability_counts
 
     @property
     def total_and_words(self):
-        return len([word for word in self.words if word.is_and()])
+        return self._total_and_words
 
     def is_long(self):
         return len(self) > MAX_WORDS_IN_SENTENCE
 
     def get_compulsive_hedgers(self):
-        return (word for word in self.words if word.is_compulsive_hedger())
+        return self._get_lexicon_words(COMPULSIVE_HEDGER)
 
     def get_intensifiers(self):
-        return (word for word in self.words if word.is_intensifier())
+        return self._get_lexicon_words(INTENSIFIER)
 
     def get_vague_words(self):
-        return (word for word in self.words if word.is_vague_word())
+        return self._get_lexicon_words(VAGUE_WORD)
 
     def __len__(self):
-        return len(self.words)
+        return self._length
 
     def __lt__(self, other):
         return len(self) < len(other)
@@ -120,14 +340,61 @@ class Paragraph(object):
     """
     Represents a paragraph. Finds compulsive hedgers, intensifiers, vague words, readability scores of a paragraph and
     various other stats.
+
+    `tokenizer` splits it into sentences and words, the name of one of `homer.tokenizers.TOKENIZERS` or a
+    `Tokenizer`, NLTK's by default. `offset` is where the paragraph starts in the text of its article. `lexicon` has
+    the intensifiers, compulsive hedgers and vague words to look for, see `Word`.
+
+    `source` is where the text `paragraph` was decoded from, a `homer.mapped.MappedText` with the start and end of the
+    paragraph in it. The paragraph then lets its text go once it is tokenized, and decodes it again when asked for.
     """
 
-    def __init__(self, paragraph):
+    def __init__(self, paragraph, tokenizer=None, offset=0, lexicon=None, source=None):
         paragraph = paragraph.replace('—', ' ')
-        self.paragraph = paragraph
-        self.tokenized_sentences = nltk.sent_tokenize(paragraph)
-        self._sentences = [Sentence(sentence) for sentence in self.tokenized_sentences]
+        self._text = paragraph
+        self._source = source
+        self.offset = offset
+        self.lexicon = get_lexicon(lexicon)
+        self.buffer = array('I')
+        self.spans = array('I')
+        sentences = get_tokenizer(tokenizer).tokenize(paragraph)
+        self._sentences = [Sentence(sentence, self.buffer, tokens, token_spans=spans, paragraph=self)
+                           for sentence, tokens, spans in sentences]
+        count('sentences', len(self._sentences))
+        if source is not None:
+            self._text = None
+        self.invalidate()
 
+    @property
+    def paragraph(self):
+        """The text of the paragraph."""
+        if self._text is not None:
+            return self._text
+        mapped_text, start, end = self._source
+        return mapped_text.text(start, end).replace('—', ' ')
+
+    @property
+    def tokenized_sentences(self):
+        text = self.paragraph
+        return [sentence._text_in(text) for sentence in self._sentences]
+
+    def invalidate(self):
+        """Drops the cached totals. Call it after changing the sentences of the paragraph."""
+        self._totals = None
+        self._readability_counts = None
+
+    @property
+    def totals(self):
+        if self._totals is None:
+            words = and_words = 0
+            longest_sentence = None
+            for sentence in self.sentences:
+                words += len(sentence)
+                and_words += sentence.total_and_words
+                if longest_sentence is None or len(sentence) > len(longest_sentence):
+                    longest_sentence = sentence
+            self._totals = ParagraphTotals(words, and_words, longest_sentence)
+        return self._totals
 
     @property
     def sentences(self):
@@ -135,41 +402,83 @@ class Paragraph(object):
 
     @property
     def longest_sentence(self):
-        return max(self._sentences, key=lambda sentence: len(sentence))
+        return self.totals.longest_sentence
+
+    @property
+    def len_of_longest_sentence(self):
+        if self.longest_sentence is None:
+            return 0
+        return len(self.longest_sentence)
 
     @property
     def total_words(self):
-        return sum([len(sentence) for sentence in self.sentences])
+        return self.totals.words
 
     @property
     def total_and_words(self):
-        return sum([sentence.total_and_words for sentence in self.sentences if sentence.total_and_words])
+        return self.totals.and_words
 
     @property
     def avg_words_per_sentence(self):
         round_to_two_digits = 2
+        if not len(self):
+            return 0
         return round(self.total_words / len(self), round_to_two_digits)
 
     def is_long(self):
         return len(self) >= MAX_SENTENCES_IN_PARAGRAPH
 
+    @property
+    def readability_counts(self):
+        if self._readability_counts is None:
+            self._readability_counts = ReadabilityCounts.total(sentence.readability_counts
+                                                               for sentence in self.sentences)
+        return self._readability_counts
+
+    def get_readability_scores(self):
+        return self.readability_counts.scores()
+
     def get_flesch_reading_score(self):
-        return FleschReading(self.paragraph).grade()
+        return FleschReading(counts=self.readability_counts).grade()
 
     def get_dale_chall_reading_score(self):
-        return DaleChall(self.paragraph).grade()
+        return DaleChall(counts=self.readability_counts).grade()
 
     def get_intensifiers(self):
-        return list(itertools.chain(*[sentence.get_intensifiers() for sentence in self.sentences
-                                                   if sentence.get_intensifiers()]))
+        return list(itertools.chain.from_iterable(sentence.get_intensifiers() for sentence in self.sentences))
 
     def get_compulsive_hedgers(self):
-        return list(itertools.chain(*[sentence.get_compulsive_hedgers() for sentence in self.sentences
-                                                         if sentence.get_compulsive_hedgers()]))
+        return list(itertools.chain.from_iterable(sentence.get_compulsive_hedgers() for sentence in self.sentences))
 
     def get_vague_words(self):
-        return list(itertools.chain(*[sentence.get_vague_words() for sentence in self.sentences
-                                                  if sentence.get_vague_words()]))
+        return list(itertools.chain.from_iterable(sentence.get_vague_words() for sentence in self.sentences))
+
+    def total_lexicon_words(self, category):
+        """How many words of `category`, one of `homer.lexicon.CATEGORIES`, the paragraph has."""
+        return sum(len(sentence.lexicon_matches[category]) for sentence in self.sentences)
+
+    def find(self, kinds=FINDINGS, index=0):
+        """
+        `Finding`s of `kinds`, some of `FINDINGS`, in the order they appear in the paragraph. `index` is the position of
+        the paragraph in its article.
+        """
+        _check_findings(kinds)
+        findings = []
+        text = self.paragraph
+        if LONG_PARAGRAPH in kinds and self.is_long():
+            findings.append(Finding(LONG_PARAGRAPH, self.offset, self.offset + len(text), text, index, None))
+        categories = [category for category in CATEGORIES if category in kinds]
+        for sentence_index, sentence in enumerate(self.sentences):
+            if LONG_SENTENCE in kinds and sentence.is_long():
+                start, end = sentence.span
+                findings.append(Finding(LONG_SENTENCE, start, end, text[start - self.offset:end - self.offset],
+                                        index, sentence_index))
+            for category in categories:
+                for _, start, end in sentence.lexicon_spans(category):
+                    findings.append(Finding(category, start, end, text[start - self.offset:end - self.offset],
+                                            index, sentence_index))
+        findings.sort(key=operator.attrgetter('start'))
+        return findings
 
     def __len__(self):
         return len(self.sentences)
@@ -192,46 +501,261 @@ class Article(object):
     This represents a block of text, i.e. an essay, a blog or an article.
 
     Using this, we can retrieve article as well as paragraph-level stats.
+
+    The text is split into paragraphs right away, but the paragraphs are only analyzed the first time a stat needs
+    them. Stats such as `total_paragraphs` never tokenize a sentence.
+
+    Paragraphs, sentences and words know where they are in `text`, see `find`.
+
+    `tokenizer` splits the text and `lexicon` has the words to look for, see `Paragraph`. `from_file` reads the text of
+    a large file through a memory map instead.
     """
-    def __init__(self, name, author, text):
+    def __init__(self, name, author, text, tokenizer=None, lexicon=None):
         self.name = name
         self.author = author
+        self.tokenizer = get_tokenizer(tokenizer)
+        self.lexicon = get_lexicon(lexicon)
         # Replacing em dash and en dash
         self.text = text.replace('—', ' ')
-        paragraphs = nltk.tokenize.blankline_tokenize(text)
-        self._paragraphs = [Paragraph(paragraph) for paragraph in paragraphs]
+        with stage('split_paragraphs'):
+            self._paragraph_spans = self.tokenizer.paragraph_spans(self.text)
+        self._paragraphs = None
+        self.invalidate()
+
+    @classmethod
+    def from_paragraphs(cls, name, author, paragraphs, tokenizer=None, lexicon=None):
+        """An article made of `paragraphs`, `Paragraph` objects analyzed already by `tokenizer` with `lexicon`."""
+        article = cls.__new__(cls)
+        article.name = name
+        article.author = author
+        article.tokenizer = get_tokenizer(tokenizer)
+        article.lexicon = get_lexicon(lexicon)
+        article.text = '\n\n'.join(paragraph.paragraph for paragraph in paragraphs)
+        article._paragraph_spans = None
+        article._paragraphs = list(paragraphs)
+        offset = 0
+        for paragraph in article._paragraphs:
+            paragraph.offset = offset
+            offset += len(paragraph.paragraph) + 2
+        article.invalidate()
+        return article
+
+    @classmethod
+    def from_file(cls, name, author, path, tokenizer=None, lexicon=None):
+        """
+        The article of the UTF-8 text of the file at `path`, read through a memory map, see `homer.mapped`. Neither the
+        article nor its paragraphs and sentences keep a copy of the text, they decode what they are asked for.
+        """
+        article = cls.__new__(cls)
+        article.name = name
+        article.author = author
+        article.tokenizer = get_tokenizer(tokenizer)
+        article.lexicon = get_lexicon(lexicon)
+        article._text = None
+        article._source = MappedText(path)
+        with stage('split_paragraphs'):
+            article._paragraph_spans = article._source.paragraph_spans()
+        article._paragraphs = None
+        article.invalidate()
+        return article
+
+    @property
+    def text(self):
+        if self._text is None:
+            return self._source.text().replace('—', ' ')
+        return self._text
+
+    @text.setter
+    def text(self, text):
+        self._text = text
+        self._source = None
+
+    def update(self, text):
+        """
+        Re-analyzes the article after its text changed to `text`, e.g. in an editor. Paragraphs whose text did not
+        change are kept as they are, only new or edited paragraphs are tokenized, and the offsets of the kept ones
+        are moved to where they are now. The totals and readability counts computed so far are adjusted by what the
+        added and removed paragraphs contribute.
+
+        Returns the number of paragraphs that were analyzed.
+        """
+        if self._paragraphs is None:
+            # Nothing has been analyzed yet, and nothing needs to be now.
+            self.text = text.replace('—', ' ')
+            with stage('split_paragraphs'):
+                self._paragraph_spans = self.tokenizer.paragraph_spans(self.text)
+            self.invalidate()
+            return 0
+        with stage('update_article'):
+            unchanged = {}
+            for paragraph in self._paragraphs:
+                unchanged.setdefault(paragraph.paragraph, []).append(paragraph)
+            self.text = text.replace('—', ' ')
+            with stage('split_paragraphs'):
+                spans = self.tokenizer.paragraph_spans(self.text)
+            paragraphs = []
+            added = []
+            for start, end in spans:
+                kept = unchanged.get(self.text[start:end])
+                if kept:
+                    paragraph = kept.pop()
+                    paragraph.offset = start
+                else:
+                    paragraph = Paragraph(self.text[start:end], self.tokenizer, start, self.lexicon)
+                    added.append(paragraph)
+                paragraphs.append(paragraph)
+            removed = list(itertools.chain.from_iterable(unchanged.values()))
+            self._paragraphs = paragraphs
+            self._update_totals(added, removed)
+        count('paragraphs', len(added))
+        return len(added)
+
+    def _update_totals(self, added, removed):
+        """Adjusts what has been computed so far for `added` and `removed` paragraphs."""
+        if self._totals is not None:
+            totals = self._totals
+            sentences, words, and_words = totals.sentences, totals.words, totals.and_words
+            for paragraphs, sign in ((added, 1), (removed, -1)):
+                for paragraph in paragraphs:
+                    sentences += sign * len(paragraph)
+                    words += sign * paragraph.totals.words
+                    and_words += sign * paragraph.totals.and_words
+            if any(len(paragraph) == totals.len_of_longest_paragraph or
+                   paragraph.totals.longest_sentence is totals.longest_sentence for paragraph in removed):
+                # The longest paragraph or sentence is gone, look for the next one among all paragraphs.
+                candidates = self.paragraphs
+                len_of_longest_paragraph, longest_sentence = 0, None
+            else:
+                candidates = added
+                len_of_longest_paragraph, longest_sentence = totals.len_of_longest_paragraph, totals.longest_sentence
+            for paragraph in candidates:
+                len_of_longest_paragraph = max(len_of_longest_paragraph, len(paragraph))
+                if longest_sentence is None or paragraph.len_of_longest_sentence > len(longest_sentence):
+                    longest_sentence = paragraph.longest_sentence
+            self._totals = ArticleTotals(sentences, words, and_words, len_of_longest_paragraph, longest_sentence)
+        if self._readability_counts is not None:
+            readability_counts = self._readability_counts + ReadabilityCounts.total(
+                paragraph.readability_counts for paragraph in added)
+            for paragraph in removed:
+                readability_counts -= paragraph.readability_counts
+            self._readability_counts = readability_counts
+        if self._token_counts is not None:
+            strings = VOCABULARY.strings
+            for paragraph in added:
+                self._token_counts.update(strings[token_id] for token_id in paragraph.buffer)
+            for paragraph in removed:
+                tokens = [strings[token_id] for token_id in paragraph.buffer]
+                self._token_counts.subtract(tokens)
+                for token in set(tokens):
+                    if self._token_counts[token] <= 0:
+                        del self._token_counts[token]
+        # Positions in the lexicon report refer to paragraph numbers, which may have moved. It is rebuilt from the
+        # matches the sentences keep, without tokenizing again.
+        self._lexicon_report = None
+        self._flesch_reading = None
+        self._dale_chall = None
+
+    def invalidate(self):
+        """Drops the cached totals, counts and scores. Call it after changing the paragraphs of the article."""
+        self._totals = None
+        self._token_counts = None
+        self._lexicon_report = None
+        self._readability_counts = None
+        self._flesch_reading = None
+        self._dale_chall = None
+
+    @property
+    def totals(self):
+        if self._totals is None:
+            sentences = words = and_words = len_of_longest_paragraph = 0
+            longest_sentence = None
+            for paragraph in self.paragraphs:
+                paragraph_totals = paragraph.totals
+                sentences += len(paragraph)
+                words += paragraph_totals.words
+                and_words += paragraph_totals.and_words
+                len_of_longest_paragraph = max(len_of_longest_paragraph, len(paragraph))
+                if longest_sentence is None or paragraph.len_of_longest_sentence > len(longest_sentence):
+                    longest_sentence = paragraph_totals.longest_sentence
+            self._totals = ArticleTotals(sentences, words, and_words, len_of_longest_paragraph, longest_sentence)
+        return self._totals
 
     @property
     def paragraphs(self):
+        if self._paragraphs is None:
+            with stage('build_article'):
+                if self._source is not None:
+                    self._paragraphs = self._mapped_paragraphs()
+                else:
+                    self._paragraphs = [Paragraph(self.text[start:end], self.tokenizer, start, self.lexicon)
+                                        for start, end in self._paragraph_spans]
+            self._paragraph_spans = None
+            count('paragraphs', len(self._paragraphs))
         return self._paragraphs
 
+    def _mapped_paragraphs(self):
+        # Spans are in bytes, offsets in characters: the text up to every paragraph is decoded to count them.
+        source = self._source
+        paragraphs = []
+        offset = previous_end = 0
+        for start, end in self._paragraph_spans:
+            offset += len(source.text(previous_end, start))
+            text = source.text(start, end)
+            paragraphs.append(Paragraph(text, self.tokenizer, offset, self.lexicon, (source, start, end)))
+            offset += len(text)
+            previous_end = end
+        return paragraphs
+
+    @property
+    def tokens(self):
+        """All tokens of the article, in order, as produced while building its sentences."""
+        return itertools.chain.from_iterable(sentence.tokens for paragraph in self.paragraphs
+                                             for sentence in paragraph.sentences)
+
+    @property
+    def token_counts(self):
+        """Frequency of every token in the article. Built once from the token buffers of the paragraphs, so the
+        text is never tokenized again."""
+        if self._token_counts is None:
+            with stage('token_counts'):
+                id_counts = Counter()
+                for paragraph in self.paragraphs:
+                    id_counts.update(paragraph.buffer)
+                strings = VOCABULARY.strings
+                self._token_counts = Counter({strings[token_id]: freq for token_id, freq in id_counts.items()})
+        return self._token_counts
+
     @property
     def len_of_longest_paragraph(self):
-        return len(max(self._paragraphs, key=lambda paragraph: len(paragraph)))
+        return self.totals.len_of_longest_paragraph
 
     @property
     def longest_sentence(self):
-        return max([paragraph.longest_sentence for paragraph in self._paragraphs], key=lambda sentence: len(sentence))
+        return self.totals.longest_sentence
 
     @property
     def len_of_longest_sentence(self):
+        if self.longest_sentence is None:
+            return 0
         return len(self.longest_sentence)
 
     @property
     def total_sentences(self):
-        return sum([len(paragraph) for paragraph in self.paragraphs])
+        return self.totals.sentences
 
     @property
     def total_paragraphs(self):
-        return len(self.paragraphs)
+        if self._paragraphs is None:
+            return len(self._paragraph_spans)
+        return len(self._paragraphs)
 
     @property
     def total_words(self):
-        return sum([paragraph.total_words for paragraph in self.paragraphs])
+        return self.totals.words
 
     @property
     def total_and_words(self):
-        return sum([paragraph.total_and_words for paragraph in self.paragraphs])
+        return self.totals.and_words
 
     @property
     def reading_time(self):
@@ -240,58 +764,105 @@ class Article(object):
     @property
     def avg_sentences_per_para(self):
         round_to_two_digits = 2
+        if not self.total_paragraphs:
+            return 0
         return round(self.total_sentences / self.total_paragraphs, round_to_two_digits)
 
     @property
     def avg_words_per_sentence(self):
         round_to_two_digits = 2
+        if not self.total_sentences:
+            return 0
         return round(self.total_words / self.total_sentences, round_to_two_digits)
 
     def get_paragraphs(self):
         return self.paragraphs
 
+    @property
+    def readability_counts(self):
+        """Readability counts of the article, added up from its paragraphs."""
+        if self._readability_counts is None:
+            with stage('readability_counts'):
+                self._readability_counts = ReadabilityCounts.total(paragraph.readability_counts
+                                                                   for paragraph in self.paragraphs)
+        return self._readability_counts
+
+    def get_readability_scores(self):
+        """Flesch reading ease, Flesch-Kincaid grade, Gunning fog, SMOG, Coleman-Liau, ARI and Dale-Chall scores."""
+        return self.readability_counts.scores()
+
+    @property
+    def flesch_reading(self):
+        if self._flesch_reading is None:
+            self._flesch_reading = FleschReading(counts=self.readability_counts)
+        return self._flesch_reading
+
+    @property
+    def dale_chall(self):
+        if self._dale_chall is None:
+            self._dale_chall = DaleChall(counts=self.readability_counts)
+        return self._dale_chall
+
     def get_flesch_reading_score(self):
-        return FleschReading(self.text).grade()
+        return self.flesch_reading.grade()
 
     def get_dale_chall_reading_score(self):
-        return DaleChall(self.text).grade()
+        return self.dale_chall.grade()
 
     def is_difficult_to_read(self):
-        return FleschReading(self.text).is_difficult()
+        return self.flesch_reading.is_difficult()
+
+    def get_lexicon_report(self):
+        """Counts and positions of the intensifiers, compulsive hedgers and vague words of the article, found in one
+        pass over its sentences. See `homer.lexicon.LexiconReport`."""
+        if self._lexicon_report is None:
+            with stage('lexicon_report'):
+                report = LexiconReport()
+                for paragraph_index, paragraph in enumerate(self.paragraphs):
+                    for sentence_index, sentence in enumerate(paragraph.sentences):
+                        for category, matches in sentence.lexicon_matches.items():
+                            for word, index in matches:
+                                report.add(category, word, paragraph_index, sentence_index, index)
+            self._lexicon_report = report
+        return self._lexicon_report
+
+    def find(self, kinds=FINDINGS):
+        """
+        `Finding`s of `kinds`, some of `FINDINGS`, in the order they appear in `text`, e.g. every long sentence and
+        vague word to highlight in an editor: `article.find([LONG_SENTENCE, VAGUE_WORD])`. The spans come from the
+        tokenizer, the text is not searched again.
+        """
+        _check_findings(kinds)
+        return list(itertools.chain.from_iterable(paragraph.find(kinds, index)
+                                                  for index, paragraph in enumerate(self.paragraphs)))
 
     def get_intensifiers(self):
-        return list(itertools.chain(*(paragraph.get_intensifiers() for paragraph in self.paragraphs
-                                                   if paragraph.get_intensifiers())))
+        return self.get_lexicon_report().words(INTENSIFIER)
 
     def get_vague_words(self):
-        return list(itertools.chain(*(paragraph.get_vague_words() for paragraph in self.paragraphs
-                                                  if paragraph.get_vague_words())))
+        return self.get_lexicon_report().words(VAGUE_WORD)
 
     def get_compulsive_hedgers(self):
-        return list(itertools.chain(*(paragraph.get_compulsive_hedgers() for paragraph in self.paragraphs
-                                                         if paragraph.get_compulsive_hedgers())))
+        return self.get_lexicon_report().words(COMPULSIVE_HEDGER)
 
     def get_and_frequency(self):
         round_to_two_digits = 2
+        if not self.total_words:
+            return "0 %"
         return str(round(self.total_and_words / self.total_words * 100, round_to_two_digits)) + " %"
 
     def ten_words_with_most_syllables(self):
         """This gets us 10 words with most syllables in a text"""
-        d = cmudict.dict()
-        words = nltk.word_tokenize(self.text)
-        syllable_data = {}
-        for word in words:
-            word = word.strip().lower()
-            if word not in syllable_data:
-                try:
-                    syllable_data[word] = [len(list(y for y in x if y[-1].isdigit())) for x in d[word]][0]
-                except KeyError:
-                    pass  # Perhaps this word is not in the cmudict
-        return [item[0] for item in list(reversed(sorted(syllable_data.items(), key=operator.itemgetter(1))))[:10]]
-
-    def get_n_most_repeated_words(self, n):
-        """Gets us n most repeated words in the text. """
-        words = nltk.word_tokenize(self.text)
-        stopwords = nltk.corpus.stopwords.words('english')
-        all_words_except_stop = nltk.FreqDist(w.lower() for w in words if w[0].isalpha() and w not in stopwords)
-        return [word for word, freq in all_words_except_stop.most_common(n)]
+        return self.words_with_most_syllables(10)
+
+    def words_with_most_syllables(self, n, exclude=()):
+        """The `n` words with most syllables, except those in `exclude`. See `homer.ranking`."""
+        token_counts = self.token_counts
+        with stage('count_syllables'):
+            return ranking.words_with_most_syllables(token_counts, n, exclude=exclude)
+
+    def get_n_most_repeated_words(self, n, exclude=()):
+        """Gets us n most repeated words in the text, except stopwords and those in `exclude`. See `homer.ranking`."""
+        token_counts = self.token_counts
+        with stage('most_repeated_words'):
+            return ranking.most_repeated_words(token_counts, n, exclude=exclude)
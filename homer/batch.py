@@ -0,0 +1,111 @@
+"""
+Analyzes many files at once across a pool of worker processes.
+
+Every worker loads the NLTK models and word lists the metrics asked for need once, when it starts (see
+`needed_resources` and `homer.resources.warmup`), and then analyzes one file after another. Instead of the `Article`
+itself, which holds every paragraph, sentence and word, a worker sends back a small summary of plain Python values.
+
+> for path, summary in analyze_files(['posts/', 'drafts/*.md']):
+>     print(path, summary['reading_time'])
+"""
+import os
+import glob
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from homer import resources
+from homer.analyzer import Article
+from homer.metrics import SUMMARY, SENTENCES, STOPWORDS, SYLLABLES, needs
+from homer.serializers import article_record
+from homer.tokenizers import get_tokenizer
+
+# Extensions of the files picked up when a directory is given.
+TEXT_FILE_EXTENSIONS = ('.txt', '.md', '.rst')
+
+
+def expand_paths(paths):
+    """Expands directories and glob patterns in `paths` into a sorted list of files."""
+    files = set()
+    for path in paths:
+        if os.path.isdir(path):
+            for directory, _, file_names in os.walk(path):
+                files.update(os.path.join(directory, file_name) for file_name in file_names
+                             if file_name.endswith(TEXT_FILE_EXTENSIONS))
+        elif os.path.isfile(path):
+            files.add(path)
+        else:
+            files.update(match for match in glob.glob(path, recursive=True) if os.path.isfile(match))
+    return sorted(files)
+
+
+def needed_resources(metrics=None, tokenizer=None):
+    """
+    The `homer.resources` an analysis loads to compute `metrics`, as in `summarize`, with `tokenizer`. Only the `nltk`
+    tokenizer loads NLTK.
+    """
+    analysis_needs = needs(SUMMARY if metrics is None else metrics)
+    needed = []
+    if SENTENCES in analysis_needs and get_tokenizer(tokenizer).name == 'nltk':
+        needed.append(resources.NLTK)
+    if STOPWORDS in analysis_needs:
+        needed.append(resources.STOPWORDS)
+    if SYLLABLES in analysis_needs:
+        needed.append(resources.CMUDICT)
+    return needed
+
+
+def _warmup(names):
+    # Resources hold locks, which cannot be sent to another process, so workers are given their names.
+    resources.warmup([resource for resource in resources.RESOURCES if resource.name in names])
+
+
+def summarize(article, metrics=None):
+    """
+    Article stats as a dict of plain values, cheap to pickle and to turn into JSON. Only the `metrics` asked for are
+    computed, see `homer.metrics`, by default those in `homer.metrics.SUMMARY`.
+    """
+    return article_record(article, metrics)
+
+
+def analyze_file(path, author=None, cache_path=None, metrics=None, tokenizer=None, lexicon=None):
+    """
+    Summary of the file at `path`, with `metrics` as in `summarize`, tokenized by the tokenizer named `tokenizer` and
+    with the words of `lexicon`, see `homer.lexicon.get_lexicon`. A file that cannot be read gets a summary with just
+    its name and an error. With a `cache_path`, summaries are looked up in and added to the
+    `homer.cache.AnalysisCache` there.
+    """
+    name = os.path.basename(path)
+    try:
+        if cache_path is None:
+            # Memory-mapped, see `Article.from_file`, decoding errors come up as the paragraphs are analyzed.
+            article = Article.from_file(name, author, path, tokenizer, lexicon)
+            if not article.total_sentences:
+                return {'name': name, 'author': author, 'error': 'The file is empty.'}
+            return summarize(article, metrics)
+        with open(path, mode='r', encoding='utf-8') as f:
+            text = f.read()
+    except (OSError, UnicodeDecodeError) as e:
+        return {'name': name, 'author': author, 'error': str(e)}
+    if not text.strip():
+        return {'name': name, 'author': author, 'error': 'The file is empty.'}
+    from homer.cache import AnalysisCache
+    with AnalysisCache(cache_path, lexicon=lexicon, tokenizer=tokenizer) as cache:
+        return cache.summary(name, author, text, metrics)
+
+
+def analyze_files(paths, author=None, workers=None, cache_path=None, metrics=None, tokenizer=None, lexicon=None):
+    """
+    Analyzes the files, directories and glob patterns in `paths` in `workers` processes (by default one per CPU),
+    using the cache at `cache_path` if given. Summaries have the `metrics` asked for, see `summarize`. `tokenizer` is
+    the name of one of `homer.tokenizers.TOKENIZERS`, and `lexicon` the path of a lexicon pack or a `Lexicon`, which
+    every process compiles once.
+
+    Yields `(path, summary)` pairs in the order the files finish.
+    """
+    files = expand_paths(paths)
+    if not files:
+        return
+    names = [resource.name for resource in needed_resources(metrics, tokenizer)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_warmup, initargs=(names,)) as executor:
+        futures = {executor.submit(analyze_file, path, author, cache_path, metrics, tokenizer, lexicon): path
+                   for path in files}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
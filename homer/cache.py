@@ -0,0 +1,267 @@
+"""
+An on-disk cache of analyses, so that a text which has not changed is not tokenized and scored again.
+
+> cache = AnalysisCache()
+> article = cache.article('Moby Dick', 'Herman Melville', text)
+> ArticlePrinter(article).print_article_stats()
+
+Entries are keyed by a hash of the text, the Homer version and the lexicon, so changing either makes old entries miss
+instead of serving stale stats. An entry holds the article and paragraph stats `ArticlePrinter` shows, compressed, in
+a SQLite database. When the entries grow past `max_bytes`, the least recently used are evicted.
+
+`AnalysisCache.article` computes every stat of a text it misses, since it hands out all of them. `AnalysisCache.summary`
+only computes the metrics asked for, see `homer.metrics`, and keeps their values in an entry of just these metrics,
+to which later summaries asking for others add theirs.
+
+A hit gives a `CachedArticle` rather than an `Article`. It has the stats but not the sentences and words they were
+computed from.
+"""
+import os
+import json
+import time
+import zlib
+import sqlite3
+import hashlib
+from homer import __version__
+from homer.analyzer import Article, Paragraph, get_word
+from homer.batch import summarize
+from homer.lexicon import DEFAULT_LEXICON, CATEGORIES, LexiconReport, get_lexicon
+from homer.metrics import SUMMARY
+from homer.tokenizers import get_tokenizer
+from homer.readability import ReadabilityCounts
+
+DEFAULT_PATH = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+                            'homer', 'analyses.sqlite')
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# How many of the most repeated words an entry keeps.
+MOST_REPEATED_WORDS = 100
+
+# Bump when the layout of an entry, or how its stats are computed, changes.
+_FORMAT = 3
+
+
+def _counts_to_list(counts):
+    return [getattr(counts, field) for field in ReadabilityCounts.__slots__]
+
+
+def record_of(article):
+    """The stats of `article` kept in a cache entry, as a dict of plain values."""
+    summary = summarize(article)
+    del summary['name'], summary['author']
+    report = article.get_lexicon_report()
+    return {
+        'summary': summary,
+        'readability_counts': _counts_to_list(article.readability_counts),
+        'lexicon': {category: [[str(word), paragraph, sentence, index]
+                               for word, paragraph, sentence, index in report.positions[category]]
+                    for category in CATEGORIES},
+        'ten_words_with_most_syllables': article.ten_words_with_most_syllables(),
+        'most_repeated_words': article.get_n_most_repeated_words(MOST_REPEATED_WORDS),
+        'paragraphs': [{
+            'sentences': len(paragraph),
+            'total_words': paragraph.total_words,
+            'total_and_words': paragraph.total_and_words,
+            'longest_sentence': str(paragraph.longest_sentence),
+            'len_of_longest_sentence': paragraph.len_of_longest_sentence,
+            'readability_counts': _counts_to_list(paragraph.readability_counts),
+            'lexicon': {category: paragraph.total_lexicon_words(category) for category in CATEGORIES},
+        } for paragraph in article.paragraphs],
+    }
+
+
+class CachedParagraph(object):
+    """
+    The stats of a paragraph read back from the cache. `longest_sentence` is a string, and the intensifiers,
+    compulsive hedgers and vague words are only counted, see `total_lexicon_words`.
+    """
+
+    def __init__(self, record):
+        self._sentences = record['sentences']
+        self.total_words = record['total_words']
+        self.total_and_words = record['total_and_words']
+        self.longest_sentence = record['longest_sentence']
+        self.len_of_longest_sentence = record['len_of_longest_sentence']
+        self.readability_counts = ReadabilityCounts(*record['readability_counts'])
+        self._lexicon = record['lexicon']
+
+    def total_lexicon_words(self, category):
+        return self._lexicon[category]
+
+    avg_words_per_sentence = Paragraph.avg_words_per_sentence
+    is_long = Paragraph.is_long
+    get_readability_scores = Paragraph.get_readability_scores
+    get_flesch_reading_score = Paragraph.get_flesch_reading_score
+    get_dale_chall_reading_score = Paragraph.get_dale_chall_reading_score
+
+    def __len__(self):
+        return self._sentences
+
+
+class CachedArticle(object):
+    """
+    The stats of an article read back from the cache, with the same methods and properties as `Article` for them.
+    `longest_sentence` is a string, and the rankings are those of the words the cache has, at most ten words with the
+    most syllables and `MOST_REPEATED_WORDS` most repeated words. The words found are those of `lexicon`, the
+    `homer.lexicon.Lexicon` the article was analyzed with.
+    """
+
+    def __init__(self, name, author, record, lexicon=DEFAULT_LEXICON):
+        self.name = name
+        self.author = author
+        self.lexicon = lexicon
+        summary = record['summary']
+        self.total_sentences = summary['total_sentences']
+        self.total_words = summary['total_words']
+        self.total_and_words = summary['total_and_words']
+        self.len_of_longest_paragraph = summary['len_of_longest_paragraph']
+        self.longest_sentence = summary['longest_sentence']
+        self.len_of_longest_sentence = summary['len_of_longest_sentence']
+        self.readability_counts = ReadabilityCounts(*record['readability_counts'])
+        self.paragraphs = [CachedParagraph(paragraph) for paragraph in record['paragraphs']]
+        self._lexicon = record['lexicon']
+        self._lexicon_report = None
+        self._ten_words_with_most_syllables = record['ten_words_with_most_syllables']
+        self._most_repeated_words = record['most_repeated_words']
+        self._flesch_reading = None
+        self._dale_chall = None
+
+    @property
+    def total_paragraphs(self):
+        return len(self.paragraphs)
+
+    reading_time = Article.reading_time
+    avg_sentences_per_para = Article.avg_sentences_per_para
+    avg_words_per_sentence = Article.avg_words_per_sentence
+    get_paragraphs = Article.get_paragraphs
+    get_readability_scores = Article.get_readability_scores
+    flesch_reading = Article.flesch_reading
+    dale_chall = Article.dale_chall
+    get_flesch_reading_score = Article.get_flesch_reading_score
+    get_dale_chall_reading_score = Article.get_dale_chall_reading_score
+    is_difficult_to_read = Article.is_difficult_to_read
+    get_intensifiers = Article.get_intensifiers
+    get_vague_words = Article.get_vague_words
+    get_compulsive_hedgers = Article.get_compulsive_hedgers
+    get_and_frequency = Article.get_and_frequency
+
+    def get_lexicon_report(self):
+        if self._lexicon_report is None:
+            report = LexiconReport()
+            for category in CATEGORIES:
+                for word, paragraph, sentence, index in self._lexicon[category]:
+                    report.add(category, get_word(word, self.lexicon), paragraph, sentence, index)
+            self._lexicon_report = report
+        return self._lexicon_report
+
+    def ten_words_with_most_syllables(self):
+        return list(self._ten_words_with_most_syllables)
+
+    def words_with_most_syllables(self, n, exclude=()):
+        return _ranked(self._ten_words_with_most_syllables, n, exclude)
+
+    def get_n_most_repeated_words(self, n, exclude=()):
+        return _ranked(self._most_repeated_words, n, exclude)
+
+
+def _ranked(words, n, exclude):
+    excluded = frozenset(word.strip().lower() for word in exclude)
+    return [word for word in words if word not in excluded][:n]
+
+
+class AnalysisCache(object):
+    """
+    Analyses stored in the SQLite database at `path`, created if needed, holding at most about `max_bytes` of
+    entries. Texts are analyzed with `lexicon`, a `homer.lexicon.Lexicon` or the path of a lexicon pack.
+    """
+
+    def __init__(self, path=DEFAULT_PATH, max_bytes=DEFAULT_MAX_BYTES, lexicon=DEFAULT_LEXICON, tokenizer=None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.lexicon = get_lexicon(lexicon)
+        self.tokenizer = get_tokenizer(tokenizer)
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path, timeout=30)
+        with self._connection:
+            self._connection.execute('CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, record BLOB NOT NULL, '
+                                     'size INTEGER NOT NULL, last_used REAL NOT NULL)')
+            self._connection.execute('CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used)')
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def key(self, text):
+        digest = hashlib.sha256()
+        for part in (str(_FORMAT), __version__, self.lexicon.fingerprint, self.tokenizer.name):
+            digest.update(part.encode('utf-8') + b'\0')
+        digest.update(text.encode('utf-8'))
+        return digest.hexdigest()
+
+    def get_record(self, text):
+        """The entry for `text`, as given by `record_of`, or None."""
+        key = self.key(text)
+        with self._connection:
+            row = self._connection.execute('SELECT record FROM entries WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            self._connection.execute('UPDATE entries SET last_used = ? WHERE key = ?', (time.time(), key))
+        return json.loads(zlib.decompress(row[0]).decode('utf-8'))
+
+    def put_record(self, text, record):
+        blob = zlib.compress(json.dumps(record, separators=(',', ':')).encode('utf-8'))
+        with self._connection:
+            self._connection.execute('INSERT OR REPLACE INTO entries (key, record, size, last_used) '
+                                     'VALUES (?, ?, ?, ?)', (self.key(text), blob, len(blob), time.time()))
+            self._evict()
+
+    @property
+    def size(self):
+        """Bytes taken by the entries."""
+        return self._connection.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+
+    def _evict(self):
+        if self.size <= self.max_bytes:
+            return
+        rows = self._connection.execute('SELECT key, size FROM entries ORDER BY last_used DESC').fetchall()
+        kept = 0
+        for key, entry_size in rows:
+            kept += entry_size
+            if kept > self.max_bytes:
+                self._connection.execute('DELETE FROM entries WHERE key = ?', (key,))
+
+    def __len__(self):
+        return self._connection.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+
+    def article(self, name, author, text):
+        """A `CachedArticle` for `text` if it is cached. Otherwise analyzes it, caches it and returns the `Article`."""
+        record = self.get_record(text)
+        # An entry of just some metrics, see `summary`, does not have what a `CachedArticle` needs.
+        if record is not None and 'paragraphs' in record:
+            return CachedArticle(name, author, record, self.lexicon)
+        article = Article(name, author, text, self.tokenizer, self.lexicon)
+        self.put_record(text, record_of(article))
+        return article
+
+    def summary(self, name, author, text, metrics=None):
+        """
+        Same as `homer.batch.summarize(Article(name, author, text), metrics)`, from the cache when possible. Only the
+        metrics the entry does not have yet are computed.
+        """
+        record = self.get_record(text)
+        if record is not None and 'paragraphs' in record:
+            return summarize(CachedArticle(name, author, record, self.lexicon), metrics)
+        names = list(SUMMARY if metrics is None else metrics)
+        values = record['metrics'] if record is not None else {}
+        missing = [metric for metric in names if metric not in values and metric not in ('name', 'author')]
+        if missing:
+            values.update(summarize(Article(name, author, text, self.tokenizer, self.lexicon), missing))
+            self.put_record(text, {'metrics': values})
+        values.update(name=name, author=author)
+        return {metric: values[metric] for metric in names}
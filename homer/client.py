@@ -0,0 +1,133 @@
+"""
+A client of a running `homer.server`, which keeps NLTK and the stats of recent texts loaded, so that a short text is
+analyzed in milliseconds rather than in the seconds a new process takes to load everything.
+
+> client = find_server()
+> if client is not None:
+>     response = client.analyze(text, metrics=['reading_time', 'flesch'])
+
+This module only imports the standard library, so that using a server costs a command nothing of Homer's startup.
+"""
+import os
+import json
+import socket
+import http.client
+
+# Where `homer_cmd --serve` listens unless told otherwise, and where commands look for a server.
+DEFAULT_SOCKET = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+                              'homer', 'homer.sock')
+# Environment variable with the address of a server, see `Client`.
+SERVER_VARIABLE = 'HOMER_SERVER'
+DEFAULT_TIMEOUT = 60
+# The `lexicon` of a request that wants Homer's own words rather than the lexicon pack the server was started with.
+BUILTIN_LEXICON = 'default'
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+
+    def __init__(self, path, timeout):
+        super().__init__('localhost', timeout=timeout)
+        self.socket_path = path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+class Client(object):
+    """
+    Talks to the server at `address`: the path of a Unix socket, as `unix:/path` or a plain path, or a `host:port`,
+    with or without `http://`. Requests that cannot reach the server raise `OSError`, requests the server rejects
+    `ValueError`, and analyses that fail on the server `RuntimeError`.
+    """
+
+    def __init__(self, address=DEFAULT_SOCKET, timeout=DEFAULT_TIMEOUT):
+        self.address = address
+        self.timeout = timeout
+        if address.startswith('http://'):
+            address = address[len('http://'):].rstrip('/')
+        if address.startswith('unix:'):
+            self.socket_path, self.host, self.port = address[len('unix:'):], None, None
+        elif os.sep in address or ':' not in address:
+            self.socket_path, self.host, self.port = address, None, None
+        else:
+            host, _, port = address.rpartition(':')
+            self.socket_path, self.host, self.port = None, host or '127.0.0.1', int(port)
+
+    def _connection(self):
+        if self.socket_path is not None:
+            return _UnixHTTPConnection(self.socket_path, self.timeout)
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def request(self, method, path, body=None):
+        """The JSON the server answers `method path` with, sending `body` as JSON if given."""
+        connection = self._connection()
+        try:
+            headers = {}
+            data = None
+            if body is not None:
+                data = json.dumps(body).encode('utf-8')
+                headers['Content-Type'] = 'application/json'
+            connection.request(method, path, data, headers)
+            response = connection.getresponse()
+            document = json.loads(response.read().decode('utf-8') or 'null')
+        finally:
+            connection.close()
+        if response.status >= 500:
+            raise RuntimeError('%s: %s' % (response.status, (document or {}).get('error', response.reason)))
+        if response.status >= 400:
+            raise ValueError((document or {}).get('error', response.reason))
+        return document
+
+    def health(self):
+        return self.request('GET', '/health')
+
+    def metrics(self):
+        return self.request('GET', '/metrics')
+
+    def analyze(self, text, name='', author='', metrics=None, tokenizer=None, paragraphs=True, findings=None,
+                document=None, lexicon=None):
+        """
+        The stats of `text`: `{"paragraphs": [...], "article": {...}}` as `--format json` writes them, with the
+        paragraph and article fields among `metrics`, all when None. Paragraphs are left out unless `paragraphs`.
+        `findings`, some of `homer.analyzer.FINDINGS` or True for all, adds the `Finding`s of those kinds as dicts.
+        Successive texts sent with the same `document` id are analyzed incrementally, only their changed paragraphs
+        again. `lexicon` is the path of a lexicon pack on the server's machine, the one it was started with or one under
+        its lexicon directory, or `BUILTIN_LEXICON` for Homer's own words. When None, the server uses its own pack.
+        """
+        body = {'text': text, 'name': name, 'author': author, 'paragraphs': paragraphs}
+        for key, value in (('metrics', metrics), ('tokenizer', tokenizer), ('findings', findings),
+                           ('document', document), ('lexicon', lexicon)):
+            if value is not None:
+                body[key] = value
+        return self.request('POST', '/analyze', body)
+
+    def compare(self, old, new, name='', author='', tokenizer=None, lexicon=None):
+        """The `homer.compare.Comparison` of two revisions of a text, as a dict."""
+        body = {'old': old, 'new': new, 'name': name, 'author': author}
+        for key, value in (('tokenizer', tokenizer), ('lexicon', lexicon)):
+            if value is not None:
+                body[key] = value
+        return self.request('POST', '/compare', body)
+
+    def __repr__(self):
+        return 'Client(%r)' % self.address
+
+
+def find_server(address=None, timeout=DEFAULT_TIMEOUT):
+    """
+    A `Client` of the server at `address`, of `$HOMER_SERVER` when None, or of the default socket if it exists.
+    None when no server was asked for and none listens on the default socket. The server is not contacted.
+    """
+    address = address or os.environ.get(SERVER_VARIABLE)
+    if not address:
+        if not os.path.exists(DEFAULT_SOCKET):
+            return None
+        address = DEFAULT_SOCKET
+    return Client(address, timeout)
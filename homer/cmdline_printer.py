@@ -1,5 +1,40 @@
+from collections import Counter
 from colorclass import Color
 from terminaltables import SingleTable
+from homer.lexicon import COMPULSIVE_HEDGER, INTENSIFIER, VAGUE_WORD
+from homer.profiling import stage
+
+
+def paragraph_rows(number, para):
+    """Table rows showing the stats of paragraph `para`, numbered `number`."""
+    sentence_tag = Color('{blue}sentences{/blue}')
+    word_tag = Color('{blue}words{/blue}')
+    avg_word_tag = Color('{blue}Avg words per sentence{/blue}')
+    long_tag = Color('{red}longest{/red}')
+    sentences = Color('{red}%s{/red}' % str(len(para))) if len(para) > 5 else str(len(para))
+    avg_words_per_sentence = Color(
+        '{red}%s{/red}' % str(para.avg_words_per_sentence)) if para.avg_words_per_sentence > 25 else str(
+        para.avg_words_per_sentence)
+    return [
+        [number, '{sentences} {sent_tag}. {words} {word_tag}. {avg_words} {avg_word_tag}. '
+                 '"{longest_sent}..." is the {long_tag} sentence.'.format(
+                     sentences=sentences, sent_tag=sentence_tag, words=para.total_words,
+                     word_tag=word_tag, avg_words=avg_words_per_sentence, avg_word_tag=avg_word_tag,
+                     longest_sent=str(para.longest_sentence)[0:10], long_tag=long_tag
+                 )],
+        ["", "Flesh Reading score={flesch_reading}, Dale Chall Readability= {dale_chall}".format(
+            flesch_reading=para.get_flesch_reading_score(), dale_chall=para.get_dale_chall_reading_score()
+        )]
+    ]
+
+
+def print_paragraph(number, para):
+    """Prints the stats of a single paragraph, e.g. one handed out by `homer.streaming.ArticleStream`."""
+    table_instance = SingleTable(paragraph_rows(number, para))
+    table_instance.inner_row_border = True
+    table_instance.justify_columns = {0: 'center', 1: 'left'}
+    with stage('render_tables'):
+        print(table_instance.table)
 
 
 class ArticlePrinter(object):
@@ -10,6 +45,11 @@ class ArticlePrinter(object):
 
     def print_article_stats(self):
         """This method is called to present overall article stats on a command line."""
+        with stage('print_article_stats'):
+            self._print_article_stats()
+
+    def _print_article_stats(self):
+        lexicon_report = self.article.get_lexicon_report()
         table_data = [
             [Color('{autocyan}Overall Stats{/autocyan}')],
             ['Reading time', str(self.article.reading_time) + ' mins'],
@@ -24,15 +64,16 @@ class ArticlePrinter(object):
             ['Words in longest sentence', self.article.len_of_longest_sentence],
             ['Words', self.article.total_words],
             ['"and" frequency"', self.article.get_and_frequency()],
-            ['Compulsive Hedgers', len(self.article.get_compulsive_hedgers())],
-            ['Intensifiers', len(self.article.get_intensifiers())],
-            ['Vague words', len(self.article.get_vague_words())],
+            ['Compulsive Hedgers', lexicon_report.total(COMPULSIVE_HEDGER)],
+            ['Intensifiers', lexicon_report.total(INTENSIFIER)],
+            ['Vague words', lexicon_report.total(VAGUE_WORD)],
         ]
         table_instance = SingleTable(table_data)
         table_instance.inner_heading_row_border = True
         table_instance.inner_row_border = True
         table_instance.justify_columns = {0: 'left', 1: 'center'}
-        print(table_instance.table)
+        with stage('render_tables'):
+            print(table_instance.table)
         self.print_detail()
 
     def print_paragraph_stats(self):
@@ -42,51 +83,125 @@ class ArticlePrinter(object):
         Dale Chall readability scores) of paragraphs.
         """
 
-        sentence_tag = Color('{blue}sentences{/blue}')
-        word_tag = Color('{blue}words{/blue}')
-        avg_word_tag = Color('{blue}Avg words per sentence{/blue}')
-        long_tag = Color('{red}longest{/red}')
-        table_data = [
-            [Color('{autocyan}Paragraph Stats{/autocyan}')],
-            ['Paragraph #', '']
-        ]
-        for item, para in enumerate(self.article.paragraphs):
-            sentences = Color('{red}%s{/red}' % str(len(para))) if len(para) > 5 else str(len(para))
-            avg_words_per_sentence = Color(
-                '{red}%s{/red}' % str(para.avg_words_per_sentence)) if para.avg_words_per_sentence > 25 else str(
-                para.avg_words_per_sentence)
-            table_data.append([item + 1,
-                               '{sentences} {sent_tag}. {words} {word_tag}. {avg_words} {avg_word_tag}. '
-                               '"{longest_sent}..." is the {long_tag} sentence.'.format(
-                                   sentences=sentences, sent_tag=sentence_tag, words=para.total_words,
-                                   word_tag=word_tag, avg_words=avg_words_per_sentence, avg_word_tag=avg_word_tag,
-                                   longest_sent=str(para.longest_sentence)[0:10], long_tag=long_tag
-                               )])
-            table_data.append(["", "Flesh Reading score={flesch_reading}, Dale Chall Readability= {dale_chall}".format(
-                flesch_reading=para.get_flesch_reading_score(), dale_chall=para.get_dale_chall_reading_score()
-            )])
+        with stage('print_paragraph_stats'):
+            table_data = [
+                [Color('{autocyan}Paragraph Stats{/autocyan}')],
+                ['Paragraph #', '']
+            ]
+            for item, para in enumerate(self.article.paragraphs):
+                table_data.extend(paragraph_rows(item + 1, para))
 
-        table_instance = SingleTable(table_data)
-        table_instance.inner_heading_row_border = True
-        table_instance.inner_row_border = True
-        table_instance.justify_columns = {0: 'center', 1: 'left'}
-        print(table_instance.table)
+            table_instance = SingleTable(table_data)
+            table_instance.inner_heading_row_border = True
+            table_instance.inner_row_border = True
+            table_instance.justify_columns = {0: 'center', 1: 'left'}
+            with stage('render_tables'):
+                print(table_instance.table)
 
-    def _print_detail_of(self, words_list, heading, display_count=True):
-        words = [str(word) for word in words_list]
+    def _print_detail_of(self, words, heading, display_count=True):
+        """`words` is a list of words, or a `Counter` of them as in `homer.lexicon.LexiconReport.counts`."""
+        if not isinstance(words, Counter):
+            words = Counter(str(word) for word in words)
         if len(words) >= 1:
-            words_unique_list = list(set(words))
             format_str = "{word} ({count})"
             if display_count:
-                msg = '{red} **- %s: %s {/red}\r\n' % (heading, ', '.join(format_str.format(word=str(word),
-                                                           count=words.count(word)) for word in words_unique_list))
+                msg = '{red} **- %s: %s {/red}\r\n' % (heading, ', '.join(format_str.format(word=word, count=count)
+                                                                          for word, count in words.items()))
             else:
-                msg = '{red} **- %s: %s {/red}\r\n' % (heading, ', '.join(word for word in words_unique_list))
+                msg = '{red} **- %s: %s {/red}\r\n' % (heading, ', '.join(word for word in words))
             print(Color(msg))
 
     def print_detail(self):
-        self._print_detail_of(self.article.get_compulsive_hedgers(), "Compulsive Hedgers", display_count=False)
-        self._print_detail_of(self.article.get_intensifiers(), "Intensifiers", display_count=False)
-        self._print_detail_of(self.article.get_vague_words(), "Vague words")
+        lexicon_report = self.article.get_lexicon_report()
+        self._print_detail_of(lexicon_report.counts[COMPULSIVE_HEDGER], "Compulsive Hedgers", display_count=False)
+        self._print_detail_of(lexicon_report.counts[INTENSIFIER], "Intensifiers", display_count=False)
+        self._print_detail_of(lexicon_report.counts[VAGUE_WORD], "Vague words")
         self._print_detail_of(self.article.ten_words_with_most_syllables(), "10 words with most syllables", display_count=False)
         self._print_detail_of(self.article.get_n_most_repeated_words(20), "20 most repeated words", display_count=False)
+
+
+def format_value(value):
+    if isinstance(value, (list, tuple)):
+        return ', '.join(str(item) for item in value)
+    if isinstance(value, dict):
+        return ', '.join('%s: %s' % item for item in value.items())
+    return str(value)
+
+
+def print_metrics(values):
+    """Prints the values of the metrics asked for, as given by `homer.metrics.compute`."""
+    table_data = [[Color('{autocyan}Stats{/autocyan}')]]
+    table_data.extend([name, format_value(value)] for name, value in values.items())
+    table_instance = SingleTable(table_data)
+    table_instance.inner_heading_row_border = True
+    table_instance.justify_columns = {0: 'left', 1: 'left'}
+    with stage('render_tables'):
+        print(table_instance.table)
+
+
+def print_summary(path, summary, metrics=None):
+    """Prints a one line summary of a file analyzed by `homer.batch`, or the `metrics` asked for if given."""
+    if 'error' in summary:
+        print(Color('{red}%s: %s{/red}' % (path, summary['error'])))
+        return
+    if metrics:
+        print('%s: %s' % (path, ', '.join('%s: %s' % (name, format_value(summary[name])) for name in metrics)))
+        return
+    print('{path}: {words} words, {reading_time:.1f} mins, Flesch Reading Ease: {flesch}, Dale Chall: {dale_chall}, '
+          'hedgers: {hedgers}, intensifiers: {intensifiers}, vague words: {vague_words}'.format(
+              path=path, words=summary['total_words'], reading_time=summary['reading_time'],
+              flesch=summary['flesch_reading_grade'], dale_chall=summary['dale_chall_grade'],
+              hedgers=summary['compulsive_hedgers'], intensifiers=summary['intensifiers'],
+              vague_words=summary['vague_words']))
+
+
+def format_delta(delta):
+    if delta is None:
+        return ''
+    text = '%+g' % delta
+    return text if delta else '0'
+
+
+def _rounded(value):
+    return format_value(round(value, 2) if isinstance(value, float) else value)
+
+
+def print_comparison(comparison):
+    """Prints the metrics of two revisions of a text side by side, then the paragraphs that changed."""
+    changed = comparison.deltas
+    table_data = [
+        [Color('{autocyan}Comparison{/autocyan}'), 'Before', 'After', 'Change'],
+    ]
+    table_data.extend([name, _rounded(comparison.before[name]), _rounded(value), format_delta(changed.get(name))]
+                      for name, value in comparison.after.items())
+    table_instance = SingleTable(table_data)
+    table_instance.inner_heading_row_border = True
+    table_instance.justify_columns = {0: 'left', 1: 'center', 2: 'center', 3: 'center'}
+    with stage('render_tables'):
+        print(table_instance.table)
+    if not comparison.changes:
+        print('No paragraph changed.')
+        return
+    table_data = [
+        [Color('{autocyan}Paragraph Changes{/autocyan}')],
+        ['Paragraph #', ''],
+    ]
+    for change in comparison.changes:
+        numbers = '%s -> %s' % ('' if change.old is None else change.old, '' if change.new is None else change.new)
+        if change.before is not None and change.after is not None:
+            details = ', '.join('%s: %s -> %s (%s)' % (name, _rounded(change.before[name]), _rounded(value),
+                                                       format_delta(delta))
+                                for name, value in change.after.items()
+                                for delta in [change.deltas.get(name)] if delta)
+        else:
+            details = ', '.join('%s: %s' % (name, _rounded(value))
+                                for name, value in (change.before or change.after).items())
+        table_data.append([numbers, '%s. %s' % (change.status.capitalize(), details)])
+    table_instance = SingleTable(table_data)
+    table_instance.inner_heading_row_border = True
+    table_instance.inner_row_border = True
+    table_instance.justify_columns = {0: 'center', 1: 'left'}
+    with stage('render_tables'):
+        print(table_instance.table)
+    print('%s of %s paragraphs analyzed again.' % (comparison.analyzed, comparison.after.get(
+        'total_paragraphs', comparison.article.total_paragraphs)))
@@ -0,0 +1,172 @@
+"""
+Compares two revisions of a text, e.g. to tell whether an edit made it easier to read.
+
+> comparison = compare(open('old.txt').read(), open('new.txt').read())
+> comparison.deltas['flesch_reading_ease'], comparison.easier_to_read
+> for change in comparison.changes:
+>     print(change.status, change.old, change.new, change.deltas)
+
+The old text is analyzed, then `Article.update` moves the article to the new text: paragraphs whose text did not change
+keep their stats, and only new or edited paragraphs are tokenized. Paragraphs are aligned by their text, the way
+`difflib` aligns lines, and an edited paragraph is paired with the old paragraph it shares most words with. For a long
+text with a small edit, comparing takes little more than analyzing the old text once.
+"""
+import difflib
+from collections import namedtuple
+from homer.analyzer import Article
+from homer.metrics import compute
+from homer.serializers import paragraph_record
+
+ADDED = 'added'
+REMOVED = 'removed'
+CHANGED = 'changed'
+MOVED = 'moved'
+
+# Article metrics compared by default, see `homer.metrics`.
+METRICS = ['reading_time', 'flesch_reading_ease', 'flesch_reading_grade', 'dale_chall_score', 'dale_chall_grade',
+           'total_paragraphs', 'total_sentences', 'total_words', 'avg_sentences_per_para', 'avg_words_per_sentence',
+           'len_of_longest_sentence', 'compulsive_hedgers', 'intensifiers', 'vague_words']
+# Paragraph stats compared by default, see `homer.serializers.PARAGRAPH_FIELDS`.
+PARAGRAPH_FIELDS = ['sentences', 'total_words', 'avg_words_per_sentence', 'flesch_reading_ease', 'dale_chall_score',
+                    'compulsive_hedgers', 'intensifiers', 'vague_words']
+# Share of their distinct words an edited paragraph and an old one must have in common to be paired.
+SIMILARITY = 0.5
+
+
+def deltas(before, after):
+    """How much every number of the dict `after` changed from `before`."""
+    return {name: round(value - before[name], 2) for name, value in after.items()
+            if isinstance(value, (int, float)) and not isinstance(value, bool) and
+            isinstance(before.get(name), (int, float))}
+
+
+class ParagraphChange(namedtuple('ParagraphChange', ['status', 'old', 'new', 'before', 'after'])):
+    """
+    A paragraph that was `ADDED`, `REMOVED`, `CHANGED` or `MOVED`. `old` and `new` are its numbers in the old and the
+    new text, None where it is not there, and `before` and `after` its stats there, None likewise.
+    """
+    __slots__ = ()
+
+    @property
+    def deltas(self):
+        if self.before is None or self.after is None:
+            return {}
+        return deltas(self.before, self.after)
+
+    def to_dict(self):
+        return dict(self._asdict(), deltas=self.deltas)
+
+
+class Comparison(object):
+    """
+    `before` and `after` hold the compared metrics of the old and the new text. `changes` are the `ParagraphChange`s,
+    in the order of the new text with removed paragraphs where they were. `analyzed` is the number of paragraphs of the
+    new text that had to be tokenized, and `article` the `Article` of the new text.
+    """
+
+    def __init__(self, before, after, changes, analyzed, article):
+        self.before = before
+        self.after = after
+        self.changes = changes
+        self.analyzed = analyzed
+        self.article = article
+
+    @property
+    def deltas(self):
+        return deltas(self.before, self.after)
+
+    @property
+    def easier_to_read(self):
+        """Whether the Flesch reading ease of the new text is higher."""
+        return self.deltas.get('flesch_reading_ease', 0) > 0
+
+    def to_dict(self):
+        changed = self.deltas
+        return {
+            'article': {name: {'before': self.before[name], 'after': value, 'delta': changed.get(name)}
+                        for name, value in self.after.items()},
+            'paragraphs': [change.to_dict() for change in self.changes],
+            'analyzed': self.analyzed,
+        }
+
+
+def _record(number, paragraph, fields):
+    record = paragraph_record(number, paragraph, fields)
+    del record['number']
+    return record
+
+
+def _words(paragraph):
+    return {word_id for sentence in paragraph.sentences for word_id in sentence.word_ids}
+
+
+def _pair(old_paragraphs, new_paragraphs, olds, news):
+    """Pairs the new paragraphs `news` with the most similar of the old paragraphs `olds`, as a dict."""
+    if not olds or not news:
+        return {}
+    old_words = {i: _words(old_paragraphs[i]) for i in olds}
+    pairs = {}
+    for j in news:
+        words = _words(new_paragraphs[j])
+        best, best_similarity = None, SIMILARITY
+        for i in olds:
+            if i in pairs.values():
+                continue
+            union = len(words | old_words[i])
+            similarity = len(words & old_words[i]) / union if union else 1.0
+            if similarity >= best_similarity:
+                best, best_similarity = i, similarity
+        if best is not None:
+            pairs[j] = best
+    return pairs
+
+
+def align(old_paragraphs, new_paragraphs, fields=PARAGRAPH_FIELDS):
+    """The `ParagraphChange`s that make the `Paragraph`s `new_paragraphs` of `old_paragraphs`."""
+    old_texts = [paragraph.paragraph for paragraph in old_paragraphs]
+    new_texts = [paragraph.paragraph for paragraph in new_paragraphs]
+    matcher = difflib.SequenceMatcher(None, old_texts, new_texts, autojunk=False)
+    blocks = [(i1, i2, j1, j2) for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != 'equal']
+    # Paragraphs taken out in one place and put back unchanged in another moved.
+    taken_out = {}
+    for i1, i2, _, _ in blocks:
+        for i in range(i1, i2):
+            taken_out.setdefault(old_texts[i], []).append(i)
+    moved = {}
+    for _, _, j1, j2 in blocks:
+        for j in range(j1, j2):
+            if taken_out.get(new_texts[j]):
+                moved[j] = taken_out[new_texts[j]].pop(0)
+    moved_old = set(moved.values())
+    changes = []
+    for i1, i2, j1, j2 in blocks:
+        olds = [i for i in range(i1, i2) if i not in moved_old]
+        pairs = _pair(old_paragraphs, new_paragraphs, olds, [j for j in range(j1, j2) if j not in moved])
+        for j in range(j1, j2):
+            after = _record(j + 1, new_paragraphs[j], fields)
+            if j in moved:
+                changes.append(ParagraphChange(MOVED, moved[j] + 1, j + 1, after, after))
+            elif j in pairs:
+                before = _record(pairs[j] + 1, old_paragraphs[pairs[j]], fields)
+                changes.append(ParagraphChange(CHANGED, pairs[j] + 1, j + 1, before, after))
+            else:
+                changes.append(ParagraphChange(ADDED, None, j + 1, None, after))
+        paired = set(pairs.values())
+        for i in olds:
+            if i not in paired:
+                changes.append(ParagraphChange(REMOVED, i + 1, None, _record(i + 1, old_paragraphs[i], fields), None))
+    return changes
+
+
+def compare(old_text, new_text, name='', author='', tokenizer=None, metrics=METRICS, fields=PARAGRAPH_FIELDS,
+            lexicon=None):
+    """
+    `Comparison` of the `metrics` of two revisions of a text, and of the paragraph stats `fields` of the paragraphs
+    that differ, both analyzed with `tokenizer` and `lexicon`.
+    """
+    article = Article(name, author, old_text, tokenizer, lexicon)
+    old_paragraphs = list(article.paragraphs)
+    before = compute(article, metrics)
+    analyzed = article.update(new_text)
+    after = compute(article, metrics)
+    return Comparison(before, after, align(old_paragraphs, article.paragraphs, fields), analyzed, article)
@@ -0,0 +1,180 @@
+"""
+Sentence and paragraph measures of many articles, kept in NumPy columns for distribution reports.
+
+> corpus = Corpus()
+> for path in paths:
+>     corpus.add(Article(os.path.basename(path), author, open(path).read()))
+> corpus.percentiles(SENTENCES, 'words', [50, 90, 99])
+> corpus.by_author(PARAGRAPHS, 'flesch_reading_ease', 'median')
+> corpus.outliers(SENTENCES, 'words')
+
+Adding an article walks its paragraphs and sentences once and appends their measures to compact arrays. Every report
+after that is a handful of NumPy operations over whole columns, so it takes about as long for a million sentences as
+Python takes to loop over a few thousand.
+
+NumPy is an optional dependency of Homer, installed with `pip install homer_text[corpus]`.
+"""
+from array import array
+from homer.lexicon import COMPULSIVE_HEDGER, INTENSIFIER, VAGUE_WORD
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+SENTENCES = 'sentences'
+PARAGRAPHS = 'paragraphs'
+
+# Columns of every table, and the array typecode they are collected in. `article` is the position of the article in
+# `Corpus.names`, `paragraph` the position of the paragraph in its article and `sentence` of the sentence in its
+# paragraph.
+COLUMNS = {
+    SENTENCES: [('article', 'l'), ('paragraph', 'l'), ('sentence', 'l'), ('words', 'l'), ('syllables', 'l'),
+                ('and_words', 'l'), ('compulsive_hedgers', 'l'), ('intensifiers', 'l'), ('vague_words', 'l')],
+    PARAGRAPHS: [('article', 'l'), ('paragraph', 'l'), ('sentences', 'l'), ('words', 'l'),
+                 ('flesch_reading_ease', 'd'), ('dale_chall_score', 'd'), ('compulsive_hedgers', 'l'),
+                 ('intensifiers', 'l'), ('vague_words', 'l'), ('hedger_density', 'd')],
+}
+
+STATISTICS = ('mean', 'median', 'sum', 'count', 'min', 'max', 'std')
+
+
+class Corpus(object):
+    """
+    Measures of the sentences and paragraphs of the articles added, in the `SENTENCES` and `PARAGRAPHS` tables.
+    `names` and `authors` hold the name and author of every article added, in order.
+    """
+
+    def __init__(self, articles=()):
+        if numpy is None:
+            raise ImportError('Corpus needs NumPy, install it with: pip install homer_text[corpus]')
+        self.names = []
+        self.authors = []
+        self._buffers = {table: {name: array(typecode) for name, typecode in columns}
+                         for table, columns in COLUMNS.items()}
+        self._columns = None
+        for article in articles:
+            self.add(article)
+
+    def add(self, article):
+        """Adds the measures of the sentences and paragraphs of `article`."""
+        article_index = len(self.names)
+        self.names.append(article.name)
+        self.authors.append(article.author)
+        sentences = self._buffers[SENTENCES]
+        paragraphs = self._buffers[PARAGRAPHS]
+        for paragraph_index, paragraph in enumerate(article.paragraphs):
+            paragraph_hedgers = {COMPULSIVE_HEDGER: 0, INTENSIFIER: 0, VAGUE_WORD: 0}
+            for sentence_index, sentence in enumerate(paragraph.sentences):
+                sentences['article'].append(article_index)
+                sentences['paragraph'].append(paragraph_index)
+                sentences['sentence'].append(sentence_index)
+                sentences['words'].append(len(sentence))
+                sentences['syllables'].append(sentence.readability_counts.syllables)
+                sentences['and_words'].append(sentence.total_and_words)
+                for category, matches in sentence.lexicon_matches.items():
+                    sentences[category].append(len(matches))
+                    paragraph_hedgers[category] += len(matches)
+            counts = paragraph.readability_counts
+            paragraphs['article'].append(article_index)
+            paragraphs['paragraph'].append(paragraph_index)
+            paragraphs['sentences'].append(len(paragraph))
+            paragraphs['words'].append(paragraph.total_words)
+            paragraphs['flesch_reading_ease'].append(counts.flesch_reading_ease())
+            paragraphs['dale_chall_score'].append(counts.dale_chall_score())
+            for category, total in paragraph_hedgers.items():
+                paragraphs[category].append(total)
+            paragraphs['hedger_density'].append(sum(paragraph_hedgers.values()) / paragraph.total_words
+                                                if paragraph.total_words else 0.0)
+        self._columns = None
+
+    def __len__(self):
+        return len(self.names)
+
+    def _get_columns(self):
+        if self._columns is None:
+            self._columns = {table: {name: numpy.frombuffer(buffer, dtype=buffer.typecode).copy()
+                                     for name, buffer in buffers.items()}
+                             for table, buffers in self._buffers.items()}
+        return self._columns
+
+    def column(self, table, name):
+        """The column `name` of `table` as a NumPy array, with one entry per sentence or paragraph."""
+        try:
+            return self._get_columns()[table][name]
+        except KeyError:
+            raise ValueError('Unknown column %r of %r. Known columns are: %s.' % (
+                name, table, ', '.join(column for column, _ in COLUMNS.get(table, ()))))
+
+    def describe(self, table, name):
+        """Count, mean, standard deviation, min, max and quartiles of a column, as a dict."""
+        values = self.column(table, name)
+        if not len(values):
+            return {'count': 0}
+        quartiles = numpy.percentile(values, [25, 50, 75])
+        return {
+            'count': int(len(values)),
+            'mean': float(values.mean()),
+            'std': float(values.std()),
+            'min': float(values.min()),
+            '25%': float(quartiles[0]),
+            '50%': float(quartiles[1]),
+            '75%': float(quartiles[2]),
+            'max': float(values.max()),
+        }
+
+    def percentiles(self, table, name, q=(50, 90, 99)):
+        """The percentiles `q` of a column, as a dict from percentile to value."""
+        return dict(zip(q, (float(value) for value in numpy.percentile(self.column(table, name), q))))
+
+    def histogram(self, table, name, bins=10):
+        """`(counts, bin_edges)` of a column, as given by `numpy.histogram`."""
+        return numpy.histogram(self.column(table, name), bins=bins)
+
+    def by_author(self, table, name, statistic='mean'):
+        """A `statistic` of a column for every author, one of `STATISTICS`, as a dict from author to value."""
+        if statistic not in STATISTICS:
+            raise ValueError('Unknown statistic %r, expected one of: %s.' % (statistic, ', '.join(STATISTICS)))
+        values = self.column(table, name)
+        author_codes = {}
+        article_codes = numpy.array([author_codes.setdefault(author, len(author_codes)) for author in self.authors],
+                                    dtype=numpy.intp)
+        authors = list(author_codes)
+        codes = article_codes[self.column(table, 'article')] if len(values) else numpy.zeros(0, dtype=numpy.intp)
+        if statistic in ('mean', 'sum', 'count'):
+            counts = numpy.bincount(codes, minlength=len(authors))
+            sums = numpy.bincount(codes, weights=values, minlength=len(authors))
+            results = {'count': counts, 'sum': sums}.get(statistic)
+            if results is None:
+                with numpy.errstate(invalid='ignore', divide='ignore'):
+                    results = sums / counts
+        else:
+            # Rows sorted by author, then one slice per author.
+            order = numpy.argsort(codes, kind='stable')
+            bounds = numpy.searchsorted(codes[order], numpy.arange(len(authors) + 1))
+            function = getattr(numpy, statistic)
+            results = [function(values[order[start:end]]) if end > start else numpy.nan
+                       for start, end in zip(bounds[:-1], bounds[1:])]
+        return {author: float(result) for author, result in zip(authors, results)}
+
+    def outliers(self, table, name, k=1.5):
+        """
+        Rows of `table` whose column `name` is above the upper Tukey fence, `k` interquartile ranges above the third
+        quartile, e.g. unusually long sentences. Returns dicts with the article name and author, the position of the
+        row and its value, largest first.
+        """
+        values = self.column(table, name)
+        if not len(values):
+            return []
+        first, third = numpy.percentile(values, [25, 75])
+        rows = numpy.flatnonzero(values > third + k * (third - first))
+        rows = rows[numpy.argsort(-values[rows], kind='stable')]
+        positions = [(column, self.column(table, column)[rows].tolist()) for column, _ in COLUMNS[table]
+                     if column in ('paragraph', 'sentence')]
+        outliers = []
+        for i, (article, value) in enumerate(zip(self.column(table, 'article')[rows].tolist(), values[rows].tolist())):
+            outlier = {'name': self.names[article], 'author': self.authors[article]}
+            outlier.update((position, column[i]) for position, column in positions)
+            outlier[name] = value
+            outliers.append(outlier)
+        return outliers
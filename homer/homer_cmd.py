@@ -7,24 +7,286 @@ Above shows help. Following will display stats on the command line:
 
 > python homer_cmd.py --name sdf --author dede --file_path=/correct/path/to/file.txt
 
+Following will analyze all text files under a directory, and files matching a glob pattern, in parallel:
+
+> python homer_cmd.py --batch /path/to/posts --batch '/path/to/drafts/**/*.md' --workers 4
+
+Following will print paragraph stats as the file is read, without holding the whole file in memory:
+
+> python homer_cmd.py --stream --file_path=/path/to/manuscript.txt
+
+Following will write the stats as JSON, as NDJSON with a line per paragraph written as soon as it is analyzed, or as
+CSV with a row per paragraph and one for the article, with only the fields asked for:
+
+> python homer_cmd.py --file_path=/path/to/file.txt --format ndjson --metrics total_words,flesch_reading_ease
+
+Following will only compute and print the reading time and the Flesch reading ease, without loading CMUdict for the
+other stats or the stopwords at all:
+
+> python homer_cmd.py --file_path=/path/to/file.txt --metrics reading_time,flesch
+
+Following will compare two revisions of a text, printing how every stat changed and the paragraphs that were added,
+removed, edited or moved. Only the paragraphs that differ are analyzed twice:
+
+> python homer_cmd.py --compare draft.txt final.txt
+
+Following will split sentences and words with precompiled regular expressions instead of NLTK, which is much faster
+and a little less accurate, e.g. to score many files:
+
+> python homer_cmd.py --batch /path/to/posts --tokenizer regex
+
+Following will start a server that keeps NLTK and its models loaded, on a Unix socket or on a localhost port. While
+it runs, commands with --metrics or a --format other than table send their file to it instead of loading everything
+again, and take milliseconds instead of seconds. --server, or $HOMER_SERVER, tells them where the server is when it is
+not on the default socket:
+
+> python homer_cmd.py --serve --workers 4
+> python homer_cmd.py --file_path=/path/to/file.txt --format json
+> python homer_cmd.py --serve --port 8765
+> python homer_cmd.py --file_path=/path/to/file.txt --metrics flesch --server localhost:8765
+
+Following will look for the intensifiers, compulsive hedgers and vague words of a lexicon pack, a JSON or YAML file
+of word lists (see `homer.lexicon`), instead of Homer's. A server started with --lexicon reloads the pack when it
+changes. Other commands may only have it use that pack, or those under its --lexicon_dir, otherwise they analyze the
+file themselves:
+
+> python homer_cmd.py --file_path=/path/to/file.txt --lexicon legal.yaml
+
+Following will keep the stats in a cache and serve them from there while the file does not change:
+
+> python homer_cmd.py --file_path=/path/to/file.txt --cache
+
+Following will also print how long every stage of the analysis took, as JSON, or write it to a file:
+
+> python homer_cmd.py --file_path=/path/to/file.txt --profile
+> python homer_cmd.py --file_path=/path/to/file.txt --profile_output=profile.json
+
 """
 import os
+import sys
 import click
-from homer.analyzer import Article
-from homer.cmdline_printer import ArticlePrinter
+from homer import profiling
+from homer.tokenizers import TOKENIZERS, DEFAULT_TOKENIZER
+
+OUTPUT_FORMATS = ('table', 'json', 'ndjson', 'csv')
+
 
 @click.command()
 @click.option('--name', help='Article name, can be an empty string.')
 @click.option('--author', help='Author name, can be an empty string.')
-@click.option('--file_path', required=True, type=click.Path(exists=True))
-def homer_cmd(name, author, file_path):
-    file_path = os.path.abspath(file_path)
-    printer = ArticlePrinter(Article(name, author, open(file_path, mode='r', encoding='utf-8').read()))
-    printer.print_article_stats()
-    printer.print_paragraph_stats()
+@click.option('--file_path', type=click.Path(exists=True))
+@click.option('--batch', multiple=True, help='A directory or a glob pattern of files to analyze in parallel. Can be '
+                                             'given more than once.')
+@click.option('--workers', type=int, help='Number of processes used by --batch, defaulting to the number of CPUs, or '
+                                           'of threads analyzing requests with --serve, defaulting to 4.')
+@click.option('--compare', nargs=2, type=click.Path(exists=True, dir_okay=False),
+              help='Two revisions of a text, old then new, to compare.')
+@click.option('--stream', is_flag=True, help='Print paragraph stats while reading the file, for very large files.')
+@click.option('--format', 'output_format', type=click.Choice(OUTPUT_FORMATS), default='table',
+              help='Tables for people (the default), or JSON, NDJSON or CSV for other programs.')
+@click.option('--metrics', help='Comma separated stats to compute, e.g. reading_time,flesch. Defaults to all.')
+@click.option('--tokenizer', type=click.Choice(sorted(TOKENIZERS)), default=DEFAULT_TOKENIZER,
+              help='How to split sentences and words: nltk (the default) or regex, faster and a little less accurate.')
+@click.option('--lexicon', type=click.Path(exists=True, dir_okay=False),
+              help='A JSON or YAML lexicon pack with the intensifiers, compulsive hedgers and vague words to look for.')
+@click.option('--lexicon_dir', type=click.Path(exists=True, file_okay=False),
+              help='Directory of the lexicon packs other commands may have --serve use, besides its --lexicon.')
+@click.option('--serve', is_flag=True, help='Keep running and analyze the texts other commands send, see --port.')
+@click.option('--port', type=int, help='Port on localhost --serve listens on, instead of a Unix socket.')
+@click.option('--socket', 'socket_path', type=click.Path(dir_okay=False),
+              help='Unix socket --serve listens on. Defaults to ~/.cache/homer/homer.sock.')
+@click.option('--server', envvar='HOMER_SERVER', help='Address of a running --serve, a Unix socket or host:port, '
+                                                      'used when on neither the default socket nor $HOMER_SERVER.')
+@click.option('--no_server', is_flag=True, help='Analyze in this process even if a server is running.')
+@click.option('--cache', is_flag=True, help='Serve stats of unchanged files from an on-disk cache. Not used with '
+                                            '--stream.')
+@click.option('--cache_path', type=click.Path(dir_okay=False), help='Cache file to use, implies --cache. Defaults to '
+                                                                     '~/.cache/homer/analyses.sqlite.')
+@click.option('--profile', is_flag=True, help='Print the time taken by every stage of the analysis as JSON.')
+@click.option('--profile_output', type=click.Path(), help='Write the time taken by every stage as JSON to this file.')
+def homer_cmd(name, author, file_path, batch, workers, compare, stream, output_format, metrics, tokenizer, lexicon,
+              lexicon_dir, serve, port, socket_path, server, no_server, cache, cache_path, profile, profile_output):
+    # Homer's modules, and NLTK with them, are only imported once the options are known to be valid, so that --help
+    # and usage errors are quick.
+    if metrics:
+        from homer.serializers import check_fields
+        metrics = [metric.strip() for metric in metrics.split(',') if metric.strip()]
+        try:
+            check_fields(metrics)
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint='--metrics')
+    if lexicon:
+        from homer.lexicon import get_lexicon
+        lexicon = os.path.abspath(lexicon)
+        try:
+            get_lexicon(lexicon)
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint='--lexicon')
+    if serve:
+        serve_forever(port, socket_path, workers, tokenizer, lexicon, lexicon_dir)
+        return
+    if cache and not cache_path:
+        from homer.cache import DEFAULT_PATH as cache_path
+    if batch:
+        if profile or profile_output:
+            raise click.UsageError('--profile is not available with --batch.')
+        from homer.batch import analyze_files
+        from homer.serializers import article_fields
+        summaries = analyze_files(batch, author=author, workers=workers, cache_path=cache_path,
+                                  metrics=article_fields(metrics) if metrics else None, tokenizer=tokenizer,
+                                  lexicon=lexicon)
+        if output_format == 'table':
+            from homer.cmdline_printer import print_summary
+            for path, summary in summaries:
+                print_summary(path, summary, metrics)
+        else:
+            from homer.serializers import write_summaries
+            write_summaries(summaries, sys.stdout, output_format, metrics)
+        return
+    if compare:
+        run = lambda: compare_files(name, author, compare, output_format, metrics, tokenizer, lexicon)
+    elif file_path:
+        file_path = os.path.abspath(file_path)
+        if not no_server:
+            from homer.client import find_server
+            server = find_server(server)
+        run = lambda: analyze(name, author, file_path, stream, output_format, metrics, tokenizer, lexicon, cache_path,
+                              None if no_server else server)
+    else:
+        raise click.UsageError('Either --file_path, --batch or --compare is required.')
+    if not (profile or profile_output):
+        run()
+        return
+    with profiling.profile() as stage_profile:
+        run()
+    if profile:
+        print(stage_profile.to_json(), file=sys.stderr)
+    if profile_output:
+        with open(profile_output, 'w') as f:
+            f.write(stage_profile.to_json())
 
 
-if __name__ == "__main__":
-    homer_cmd()
+def serve_forever(port, socket_path, workers, tokenizer, lexicon, lexicon_dir):
+    from homer.server import AnalysisServer, DEFAULT_HOST, DEFAULT_WORKERS
+    from homer.client import DEFAULT_SOCKET
+    address = (DEFAULT_HOST, port) if port is not None else socket_path or DEFAULT_SOCKET
+    try:
+        server = AnalysisServer(address, workers=workers or DEFAULT_WORKERS, tokenizer=tokenizer, lexicon=lexicon,
+                                lexicon_dir=lexicon_dir)
+    except OSError as e:
+        raise click.ClickException('Cannot listen on %s: %s' % (address, e))
+    try:
+        server.warmup()
+        print('Homer is listening on %s' % server.url, file=sys.stderr)
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
 
 
+def compare_files(name, author, paths, output_format, metrics, tokenizer, lexicon):
+    from homer.compare import compare, PARAGRAPH_FIELDS
+    texts = []
+    for path in paths:
+        with open(path, mode='r', encoding='utf-8') as f:
+            texts.append(f.read())
+    if metrics:
+        from homer.metrics import ALIASES
+        from homer.serializers import article_fields
+        names = {ALIASES.get(metric, metric) for metric in metrics}
+        comparison = compare(*texts, name=name, author=author, tokenizer=tokenizer, metrics=article_fields(metrics),
+                             fields=[field for field in PARAGRAPH_FIELDS if field in names], lexicon=lexicon)
+    else:
+        comparison = compare(*texts, name=name, author=author, tokenizer=tokenizer, lexicon=lexicon)
+    if output_format == 'table':
+        from homer.cmdline_printer import print_comparison
+        print_comparison(comparison)
+    else:
+        from homer.serializers import write_comparison
+        write_comparison(comparison, sys.stdout, output_format)
+
+
+def analyze_on(server, name, author, file_path, output_format, metrics, tokenizer, lexicon):
+    """
+    Has the `homer.client.Client` `server` analyze the file and prints what it answers. Returns False, having printed
+    nothing, when the server cannot be reached.
+    """
+    from homer.client import BUILTIN_LEXICON
+    with open(file_path, mode='r', encoding='utf-8') as f:
+        text = f.read()
+    try:
+        # The lexicon is always named, the stats must not depend on the one the server was started with.
+        document = server.analyze(text, name, author, metrics, tokenizer, paragraphs=output_format != 'table',
+                                  lexicon=lexicon or BUILTIN_LEXICON)
+    except OSError:
+        return False
+    except ValueError:
+        # The server refuses to read packs other than its own and those under its lexicon directory.
+        if lexicon:
+            return False
+        raise
+    if output_format == 'table':
+        from homer.cmdline_printer import print_metrics
+        print_metrics(document['article'])
+    else:
+        from homer.serializers import write_document
+        write_document(document, sys.stdout, output_format, metrics)
+    return True
+
+
+def analyze(name, author, file_path, stream, output_format, metrics, tokenizer, lexicon, cache_path, server=None):
+    # Only the stats printed as tables need an `Article` in this process, the others can come from a server.
+    if server is not None and not stream and (output_format != 'table' or metrics):
+        if analyze_on(server, name, author, file_path, output_format, metrics, tokenizer, lexicon):
+            return
+    # NDJSON is written paragraph by paragraph anyway, so it is streamed unless it can come from the cache.
+    if stream or (output_format == 'ndjson' and not cache_path):
+        from homer.streaming import ArticleStream
+        from homer.serializers import article_fields
+        stream_metrics = article_fields(metrics) if metrics else None
+        with open(file_path, mode='r', encoding='utf-8') as f:
+            article_stream = ArticleStream(name, author, f, tokenizer=tokenizer, lexicon=lexicon,
+                                           metrics=stream_metrics)
+            if output_format == 'table':
+                from homer.cmdline_printer import print_paragraph, print_summary
+                for number, para in enumerate(article_stream, 1):
+                    print_paragraph(number, para)
+                print_summary(file_path, article_stream.summary(), stream_metrics)
+            else:
+                from homer.serializers import write_stream
+                write_stream(article_stream, sys.stdout, output_format, metrics)
+        return
+    if cache_path:
+        from homer.cache import AnalysisCache
+        with open(file_path, mode='r', encoding='utf-8') as f:
+            text = f.read()
+        with AnalysisCache(cache_path, lexicon=lexicon, tokenizer=tokenizer) as analysis_cache:
+            if output_format == 'table' and metrics:
+                # Only the metrics asked for are computed when the file is not cached yet.
+                from homer.serializers import article_fields
+                from homer.cmdline_printer import print_metrics
+                print_metrics(analysis_cache.summary(name, author, text, article_fields(metrics)))
+                return
+            article = analysis_cache.article(name, author, text)
+    else:
+        # Memory-mapped rather than read, so that the text is not held in memory while it is analyzed.
+        from homer.analyzer import Article
+        article = Article.from_file(name, author, file_path, tokenizer, lexicon)
+    if output_format == 'table' and metrics:
+        from homer.metrics import compute
+        from homer.serializers import article_fields
+        from homer.cmdline_printer import print_metrics
+        print_metrics(compute(article, article_fields(metrics)))
+    elif output_format == 'table':
+        from homer.cmdline_printer import ArticlePrinter
+        printer = ArticlePrinter(article)
+        printer.print_article_stats()
+        printer.print_paragraph_stats()
+    else:
+        from homer.serializers import write_article
+        write_article(article, sys.stdout, output_format, metrics)
+
+
+if __name__ == "__main__":
+    homer_cmd()
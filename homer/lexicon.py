@@ -0,0 +1,215 @@
+"""
+Compiled lookup of intensifiers, compulsive hedgers and vague words.
+
+The word lists in `homer.constants` contain single words as well as phrases such as 'sort of' or 'fair value'. A
+`Lexicon` compiles them once into sets, for checking a single word, and into a trie keyed by vocabulary id, for finding
+the phrases in a sentence. `Lexicon.find_ids` walks the words of a sentence once. From every word it follows the trie
+for at most as many words as the longest phrase has, so the cost per word does not depend on the size of the lists.
+
+Teams can use their own word lists, kept in a JSON or YAML file, a lexicon pack:
+
+    {"name": "legal", "vague_words": ["stuff", "things"], "intensifiers": {"add": ["plainly"], "remove": ["very"]}}
+
+A category given as a list replaces Homer's list, one given as `add` and `remove` changes it, and one left out keeps
+it. `get_lexicon(path)` compiles a pack the first time it is asked for and hands out the same `Lexicon` afterwards, so
+the lists are compiled once per process rather than once per article. When the file changes, the next call compiles
+it again, which is how a long-running `homer.server` picks up edited packs.
+
+> Article(name, author, text, lexicon='legal.yaml')
+"""
+import os
+import json
+import hashlib
+import threading
+from collections import Counter
+from homer.constants import INTENSIFIERS, COMPULSIVE_HEDGERS, VAGUE_WORDS
+from homer.vocabulary import VOCABULARY
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+INTENSIFIER = 'intensifiers'
+COMPULSIVE_HEDGER = 'compulsive_hedgers'
+VAGUE_WORD = 'vague_words'
+CATEGORIES = (INTENSIFIER, COMPULSIVE_HEDGER, VAGUE_WORD)
+
+# Key under which a trie node keeps the categories of the phrase that ends at it. Vocabulary ids are never negative.
+_END = -1
+
+
+class Lexicon(object):
+    """
+    Intensifiers, compulsive hedgers and vague words, compiled for lookup. `name` tells packs apart in messages.
+    """
+
+    def __init__(self, intensifiers=INTENSIFIERS, compulsive_hedgers=COMPULSIVE_HEDGERS, vague_words=VAGUE_WORDS,
+                 name='default'):
+        self.name = name
+        self._fingerprint = None
+        self.intensifiers = self._normalize(intensifiers)
+        self.compulsive_hedgers = self._normalize(compulsive_hedgers)
+        self.vague_words = self._normalize(vague_words)
+        self.longest_phrase = max([len(phrase.split()) for category in CATEGORIES
+                                   for phrase in getattr(self, category)] or [0])
+        self._compile()
+
+    def _compile(self):
+        # The trie is compiled again when the vocabulary is cleared, since its ids then mean other tokens.
+        generation = VOCABULARY.generation
+        trie = {}
+        for category in CATEGORIES:
+            for phrase in getattr(self, category):
+                node = trie
+                for word in phrase.split():
+                    node = node.setdefault(VOCABULARY.intern(word), {})
+                node.setdefault(_END, set()).add(category)
+        self._trie = trie
+        self._generation = generation
+
+    @property
+    def fingerprint(self):
+        """A hash of the word lists. Two lexicons with the same words have the same fingerprint."""
+        if self._fingerprint is None:
+            digest = hashlib.sha256()
+            for category in CATEGORIES:
+                digest.update(('\n'.join([category] + sorted(getattr(self, category))) + '\n\n').encode('utf-8'))
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def __reduce__(self):
+        # The trie holds vocabulary ids, which are only valid in this process. Another process compiles the lists
+        # again, e.g. a worker of `homer.batch`.
+        return type(self), tuple(sorted(getattr(self, category)) for category in CATEGORIES) + (self.name,)
+
+    def __repr__(self):
+        return 'Lexicon(name=%r)' % self.name
+
+    @staticmethod
+    def _normalize(phrases):
+        return frozenset(' '.join(phrase.lower().split()) for phrase in phrases)
+
+    def find(self, words):
+        """Same as `find_ids`, for `words`, a list of lowercased words. Words never seen before match nothing."""
+        return self.find_ids([VOCABULARY.id_of(word) for word in words])
+
+    def find_ids(self, word_ids):
+        """
+        Finds intensifiers, compulsive hedgers and vague words in `word_ids`, the vocabulary ids of lowercased words.
+
+        Yields `(category, start, end)` for every match, where `word_ids[start:end]` is the phrase. Within a category,
+        the longest phrase starting at the leftmost word wins and matches do not overlap. Matches are yielded in the
+        order they start.
+        """
+        if self._generation != VOCABULARY.generation:
+            self._compile()
+        trie = self._trie
+        free_from = dict.fromkeys(CATEGORIES, 0)
+        for start in range(len(word_ids)):
+            node = trie
+            longest = {}
+            for end in range(start, min(start + self.longest_phrase, len(word_ids))):
+                node = node.get(word_ids[end])
+                if node is None:
+                    break
+                for category in node.get(_END, ()):
+                    longest[category] = end + 1
+            for category in CATEGORIES:
+                if category in longest and start >= free_from[category]:
+                    free_from[category] = longest[category]
+                    yield category, start, longest[category]
+
+
+class LexiconReport(object):
+    """
+    Intensifiers, compulsive hedgers and vague words found in a text. For every category, `counts` tallies how often
+    each word or phrase occurs. `positions` lists every occurrence in order, as `(word, paragraph, sentence, index)`
+    with `index` being the position of the (first) word in its sentence.
+    """
+
+    def __init__(self):
+        self.counts = {category: Counter() for category in CATEGORIES}
+        self.positions = {category: [] for category in CATEGORIES}
+
+    def add(self, category, word, paragraph, sentence, index):
+        self.counts[category][str(word)] += 1
+        self.positions[category].append((word, paragraph, sentence, index))
+
+    def words(self, category):
+        """Every occurrence of a word of `category`, in order."""
+        return [position[0] for position in self.positions[category]]
+
+    def total(self, category):
+        return len(self.positions[category])
+
+
+DEFAULT_LEXICON = Lexicon()
+
+
+def _category(pack, category, default):
+    words = pack.get(category)
+    if words is None:
+        return default
+    if isinstance(words, dict):
+        unknown = set(words) - {'add', 'remove'}
+        if unknown:
+            raise ValueError('Unknown keys of %s: %s, expected add and remove.' % (
+                category, ', '.join(sorted(unknown))))
+        return (default | Lexicon._normalize(words.get('add') or ())) - Lexicon._normalize(words.get('remove') or ())
+    if isinstance(words, str) or not all(isinstance(word, str) for word in words):
+        raise ValueError('%s must be a list of words and phrases.' % category)
+    return words
+
+
+def load_lexicon(path):
+    """
+    The `Lexicon` of the pack at `path`, a JSON file, or a YAML one when it ends with .yaml or .yml, compiled anew.
+    Raises ValueError if the pack is not valid. Use `get_lexicon` to compile a pack only once.
+    """
+    with open(path, encoding='utf-8') as f:
+        if path.endswith(('.yaml', '.yml')):
+            if yaml is None:
+                raise ImportError('YAML lexicons need PyYAML, install it with: pip install homer_text[yaml]')
+            try:
+                pack = yaml.safe_load(f)
+            except yaml.YAMLError as e:
+                raise ValueError('%s: %s' % (path, e))
+        else:
+            pack = json.load(f)
+    if not isinstance(pack, dict):
+        raise ValueError('%s: a lexicon pack is a mapping of categories to words.' % path)
+    unknown = set(pack) - set(CATEGORIES) - {'name'}
+    if unknown:
+        raise ValueError('%s: unknown categories %s, expected some of: %s.' % (
+            path, ', '.join(sorted(unknown)), ', '.join(CATEGORIES)))
+    name = pack.get('name') or os.path.splitext(os.path.basename(path))[0]
+    return Lexicon(*(_category(pack, category, getattr(DEFAULT_LEXICON, category)) for category in CATEGORIES),
+                   name=str(name))
+
+
+# Absolute path of a pack -> (modification time and size of the file when it was compiled, its Lexicon).
+_packs = {}
+_packs_lock = threading.Lock()
+
+
+def get_lexicon(lexicon=None):
+    """
+    `DEFAULT_LEXICON` when `lexicon` is None, the `Lexicon` of the pack at the path `lexicon`, compiled again only if
+    the file changed since it was last asked for, or `lexicon` itself if it is a `Lexicon` already.
+    """
+    if lexicon is None:
+        return DEFAULT_LEXICON
+    if isinstance(lexicon, Lexicon):
+        return lexicon
+    path = os.path.abspath(lexicon)
+    info = os.stat(path)
+    stamp = (info.st_mtime_ns, info.st_size)
+    cached = _packs.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    with _packs_lock:
+        cached = _packs.get(path)
+        if cached is None or cached[0] != stamp:
+            cached = _packs[path] = (stamp, load_lexicon(path))
+    return cached[1]
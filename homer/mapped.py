@@ -0,0 +1,73 @@
+"""
+The text of a file read through a memory map, for manuscripts too large to hold in memory several times over.
+
+> article = Article.from_file('Manuscript', author, 'manuscript.txt')
+
+`MappedText` maps the file and finds its paragraphs as byte offsets without decoding it. `Article.from_file` decodes
+one paragraph at a time to tokenize it, and then lets the text go: paragraphs and sentences remember where they are in
+the file and decode their text again when it is asked for, e.g. to print the longest sentence. What an article keeps
+is the vocabulary ids and spans of its tokens, while the pages of the file are left to the OS, which can drop them
+whenever it needs the memory.
+
+Text is decoded as UTF-8 with newlines translated the way `open()` translates them, so paragraphs, offsets and stats
+are the same as those of `Article(name, author, open(path, encoding='utf-8').read())`. The file must not be truncated
+while an article of it is in use.
+"""
+import os
+import re
+import mmap
+
+# What `\s` matches in a str, as UTF-8, leaving out newlines.
+_SPACE = (rb'(?:[ \t\x0b\x0c\x1c-\x1f]|\xc2[\x85\xa0]|\xe1\x9a\x80|\xe2\x80[\x80-\x8a\xa8\xa9\xaf]|\xe2\x81\x9f|'
+          rb'\xe3\x80\x80)')
+# A newline as `open()` reads one.
+_NEWLINE = rb'(?:\r\n|\r(?!\n)|\n)'
+# `homer.tokenizers.BLANK_LINES` in the bytes of a file: whitespace with at least two newlines.
+BLANK_LINES = re.compile(_SPACE + rb'*' + _NEWLINE + _SPACE + rb'*' + _NEWLINE + rb'(?:' + _SPACE + rb'|' + _NEWLINE +
+                         rb')*')
+
+
+class MappedText(object):
+    """The UTF-8 text of the file at `path`, memory-mapped. Offsets are in bytes."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            # Empty files cannot be mapped. A map stays valid once its file is closed.
+            if os.fstat(f.fileno()).st_size:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._map = b''
+
+    def paragraph_spans(self):
+        """`(start, end)` of every paragraph, as `homer.tokenizers.Tokenizer.paragraph_spans` finds them."""
+        spans = []
+        start = 0
+        for separator in BLANK_LINES.finditer(self._map):
+            if separator.start() > start:
+                spans.append((start, separator.start()))
+            start = separator.end()
+        if len(self._map) > start:
+            spans.append((start, len(self._map)))
+        return spans
+
+    def text(self, start=0, end=None):
+        """The text from `start` to `end`, decoded."""
+        return self._map[start:end].decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+
+    def __len__(self):
+        return len(self._map)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def __repr__(self):
+        return 'MappedText(%r)' % self.path
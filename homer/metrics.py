@@ -0,0 +1,158 @@
+"""
+The stats Homer computes, as a registry of named metrics, so that callers only pay for the ones they ask for.
+
+> analyze(text, metrics={'reading_time', 'flesch'})
+> {'reading_time': 8.2, 'flesch': 63.4}
+
+A metric is computed from the `Article` and from the values of the metrics it `requires`, which are computed first.
+Its `needs` name the costly parts of an analysis it triggers:
+
+- `sentences`: tokenizing the paragraphs into sentences and words.
+- `syllables`: counting syllables, which loads CMUdict.
+- `lexicon`: looking for intensifiers, compulsive hedgers and vague words.
+- `stopwords`: loading the stopwords.
+
+Since an `Article` only analyzes its paragraphs when a stat needs them, and resources are loaded on first use, asking
+for `total_paragraphs` alone tokenizes no sentence, and asking for `reading_time` never loads CMUdict.
+"""
+from homer.constants import WORDS_ONE_READS_PER_MINUTE
+from homer.lexicon import COMPULSIVE_HEDGER, INTENSIFIER, VAGUE_WORD
+from homer.utils import FleschReading, DaleChall
+
+# Other names metrics can be asked for by.
+ALIASES = {
+    'flesch': 'flesch_reading_ease',
+    'dale_chall': 'dale_chall_score',
+}
+
+
+class Metric(object):
+    """
+    A named stat, computed by `compute(article, values)` where `values` holds the metrics it `requires`. Metrics
+    that are not `public` give objects rather than plain values, and are there for other metrics to require.
+    """
+
+    def __init__(self, name, compute, requires=(), needs=(), public=True, description=''):
+        self.name = name
+        self.compute = compute
+        self.requires = tuple(requires)
+        self.needs = frozenset(needs)
+        self.public = public
+        self.description = description
+
+    def __repr__(self):
+        return 'Metric(%r)' % self.name
+
+
+METRICS = {}
+
+
+def register(name, compute, requires=(), needs=(), public=True, description=''):
+    """Adds a metric to the registry. Everything it `requires` must be registered already."""
+    missing = [required for required in requires if required not in METRICS]
+    if missing:
+        raise ValueError('Metric %r requires unknown metrics: %s.' % (name, ', '.join(missing)))
+    METRICS[name] = Metric(name, compute, requires, needs, public, description)
+    return METRICS[name]
+
+
+def public_metrics():
+    """Names of the metrics that give plain values, in the order they were registered."""
+    return [name for name, metric in METRICS.items() if metric.public]
+
+
+def resolve(metrics):
+    """
+    The metrics named in `metrics`, and those they require, in an order where every metric comes after the ones it
+    requires. Raises ValueError for unknown names.
+    """
+    names = [ALIASES.get(name, name) for name in metrics]
+    unknown = [name for name in names if name not in METRICS]
+    if unknown:
+        raise ValueError('Unknown metrics: %s. Known metrics are: %s.' % (', '.join(unknown),
+                                                                            ', '.join(public_metrics())))
+    ordered = []
+    seen = set()
+
+    def visit(name):
+        if name in seen:
+            return
+        seen.add(name)
+        for required in METRICS[name].requires:
+            visit(required)
+        ordered.append(METRICS[name])
+    for name in names:
+        visit(name)
+    return ordered
+
+
+def needs(metrics):
+    """The costly parts of an analysis computing `metrics` takes, see the module docs."""
+    return frozenset().union(*(metric.needs for metric in resolve(metrics)))
+
+
+def compute(article, metrics):
+    """The values of `metrics`, names or aliases of registered metrics, for `article`, keyed by the names given."""
+    values = {}
+    for metric in resolve(metrics):
+        values[metric.name] = metric.compute(article, values)
+    return {name: values[ALIASES.get(name, name)] for name in metrics}
+
+
+def analyze(text, metrics, name='', author='', tokenizer=None, lexicon=None):
+    """The values of `metrics` for `text`, tokenized by `tokenizer` with `lexicon`, computing nothing else."""
+    from homer.analyzer import Article
+    return compute(Article(name, author, text, tokenizer, lexicon), metrics)
+
+
+SENTENCES = 'sentences'
+SYLLABLES = 'syllables'
+LEXICON = 'lexicon'
+STOPWORDS = 'stopwords'
+
+register('name', lambda article, values: article.name)
+register('author', lambda article, values: article.author)
+register('total_paragraphs', lambda article, values: article.total_paragraphs)
+register('total_words', lambda article, values: article.total_words, needs=[SENTENCES])
+register('reading_time', lambda article, values: values['total_words'] / WORDS_ONE_READS_PER_MINUTE,
+         requires=['total_words'], description='Minutes it takes to read the text.')
+register('readability_counts', lambda article, values: article.readability_counts, needs=[SENTENCES, SYLLABLES],
+         public=False, description='The counts behind the readability scores, a `ReadabilityCounts`.')
+register('flesch_reading', lambda article, values: FleschReading(counts=values['readability_counts']),
+         requires=['readability_counts'], public=False)
+register('flesch_reading_ease', lambda article, values: values['flesch_reading'].score, requires=['flesch_reading'])
+register('flesch_reading_grade', lambda article, values: values['flesch_reading'].grade(),
+         requires=['flesch_reading'])
+register('dale_chall', lambda article, values: DaleChall(counts=values['readability_counts']),
+         requires=['readability_counts'], public=False)
+register('dale_chall_score', lambda article, values: values['dale_chall'].score, requires=['dale_chall'])
+register('dale_chall_grade', lambda article, values: values['dale_chall'].grade(), requires=['dale_chall'])
+register('readability_scores', lambda article, values: values['readability_counts'].scores(),
+         requires=['readability_counts'], description='Every readability score Homer knows, as a dict.')
+register('total_sentences', lambda article, values: article.total_sentences, needs=[SENTENCES])
+register('avg_sentences_per_para', lambda article, values: article.avg_sentences_per_para, needs=[SENTENCES])
+register('len_of_longest_paragraph', lambda article, values: article.len_of_longest_paragraph, needs=[SENTENCES])
+register('avg_words_per_sentence', lambda article, values: article.avg_words_per_sentence, needs=[SENTENCES])
+register('longest_sentence', lambda article, values: '' if article.longest_sentence is None
+         else str(article.longest_sentence), needs=[SENTENCES])
+register('len_of_longest_sentence', lambda article, values: article.len_of_longest_sentence, needs=[SENTENCES])
+register('total_and_words', lambda article, values: article.total_and_words, needs=[SENTENCES])
+register('and_frequency', lambda article, values: article.get_and_frequency(), needs=[SENTENCES])
+register('lexicon_report', lambda article, values: article.get_lexicon_report(), needs=[SENTENCES, LEXICON],
+         public=False, description='A `homer.lexicon.LexiconReport`.')
+register('compulsive_hedgers', lambda article, values: values['lexicon_report'].total(COMPULSIVE_HEDGER),
+         requires=['lexicon_report'])
+register('intensifiers', lambda article, values: values['lexicon_report'].total(INTENSIFIER),
+         requires=['lexicon_report'])
+register('vague_words', lambda article, values: values['lexicon_report'].total(VAGUE_WORD),
+         requires=['lexicon_report'])
+register('ten_words_with_most_syllables', lambda article, values: article.ten_words_with_most_syllables(),
+         needs=[SENTENCES, SYLLABLES])
+register('most_repeated_words', lambda article, values: article.get_n_most_repeated_words(20),
+         needs=[SENTENCES, STOPWORDS], description='The 20 most repeated words.')
+
+# The metrics of a summary, as given by `homer.batch.summarize`, in order.
+SUMMARY = ['name', 'author', 'reading_time', 'flesch_reading_ease', 'flesch_reading_grade', 'dale_chall_score',
+           'dale_chall_grade', 'total_paragraphs', 'avg_sentences_per_para', 'len_of_longest_paragraph',
+           'total_sentences', 'avg_words_per_sentence', 'longest_sentence', 'len_of_longest_sentence', 'total_words',
+           'total_and_words', 'compulsive_hedgers', 'intensifiers', 'vague_words']
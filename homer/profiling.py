@@ -0,0 +1,124 @@
+"""
+Per stage timings and counters of an analysis, to find out where the time goes without attaching a profiler.
+
+> with profiling.profile() as profile:
+>     printer = ArticlePrinter(Article(name, author, text))
+>     printer.print_article_stats()
+> print(profile.to_json())
+
+Code marks its stages with `with stage('sent_tokenize'):` and counts things with `count('tokens', n)`. Both do next to
+nothing when no profile is active. Stages may be nested: the `seconds` of a stage include the stages run inside it,
+its `self_seconds` do not.
+
+Only one profile is active at a time, and it only sees the process it was started in, not the workers of
+`homer.batch`.
+"""
+import json
+import time
+from collections import Counter
+
+_active = None
+
+
+class _Stage(object):
+    __slots__ = ('profile', 'name', 'start', 'children')
+
+    def __init__(self, profile, name):
+        self.profile = profile
+        self.name = name
+
+    def __enter__(self):
+        self.children = 0.0
+        self.profile._stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        stack = self.profile._stack
+        stack.pop()
+        if stack:
+            stack[-1].children += elapsed
+        stats = self.profile.stages.get(self.name)
+        if stats is None:
+            stats = self.profile.stages[self.name] = {'calls': 0, 'seconds': 0.0, 'self_seconds': 0.0}
+        stats['calls'] += 1
+        stats['seconds'] += elapsed
+        stats['self_seconds'] += elapsed - self.children
+        return False
+
+
+class _NoStage(object):
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NO_STAGE = _NoStage()
+
+
+class Profile(object):
+    """
+    Timings of the stages run and counters incremented while it is active. `stages` maps a stage name to its
+    `calls`, `seconds` and `self_seconds`, `counters` maps a counter name to its value.
+    """
+
+    def __init__(self):
+        self.stages = {}
+        self.counters = Counter()
+        self.seconds = 0.0
+        self._stack = []
+        self._start = None
+
+    def __enter__(self):
+        global _active
+        if _active is not None:
+            raise RuntimeError('A profile is already active.')
+        _active = self
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        global _active
+        self.seconds += time.perf_counter() - self._start
+        _active = None
+        return False
+
+    def report(self):
+        """The stages, slowest first, and counters as a dict of plain values."""
+        stages = sorted(self.stages.items(), key=lambda item: item[1]['seconds'], reverse=True)
+        return {
+            'seconds': self.seconds,
+            'stages': {name: dict(stats) for name, stats in stages},
+            'counters': dict(sorted(self.counters.items())),
+        }
+
+    def to_json(self):
+        return json.dumps(self.report(), indent=2)
+
+
+def profile():
+    """A new `Profile`, to be used as a context manager around the code to profile."""
+    return Profile()
+
+
+def active():
+    """The active `Profile`, or None."""
+    return _active
+
+
+def stage(name):
+    """Context manager timing the stage `name` in the active profile, if any."""
+    if _active is None:
+        return _NO_STAGE
+    return _Stage(_active, name)
+
+
+def count(name, n=1):
+    """Adds `n` to the counter `name` of the active profile, if any."""
+    if _active is not None:
+        _active.counters[name] += n
@@ -0,0 +1,63 @@
+"""
+Rankings of the words of a text: the most repeated ones and those with the most syllables.
+
+> most_repeated_words(article.token_counts, 20, exclude=['whale'])
+> words_with_most_syllables(article.token_counts, 10)
+
+Both start from the token counts an `Article` keeps, so nothing is tokenized again. Tokens are lowercased before
+anything else, so 'The' and 'the' are one word and both are stopwords. Stopwords and excluded words are dropped with
+one frozenset intersection, and the top `k` are picked with a heap rather than by sorting every word. Ties are broken
+alphabetically, so a ranking does not depend on the order words were first seen in.
+"""
+import heapq
+from homer import resources
+from homer.syllables import count_syllables
+from homer.vocabulary import VOCABULARY
+
+
+def top_k(scores, k):
+    """The `k` words with the highest score of `scores`, a dict of words to scores, ties alphabetically."""
+    if k <= 0 or not scores:
+        return []
+    # The k-th highest score, then only the words scoring at least that much are sorted.
+    threshold = heapq.nlargest(k, scores.values())[-1]
+    candidates = sorted((-score, word) for word, score in scores.items() if score >= threshold)
+    return [word for _, word in candidates[:k]]
+
+
+def _drop(scores, excluded):
+    for word in excluded.intersection(scores):
+        del scores[word]
+    return scores
+
+
+def _excluded(words):
+    return frozenset(word.strip().lower() for word in words)
+
+
+def most_repeated_words(token_counts, k=20, stopwords=None, exclude=()):
+    """
+    The `k` most repeated lowercased words of `token_counts`, a mapping of tokens to their frequency such as
+    `Article.token_counts`, leaving out `stopwords`, NLTK's English stopwords when None, and the words in `exclude`.
+    """
+    if stopwords is None:
+        stopwords = resources.STOPWORDS.get()
+    counts = {}
+    for token, freq in token_counts.items():
+        if token[0].isalpha():
+            word = token.lower()
+            counts[word] = counts.get(word, 0) + freq
+    _drop(counts, stopwords)
+    return top_k(_drop(counts, _excluded(exclude)), k)
+
+
+def words_with_most_syllables(token_counts, k=10, exclude=()):
+    """The `k` lowercased words of `token_counts` with the most syllables, leaving out the words in `exclude`."""
+    intern = VOCABULARY.intern
+    syllables = {}
+    for token in token_counts:
+        if token.isalpha():
+            word = token.lower()
+            if word not in syllables:
+                syllables[word] = VOCABULARY.syllables(intern(word), count_syllables)
+    return top_k(_drop(syllables, _excluded(exclude)), k)
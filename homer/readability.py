@@ -0,0 +1,143 @@
+"""
+Readability formulas computed from Homer's own tokens.
+
+textstat works on raw strings, so every call splits the text into sentences and words and syllabifies them from
+scratch. Here the counts a formula needs are collected once per sentence from the `Word` objects the analyzer has
+already built, and added up into paragraph and article totals. Every score is then a few arithmetic operations.
+
+Scores are close to, but not identical with, textstat's because sentences and words are whatever the NLTK tokenizers
+produced rather than textstat's regular expressions. On the texts in `tests/` they agree within `TOLERANCE` points,
+see `tests/test_readability.py` and `benchmarks/bench_readability.py`.
+"""
+import math
+from homer.constants import DALE_CHALL_EASY_WORDS
+
+# Maximum difference between a score computed here and the one textstat gives for the same text.
+TOLERANCE = {
+    'flesch_reading_ease': 5.0,
+    'flesch_kincaid_grade': 1.0,
+    'gunning_fog': 1.5,
+    'smog_index': 1.0,
+    'coleman_liau_index': 1.0,
+    # textstat counts punctuation as characters, Homer counts letters and digits only.
+    'automated_readability_index': 2.0,
+    'dale_chall_score': 1.0,
+}
+
+
+class ReadabilityCounts(object):
+    """
+    The raw counts behind the readability formulas. Counts of sentences, paragraphs and articles add up with `+`, and
+    are taken apart again with `-`.
+    """
+    __slots__ = ('sentences', 'words', 'syllables', 'letters', 'polysyllables', 'difficult_words')
+
+    def __init__(self, sentences=0, words=0, syllables=0, letters=0, polysyllables=0, difficult_words=0):
+        self.sentences = sentences
+        self.words = words
+        self.syllables = syllables
+        self.letters = letters
+        self.polysyllables = polysyllables
+        self.difficult_words = difficult_words
+
+    @classmethod
+    def from_words(cls, words):
+        """Counts of a single sentence made of `words`, an iterable of `Word` objects."""
+        counts = cls(sentences=1)
+        for word in words:
+            syllables = word.syllables
+            counts.words += 1
+            counts.syllables += syllables
+            counts.letters += len(word.word)
+            if syllables >= 3:
+                counts.polysyllables += 1
+            # Whatever its length, as in the Dale-Chall formula and textstat's score.
+            if word.word not in DALE_CHALL_EASY_WORDS:
+                counts.difficult_words += 1
+        return counts
+
+    @classmethod
+    def total(cls, iterable):
+        total = cls()
+        for counts in iterable:
+            total += counts
+        return total
+
+    def __iadd__(self, other):
+        for field in self.__slots__:
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+        return self
+
+    def __isub__(self, other):
+        for field in self.__slots__:
+            setattr(self, field, getattr(self, field) - getattr(other, field))
+        return self
+
+    def __add__(self, other):
+        total = ReadabilityCounts()
+        total += self
+        total += other
+        return total
+
+    def __sub__(self, other):
+        difference = ReadabilityCounts()
+        difference += self
+        difference -= other
+        return difference
+
+    def __eq__(self, other):
+        return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+
+    def __repr__(self):
+        return 'ReadabilityCounts(%s)' % ', '.join('%s=%r' % (field, getattr(self, field)) for field in self.__slots__)
+
+    @property
+    def words_per_sentence(self):
+        return self.words / self.sentences if self.sentences else 0.0
+
+    @property
+    def syllables_per_word(self):
+        return self.syllables / self.words if self.words else 0.0
+
+    def flesch_reading_ease(self):
+        if not self.words:
+            return 0.0
+        return 206.835 - 1.015 * self.words_per_sentence - 84.6 * self.syllables_per_word
+
+    def flesch_kincaid_grade(self):
+        if not self.words:
+            return 0.0
+        return 0.39 * self.words_per_sentence + 11.8 * self.syllables_per_word - 15.59
+
+    def gunning_fog(self):
+        if not self.words:
+            return 0.0
+        return 0.4 * (self.words_per_sentence + 100 * self.polysyllables / self.words)
+
+    def smog_index(self):
+        if not self.sentences:
+            return 0.0
+        return 1.043 * math.sqrt(30 * self.polysyllables / self.sentences) + 3.1291
+
+    def coleman_liau_index(self):
+        if not self.words:
+            return 0.0
+        return 0.058 * 100 * self.letters / self.words - 0.296 * 100 * self.sentences / self.words - 15.8
+
+    def automated_readability_index(self):
+        if not self.words:
+            return 0.0
+        return 4.71 * self.letters / self.words + 0.5 * self.words_per_sentence - 21.43
+
+    def dale_chall_score(self):
+        if not self.words:
+            return 0.0
+        percent_difficult_words = 100 * self.difficult_words / self.words
+        score = 0.1579 * percent_difficult_words + 0.0496 * self.words_per_sentence
+        if percent_difficult_words > 5:
+            score += 3.6365
+        return score
+
+    def scores(self):
+        """All the formulas above, keyed by name."""
+        return {name: getattr(self, name)() for name in TOLERANCE}
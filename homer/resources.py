@@ -0,0 +1,83 @@
+"""
+NLTK and the models and word lists Homer needs, each loaded once per process, the first time a stat needs it.
+
+Importing Homer does not import NLTK. Stats that need no stopwords never read them, and CMUdict is only parsed when a
+word's syllables are counted for the first time. Long-lived workers can call `warmup()` when they start, so that their
+first text is not slower than the rest, or `warmup(resources)` with only the resources their stats need.
+"""
+import threading
+from homer.profiling import stage
+
+_NOT_LOADED = object()
+
+
+class Resource(object):
+    """
+    A value made by `load()` the first time `get()` is called and shared by every caller afterwards. Loading it is
+    timed as the `load_<name>` stage of the active profile, if any.
+    """
+
+    def __init__(self, name, load):
+        self.name = name
+        self._load = load
+        self._value = _NOT_LOADED
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self):
+        return self._value is not _NOT_LOADED
+
+    def get(self):
+        value = self._value
+        if value is _NOT_LOADED:
+            with self._lock:
+                value = self._value
+                if value is _NOT_LOADED:
+                    with stage('load_' + self.name):
+                        value = self._value = self._load()
+        return value
+
+
+def _import_nltk():
+    import nltk
+    return nltk
+
+
+def _load_stopwords():
+    from nltk.corpus import stopwords
+    return frozenset(stopwords.words('english'))
+
+
+def _load_cmudict():
+    from nltk.corpus import cmudict
+    return {word: sum(1 for phoneme in pronunciations[0] if phoneme[-1].isdigit())
+            for word, pronunciations in cmudict.dict().items()}
+
+
+NLTK = Resource('nltk', _import_nltk)
+# English stopwords, as a frozenset.
+STOPWORDS = Resource('stopwords', _load_stopwords)
+# A dict from lowercased word to the syllables of its first pronunciation in CMUdict.
+CMUDICT = Resource('cmudict', _load_cmudict)
+
+RESOURCES = (NLTK, STOPWORDS, CMUDICT)
+
+
+def blankline_tokenize(text):
+    return NLTK.get().tokenize.blankline_tokenize(text)
+
+
+def sent_tokenize(text):
+    return NLTK.get().sent_tokenize(text)
+
+
+def word_tokenize(text):
+    return NLTK.get().word_tokenize(text)
+
+
+def warmup(resources=RESOURCES):
+    """Loads `resources`, every one by default, and with NLTK the punkt model it loads on its first tokenization."""
+    for resource in resources:
+        resource.get()
+    if NLTK in resources:
+        word_tokenize(' '.join(sent_tokenize('Homer is warming up. It reads a short text.')))
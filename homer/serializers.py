@@ -0,0 +1,207 @@
+"""
+Article and paragraph stats as JSON, NDJSON or CSV, for pipelines rather than people.
+
+> write_article(Article(name, author, text), sys.stdout, 'ndjson', fields=['total_words', 'flesch_reading_ease'])
+
+Every record is a dict of plain values. A field is only computed when it is asked for, so a record of word counts
+never counts syllables or looks up the lexicon. Nothing is colored or laid out in tables.
+
+- json: one document, `{"paragraphs": [...], "article": {...}}`.
+- ndjson: one line per paragraph, written as soon as the paragraph is analyzed, then a line for the article. Lines
+  carry a `type` of `paragraph` or `article`.
+- csv: one row per paragraph, then one for the article, numbered `article`. Columns of article fields that are not
+  paragraph fields, e.g. `reading_time`, are empty in paragraph rows.
+
+Fields can be named by their aliases, see `homer.metrics.ALIASES`, in paragraph records as well, which then have them
+under the name asked for.
+"""
+import csv
+import json
+from homer import metrics
+from homer.lexicon import COMPULSIVE_HEDGER, INTENSIFIER, VAGUE_WORD
+from homer.profiling import stage
+from homer.utils import FleschReading, DaleChall
+
+FORMATS = ('json', 'ndjson', 'csv')
+
+# Paragraph field name and how to compute it, in the order fields appear in a record. Article fields are the
+# metrics of `homer.metrics`.
+PARAGRAPH_FIELDS = [
+    ('sentences', lambda paragraph: len(paragraph)),
+    ('total_words', lambda paragraph: paragraph.total_words),
+    ('total_and_words', lambda paragraph: paragraph.total_and_words),
+    ('avg_words_per_sentence', lambda paragraph: paragraph.avg_words_per_sentence),
+    ('longest_sentence', lambda paragraph: str(paragraph.longest_sentence)),
+    ('len_of_longest_sentence', lambda paragraph: paragraph.len_of_longest_sentence),
+    ('flesch_reading_ease', lambda paragraph: FleschReading(counts=paragraph.readability_counts).score),
+    ('flesch_reading_grade', lambda paragraph: paragraph.get_flesch_reading_score()),
+    ('dale_chall_score', lambda paragraph: DaleChall(counts=paragraph.readability_counts).score),
+    ('dale_chall_grade', lambda paragraph: paragraph.get_dale_chall_reading_score()),
+    ('compulsive_hedgers', lambda paragraph: paragraph.total_lexicon_words(COMPULSIVE_HEDGER)),
+    ('intensifiers', lambda paragraph: paragraph.total_lexicon_words(INTENSIFIER)),
+    ('vague_words', lambda paragraph: paragraph.total_lexicon_words(VAGUE_WORD)),
+]
+
+
+def known_fields():
+    """Names of every article and paragraph field."""
+    article_fields = metrics.public_metrics() + list(metrics.ALIASES)
+    return article_fields + [name for name, _ in PARAGRAPH_FIELDS if name not in article_fields]
+
+
+def check_fields(names):
+    """Raises ValueError if `names` has a name that is neither an article nor a paragraph field."""
+    known = known_fields()
+    unknown = [name for name in names or () if name not in known]
+    if unknown:
+        raise ValueError('Unknown fields: %s. Known fields are: %s.' % (', '.join(unknown), ', '.join(known)))
+
+
+def article_fields(names=None):
+    """The article fields among `names`, or those of `homer.batch.summarize` when None."""
+    if names is None:
+        return list(metrics.SUMMARY)
+    return [name for name in names if name in metrics.ALIASES or name in metrics.METRICS]
+
+
+def article_record(article, fields=None):
+    """The `fields` of `article`, those of `homer.batch.summarize` when None, as a dict."""
+    return metrics.compute(article, article_fields(fields))
+
+
+def _paragraph_fields(fields):
+    """`(name, compute)` of the paragraph fields among `fields`, every one when None, under the names asked for."""
+    if fields is None:
+        return PARAGRAPH_FIELDS
+    return [(name, compute) for field, compute in PARAGRAPH_FIELDS
+            for name in fields if metrics.ALIASES.get(name, name) == field]
+
+
+def paragraph_record(number, paragraph, fields=None):
+    """The `fields` of `paragraph`, every paragraph field when None, as a dict. It always has the `number`."""
+    record = {'number': number}
+    record.update((name, compute(paragraph)) for name, compute in _paragraph_fields(fields))
+    return record
+
+
+def paragraph_columns(fields=None):
+    return ['number'] + [name for name, _ in _paragraph_fields(fields)]
+
+
+def columns(fields=None):
+    """The CSV columns of `fields`: the paragraph columns, then the article fields that are not among them."""
+    paragraph = paragraph_columns(fields)
+    return paragraph + [name for name in article_fields(fields) if name not in paragraph]
+
+
+def write_records(paragraphs, summary, out, format, fields=None):
+    """
+    Writes the records of `paragraphs`, an iterable of `Paragraph`s, and then of the article, as given by calling
+    `summary()` once the paragraphs are done, to the file object `out` in `format`.
+    """
+    records = (paragraph_record(number, paragraph, fields) for number, paragraph in enumerate(paragraphs, 1))
+    _write_records(records, summary, out, format, fields)
+
+
+def _write_records(records, summary, out, format, fields):
+    if format not in FORMATS:
+        raise ValueError('Unknown format %r, expected one of: %s.' % (format, ', '.join(FORMATS)))
+    check_fields(fields)
+    with stage('serialize'):
+        if format == 'json':
+            document = {'paragraphs': list(records)}
+            document['article'] = summary()
+            json.dump(document, out, indent=2)
+            out.write('\n')
+        elif format == 'ndjson':
+            for record in records:
+                out.write(json.dumps(dict(record, type='paragraph')) + '\n')
+                out.flush()
+            out.write(json.dumps(dict(summary(), type='article')) + '\n')
+        else:
+            writer = csv.DictWriter(out, columns(fields))
+            writer.writeheader()
+            for record in records:
+                writer.writerow(record)
+            writer.writerow(dict(summary(), number='article'))
+
+
+def write_article(article, out, format, fields=None):
+    """Writes the stats of `article` to the file object `out` in `format`."""
+    write_records(article.paragraphs, lambda: article_record(article, fields), out, format, fields)
+
+
+def write_document(document, out, format, fields=None):
+    """
+    Writes `document`, `{"paragraphs": [...], "article": {...}}` as given by `homer.client.Client.analyze`, to `out`
+    in `format`, as `write_article` writes the article it was computed from.
+    """
+    _write_records(iter(document['paragraphs']), lambda: document['article'], out, format, fields)
+
+
+def write_stream(article_stream, out, format, fields=None):
+    """
+    Writes the stats of a `homer.streaming.ArticleStream` to `out` in `format` while the stream is read. The article
+    record has the metrics of the stream, which must include the article fields among `fields`.
+    """
+    if fields is not None:
+        missing = [name for name in article_fields(fields) if name not in article_stream.metrics]
+        if missing:
+            raise ValueError('The stream does not compute: %s.' % ', '.join(missing))
+    write_records(article_stream, article_stream.summary, out, format, fields)
+
+
+def write_summaries(summaries, out, format, fields=None):
+    """
+    Writes `(path, summary)` pairs, as given by `homer.batch.analyze_files`, to `out` in `format`, one record per
+    file. Summaries of files that could not be analyzed only have an `error`.
+    """
+    if format not in FORMATS:
+        raise ValueError('Unknown format %r, expected one of: %s.' % (format, ', '.join(FORMATS)))
+    check_fields(fields)
+    columns = ['path'] + article_fields(fields) + ['error']
+    records = (dict([('path', path)] + [(column, summary[column]) for column in columns if column in summary])
+               for path, summary in summaries)
+    with stage('serialize'):
+        if format == 'json':
+            json.dump(list(records), out, indent=2)
+            out.write('\n')
+        elif format == 'ndjson':
+            for record in records:
+                out.write(json.dumps(record) + '\n')
+                out.flush()
+        else:
+            writer = csv.DictWriter(out, columns)
+            writer.writeheader()
+            for record in records:
+                writer.writerow(record)
+
+
+def write_comparison(comparison, out, format):
+    """
+    Writes a `homer.compare.Comparison` to `out` in `format`. NDJSON has a line per paragraph change, then one for the
+    article, and CSV a row per paragraph change with the stats before and after.
+    """
+    if format not in FORMATS:
+        raise ValueError('Unknown format %r, expected one of: %s.' % (format, ', '.join(FORMATS)))
+    document = comparison.to_dict()
+    with stage('serialize'):
+        if format == 'json':
+            json.dump(document, out, indent=2)
+            out.write('\n')
+        elif format == 'ndjson':
+            for change in document['paragraphs']:
+                out.write(json.dumps(dict(change, type='paragraph')) + '\n')
+            out.write(json.dumps({'type': 'article', 'metrics': document['article'],
+                                  'analyzed': document['analyzed']}) + '\n')
+        else:
+            fields = [name for name, _ in PARAGRAPH_FIELDS
+                      if any(name in (change.before or change.after) for change in comparison.changes)]
+            writer = csv.DictWriter(out, ['status', 'old', 'new'] + ['%s_%s' % (name, when) for name in fields
+                                                                    for when in ('before', 'after')])
+            writer.writeheader()
+            for change in comparison.changes:
+                row = {'status': change.status, 'old': change.old, 'new': change.new}
+                for when, record in (('before', change.before), ('after', change.after)):
+                    row.update(('%s_%s' % (name, when), value) for name, value in (record or {}).items())
+                writer.writerow(row)
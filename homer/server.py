@@ -0,0 +1,410 @@
+"""
+A long-running Homer that keeps NLTK, its models, CMUdict, the vocabulary and recent documents loaded in one process,
+and analyzes the texts it is sent over a Unix socket or localhost HTTP, answering with JSON.
+
+> python homer_cmd.py --serve                  # listens on homer.client.DEFAULT_SOCKET
+> python homer_cmd.py --serve --port 8765      # listens on http://127.0.0.1:8765
+
+- `POST /analyze` with `{"text": ..., "name": ..., "author": ..., "metrics": [...], "tokenizer": ...,
+  "lexicon": ..., "paragraphs": true, "findings": [...], "document": ...}`, where only `text` is required, answers
+  with the document `--format json` writes, `{"paragraphs": [...], "article": {...}}`, and the `findings` of the
+  kinds asked for, or of every kind for `"findings": true`. Texts sent with the same `document` id, e.g. the buffer
+  of an editor, are analyzed with `Article.update`, so only their changed paragraphs are tokenized again.
+- `POST /compare` with `{"old": ..., "new": ...}` answers with `homer.compare.Comparison.to_dict()`.
+- `GET /health` tells whether the server is up and what it has loaded.
+- `GET /metrics` counts requests and tells how long they took and how many are waiting.
+
+A `lexicon` is the path of a lexicon pack, see `homer.lexicon`, or `"default"` for Homer's own words. Requests
+without one use the server's. Since the server reads packs as the user it runs as, a request may only name the pack
+the server was started with, or a pack under its `lexicon_dir`, by a path relative to it or not. Packs are compiled
+once and compiled again when their file changes, so editing a pack takes effect without restarting the server.
+
+Connections are read by a thread each, and analyses run in a pool of `workers` threads. At most `max_pending`
+analyses wait for a worker; past that, requests are answered with 503 at once rather than queued without bound.
+
+Every token the server is sent is kept in `homer.vocabulary.VOCABULARY`. Once it holds more than `max_vocabulary`
+tokens, new analyses wait for the running ones to finish, and the vocabulary and the documents kept are cleared, so
+that a server which is sent ever new words, e.g. as they are typed, does not grow without bound.
+`homer.client` has a client, which `homer_cmd` uses when a server is running.
+"""
+import os
+import json
+import stat
+import time
+import errno
+import socket
+import threading
+import socketserver
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from homer import __version__, resources
+from homer.analyzer import Article, FINDINGS
+from homer.client import DEFAULT_SOCKET, BUILTIN_LEXICON
+from homer.compare import compare
+from homer.lexicon import DEFAULT_LEXICON, get_lexicon
+from homer.serializers import article_record, paragraph_record, check_fields
+from homer.tokenizers import get_tokenizer
+from homer.vocabulary import VOCABULARY
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_WORKERS = 4
+# How many documents analyzed incrementally are kept, the least recently sent are dropped first.
+MAX_DOCUMENTS = 64
+# How many tokens the vocabulary holds at most before it is cleared.
+MAX_VOCABULARY = 500000
+# Largest request body accepted, in bytes.
+MAX_BODY = 64 * 1024 * 1024
+# How many of the latest request durations the latency percentiles are computed from.
+LATENCY_WINDOW = 1000
+
+
+def _is_socket(path):
+    try:
+        return stat.S_ISSOCK(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return False
+
+
+def _remove_stale_socket(path):
+    """
+    Removes the socket at `path` if it was left behind by a server that did not shut down cleanly. Raises OSError if
+    something other than a socket is there, or if a server still listens on it.
+    """
+    if not os.path.lexists(path):
+        return
+    if not _is_socket(path):
+        raise FileExistsError(errno.EEXIST, 'Not a socket, refusing to replace it', path)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except ConnectionRefusedError:
+        os.remove(path)
+        return
+    finally:
+        sock.close()
+    raise OSError(errno.EADDRINUSE, 'A server is already listening', path)
+
+
+class Busy(RuntimeError):
+    """Raised when `max_pending` analyses already wait for a worker."""
+
+
+class Stats(object):
+    """Counts of the requests a server answered, and how long the latest took."""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.rejected = 0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self._lock = threading.Lock()
+
+    def add(self, seconds, status):
+        with self._lock:
+            self.requests += 1
+            if status == 503:
+                self.rejected += 1
+            elif status >= 400:
+                self.errors += 1
+            self.latencies.append(seconds)
+
+    def to_dict(self):
+        with self._lock:
+            latencies = sorted(self.latencies)
+            stats = {'requests': self.requests, 'errors': self.errors, 'rejected': self.rejected}
+        if latencies:
+            stats['latency_ms'] = {
+                'mean': round(1000 * sum(latencies) / len(latencies), 3),
+                'p50': round(1000 * latencies[len(latencies) // 2], 3),
+                'p95': round(1000 * latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 3),
+                'max': round(1000 * latencies[-1], 3),
+            }
+        return stats
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = 'Homer/' + __version__
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self._answer(self.server.homer.get, self.path)
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_BODY:
+            self.close_connection = True
+            self._send(413, {'error': 'Requests are limited to %s bytes.' % MAX_BODY})
+            return
+        body = self.rfile.read(length)
+        self._answer(self.server.homer.post, self.path, body)
+
+    def _answer(self, method, *args):
+        started = time.perf_counter()
+        status, document = method(*args)
+        self._send(status, document)
+        self.server.homer.stats.add(time.perf_counter() - started, status)
+
+    def _send(self, status, document):
+        data = json.dumps(document).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def address_string(self):
+        # Clients of a Unix socket have no address.
+        return self.client_address[0] if isinstance(self.client_address, tuple) else 'local'
+
+    def log_message(self, format, *args):
+        if self.server.homer.verbose:
+            super().log_message(format, *args)
+
+
+class _TCPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class AnalysisServer(object):
+    """
+    Serves analyses on `address`, the path of a Unix socket or a `(host, port)` pair, port 0 picking a free one.
+    `tokenizer` and `lexicon`, the path of a lexicon pack, are used by requests that do not name theirs, see
+    `homer.tokenizers` and `homer.lexicon`. Requests may name other packs only if they are under `lexicon_dir`. A
+    socket left behind by a server that is gone is replaced, while anything
+    else at its path, including the socket of a running server, raises OSError.
+
+    > with AnalysisServer(('127.0.0.1', 8765)) as server:
+    >     server.serve_forever()
+    """
+
+    def __init__(self, address=DEFAULT_SOCKET, workers=DEFAULT_WORKERS, max_pending=None, tokenizer=None,
+                 lexicon=None, lexicon_dir=None, max_documents=MAX_DOCUMENTS, max_vocabulary=MAX_VOCABULARY,
+                 verbose=False):
+        self.workers = workers
+        self.max_pending = 2 * workers if max_pending is None else max_pending
+        self.tokenizer = get_tokenizer(tokenizer)
+        # Kept as a path rather than compiled, so that every request sees the pack as it is now.
+        self.lexicon = lexicon
+        get_lexicon(lexicon)
+        self.lexicon_dir = None if lexicon_dir is None else os.path.realpath(lexicon_dir)
+        self.max_documents = max_documents
+        self.max_vocabulary = max_vocabulary
+        self.verbose = verbose
+        self.stats = Stats()
+        self.started = time.time()
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._slots = threading.BoundedSemaphore(workers + self.max_pending)
+        self._queued = 0
+        self._running = 0
+        self._lock = threading.Lock()
+        # Notified when no analysis runs any more.
+        self._idle = threading.Condition(self._lock)
+        # (document id, tokenizer name, lexicon fingerprint) -> [lock, Article or None], least recently used first.
+        self._documents = OrderedDict()
+        if isinstance(address, tuple):
+            self._server = _TCPServer(address, _Handler)
+        else:
+            directory = os.path.dirname(address)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            _remove_stale_socket(address)
+            self._server = _UnixServer(address, _Handler)
+            os.chmod(address, 0o600)
+        self._server.homer = self
+
+    @property
+    def address(self):
+        """The address the server listens on, with the port it got when asked for port 0."""
+        return self._server.server_address
+
+    @property
+    def url(self):
+        """The address as `homer.client.Client` takes it."""
+        if isinstance(self.address, tuple):
+            return 'http://%s:%s' % self.address[:2]
+        return 'unix:' + self.address
+
+    def warmup(self):
+        """Loads NLTK and every model, so that the first request is as quick as the rest."""
+        resources.warmup()
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def shutdown(self):
+        """Stops `serve_forever`, from another thread."""
+        self._server.shutdown()
+
+    def close(self):
+        self._server.server_close()
+        self._executor.shutdown(wait=False)
+        if not isinstance(self.address, tuple) and _is_socket(self.address):
+            os.remove(self.address)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def get(self, path):
+        """`(status, document)` answering `GET path`."""
+        if path == '/health':
+            return 200, self.health()
+        if path == '/metrics':
+            return 200, self.metrics()
+        return 404, {'error': 'Unknown path %s.' % path}
+
+    def post(self, path, body):
+        """`(status, document)` answering `POST path` with the JSON `body`."""
+        handlers = {'/analyze': self.analyze, '/compare': self.compare}
+        if path not in handlers:
+            return 404, {'error': 'Unknown path %s.' % path}
+        try:
+            request = json.loads(body.decode('utf-8'))
+            if not isinstance(request, dict):
+                raise ValueError('Expected a JSON object.')
+            return 200, self.submit(handlers[path], request)
+        except Busy:
+            return 503, {'error': 'Too many pending requests, try again later.'}
+        except ValueError as e:
+            return 400, {'error': str(e)}
+        except Exception as e:
+            return 500, {'error': '%s: %s' % (type(e).__name__, e)}
+
+    def submit(self, handler, request):
+        """Runs `handler(request)` in a worker, raising `Busy` if too many requests wait for one already."""
+        if not self._slots.acquire(blocking=False):
+            raise Busy()
+        with self._lock:
+            self._queued += 1
+        try:
+            return self._executor.submit(self._run, handler, request).result()
+        finally:
+            self._slots.release()
+
+    def _run(self, handler, request):
+        with self._idle:
+            self._queued -= 1
+            while len(VOCABULARY) > self.max_vocabulary and self._running:
+                self._idle.wait()
+            if len(VOCABULARY) > self.max_vocabulary:
+                # The articles kept hold vocabulary ids, and are analyzed anew when their documents are sent again.
+                self._documents.clear()
+                VOCABULARY.clear()
+            self._running += 1
+        try:
+            return handler(request)
+        finally:
+            with self._idle:
+                self._running -= 1
+                if not self._running:
+                    self._idle.notify_all()
+
+    def health(self):
+        return {
+            'status': 'ok',
+            'version': __version__,
+            'uptime': round(time.time() - self.started, 3),
+            'loaded': {resource.name: resource.loaded for resource in resources.RESOURCES},
+            'lexicon': get_lexicon(self.lexicon).name,
+        }
+
+    def metrics(self):
+        with self._lock:
+            queue = {'workers': self.workers, 'running': self._running, 'queued': self._queued,
+                     'max_pending': self.max_pending}
+            documents = len(self._documents)
+        return dict(self.stats.to_dict(), queue=queue, documents=documents, vocabulary=len(VOCABULARY))
+
+    def _document(self, document, tokenizer, lexicon):
+        """The `[lock, article]` entry of `document`, made if it is not kept."""
+        # A pack that changed makes a new entry, and the article is analyzed anew with the words of the new pack.
+        key = (document, tokenizer.name, lexicon.fingerprint)
+        with self._lock:
+            entry = self._documents.get(key)
+            if entry is None:
+                entry = self._documents[key] = [threading.Lock(), None]
+            self._documents.move_to_end(key)
+            while len(self._documents) > self.max_documents:
+                self._documents.popitem(last=False)
+        return entry
+
+    def analyze(self, request):
+        """The response to an `/analyze` request, see the module's docstring."""
+        text = _text(request, 'text')
+        name, author = request.get('name', ''), request.get('author', '')
+        fields = request.get('metrics')
+        check_fields(fields)
+        findings = request.get('findings')
+        tokenizer = get_tokenizer(request.get('tokenizer') or self.tokenizer)
+        lexicon = self._lexicon(request)
+        document = request.get('document')
+        if document is None:
+            return self._response(Article(name, author, text, tokenizer, lexicon), request, fields, findings)
+        entry = self._document(str(document), tokenizer, lexicon)
+        with entry[0]:
+            if entry[1] is None:
+                entry[1] = Article(name, author, text, tokenizer, lexicon)
+                analyzed = None
+            else:
+                entry[1].name, entry[1].author = name, author
+                analyzed = entry[1].update(text)
+            response = self._response(entry[1], request, fields, findings)
+        response['analyzed'] = entry[1].total_paragraphs if analyzed is None else analyzed
+        return response
+
+    def _lexicon(self, request):
+        lexicon = request.get('lexicon') or self.lexicon
+        if lexicon == BUILTIN_LEXICON:
+            return DEFAULT_LEXICON
+        if lexicon is not None:
+            lexicon = self._pack_path(lexicon)
+        try:
+            return get_lexicon(lexicon)
+        except OSError as e:
+            raise ValueError('Cannot read the lexicon: %s' % e)
+
+    def _pack_path(self, lexicon):
+        """The path of the pack `lexicon`, raising ValueError, before opening it, if requests may not name it."""
+        if not isinstance(lexicon, str):
+            raise ValueError('"lexicon" is the path of a lexicon pack.')
+        if self.lexicon is not None and os.path.realpath(lexicon) == os.path.realpath(self.lexicon):
+            return self.lexicon
+        if self.lexicon_dir is not None:
+            path = os.path.realpath(os.path.join(self.lexicon_dir, lexicon))
+            if os.path.commonpath([path, self.lexicon_dir]) == self.lexicon_dir:
+                return path
+        raise ValueError("Lexicon packs other than the server's are only read from its lexicon directory.")
+
+    @staticmethod
+    def _response(article, request, fields, findings):
+        response = {}
+        if request.get('paragraphs', True):
+            response['paragraphs'] = [paragraph_record(number, paragraph, fields)
+                                      for number, paragraph in enumerate(article.paragraphs, 1)]
+        response['article'] = article_record(article, fields)
+        if findings is not None:
+            kinds = FINDINGS if findings is True else findings
+            response['findings'] = [finding._asdict() for finding in article.find(kinds)]
+        return response
+
+    def compare(self, request):
+        """The response to a `/compare` request, see the module's docstring."""
+        comparison = compare(_text(request, 'old'), _text(request, 'new'), request.get('name', ''),
+                             request.get('author', ''), get_tokenizer(request.get('tokenizer') or self.tokenizer),
+                             lexicon=self._lexicon(request))
+        return comparison.to_dict()
+
+
+def _text(request, key):
+    text = request.get(key)
+    if not isinstance(text, str):
+        raise ValueError('"%s" is required, as a string.' % key)
+    return text
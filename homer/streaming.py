@@ -0,0 +1,134 @@
+"""
+Analyzes a text paragraph by paragraph while it is being read, for texts too large to hold in memory as an `Article`.
+
+> stream = ArticleStream('Moby Dick', 'Herman Melville', open('moby_dick.txt', encoding='utf-8'))
+> for paragraph in stream:
+>     print(len(paragraph), paragraph.get_flesch_reading_score())
+> print(stream.summary())
+
+The file is read in chunks and split on blank lines, the same way `Article` splits a text. Only the paragraph being
+analyzed is kept in memory. The article totals are updated as each paragraph is finished.
+"""
+import functools
+from collections import Counter
+from homer.analyzer import Article, Paragraph
+from homer.lexicon import LexiconReport, get_lexicon
+from homer.metrics import SUMMARY, compute, resolve
+from homer.tokenizers import BLANK_LINES, get_tokenizer
+from homer.readability import ReadabilityCounts
+from homer.vocabulary import VOCABULARY
+from homer.constants import WORDS_ONE_READS_PER_MINUTE
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+# Metrics that rank the words of the whole text, for which a stream counts every token.
+RANKINGS = ('ten_words_with_most_syllables', 'most_repeated_words')
+
+
+def iter_paragraphs(file_obj, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yields the paragraphs of the text read from `file_obj`, reading `chunk_size` characters at a time."""
+    return _split_paragraphs(iter(functools.partial(file_obj.read, chunk_size), ''))
+
+
+def _split_paragraphs(chunks):
+    pending = ''
+    for chunk in chunks:
+        text = pending + chunk
+        start = 0
+        # Only trailing whitespace of what is pending can be part of a separator, no need to scan the rest again.
+        for separator in BLANK_LINES.finditer(text, len(pending.rstrip())):
+            # A separator at the end of what has been read so far may go on in the next chunk.
+            if separator.end() == len(text):
+                break
+            if separator.start() > start:
+                yield text[start:separator.start()]
+            start = separator.end()
+        pending = text[start:]
+    for paragraph in BLANK_LINES.split(pending):
+        if paragraph:
+            yield paragraph
+
+
+class ArticleStream(object):
+    """
+    Iterating over it yields the `Paragraph`s of the text in `file_obj` and keeps running article totals. Once it
+    has been iterated over, `summary()` gives the same stats `homer.batch.summarize` gives for an `Article`, or the
+    `metrics` asked for (see `homer.metrics`). Only what these need is added up for every paragraph, so a stream
+    asked for `total_words` counts no syllables. `tokenizer` and `lexicon` are those of `Paragraph`.
+    """
+
+    def __init__(self, name, author, file_obj, chunk_size=DEFAULT_CHUNK_SIZE, tokenizer=None, lexicon=None,
+                 metrics=None):
+        self.name = name
+        self.author = author
+        self.file_obj = file_obj
+        self.chunk_size = chunk_size
+        self.tokenizer = get_tokenizer(tokenizer)
+        self.lexicon = get_lexicon(lexicon)
+        self.metrics = list(SUMMARY if metrics is None else metrics)
+        required = {metric.name for metric in resolve(self.metrics)}
+        self._adds_readability_counts = 'readability_counts' in required
+        self._adds_lexicon_report = 'lexicon_report' in required
+        self._adds_token_counts = any(name in required for name in RANKINGS)
+        self.total_paragraphs = 0
+        self.total_sentences = 0
+        self.total_words = 0
+        self.total_and_words = 0
+        self.len_of_longest_paragraph = 0
+        self.longest_sentence = None
+        self.readability_counts = ReadabilityCounts()
+        self._lexicon_report = LexiconReport()
+        self._token_id_counts = Counter()
+
+    def __iter__(self):
+        # Dashes are replaced before the text is split, as `Article` replaces them, so that both find the same
+        # paragraphs.
+        read = functools.partial(self.file_obj.read, self.chunk_size)
+        chunks = (chunk.replace('—', ' ') for chunk in iter(read, ''))
+        for text in _split_paragraphs(chunks):
+            paragraph = Paragraph(text, self.tokenizer, lexicon=self.lexicon)
+            self.add(paragraph)
+            yield paragraph
+
+    def add(self, paragraph):
+        index = self.total_paragraphs
+        self.total_paragraphs += 1
+        self.total_sentences += len(paragraph)
+        self.total_words += paragraph.total_words
+        self.total_and_words += paragraph.total_and_words
+        self.len_of_longest_paragraph = max(self.len_of_longest_paragraph, len(paragraph))
+        if self.longest_sentence is None or paragraph.len_of_longest_sentence > len(self.longest_sentence):
+            self.longest_sentence = paragraph.longest_sentence
+        if self._adds_readability_counts:
+            self.readability_counts += paragraph.readability_counts
+        if self._adds_lexicon_report:
+            for sentence_index, sentence in enumerate(paragraph.sentences):
+                for category, matches in sentence.lexicon_matches.items():
+                    for word, word_index in matches:
+                        self._lexicon_report.add(category, word, index, sentence_index, word_index)
+        if self._adds_token_counts:
+            self._token_id_counts.update(paragraph.buffer)
+
+    @property
+    def reading_time(self):
+        return self.total_words / WORDS_ONE_READS_PER_MINUTE
+
+    avg_sentences_per_para = Article.avg_sentences_per_para
+    avg_words_per_sentence = Article.avg_words_per_sentence
+    len_of_longest_sentence = Article.len_of_longest_sentence
+    get_and_frequency = Article.get_and_frequency
+    ten_words_with_most_syllables = Article.ten_words_with_most_syllables
+    words_with_most_syllables = Article.words_with_most_syllables
+    get_n_most_repeated_words = Article.get_n_most_repeated_words
+
+    def get_lexicon_report(self):
+        return self._lexicon_report
+
+    @property
+    def token_counts(self):
+        """Frequency of every token read so far, kept only when the metrics of the stream rank words."""
+        strings = VOCABULARY.strings
+        return Counter({strings[token_id]: freq for token_id, freq in self._token_id_counts.items()})
+
+    def summary(self):
+        """The values of the metrics of the stream, keyed by name, for the paragraphs read so far."""
+        return compute(self, self.metrics)
@@ -0,0 +1,51 @@
+"""
+Syllable counting shared by the readability scores and the syllable ranking.
+
+Syllables are looked up in the CMU pronouncing dictionary. The dictionary is parsed once per process, the first time
+a syllable count is needed (see `homer.resources`), and only the syllable count of each word's first pronunciation is
+kept. Words that are not in the dictionary get a rule-based estimate instead of being dropped.
+"""
+import re
+from homer.profiling import count
+from homer.resources import CMUDICT
+
+_VOWEL_GROUPS = re.compile(r'[aeiouy]+')
+# Vowel pairs that are usually pronounced as two syllables, e.g. 'being', 'poet', 'indian'.
+_HIATUS = re.compile(r'[aeiouy]ing|[aeo]ic|oet|oya|(?<![cgstx])i[ao]|iu|eo|u[ao]')
+# A final 'e', 'es' or 'ed' after a consonant is usually silent, e.g. 'make', 'loves', 'jumped', unless it follows
+# the consonants listed here, e.g. 'table', 'boxes', 'wanted'.
+_SILENT_E = re.compile(r'[^aeiouy]e$')
+_SILENT_ES = re.compile(r'[^aeiouy]es$')
+_SILENT_ED = re.compile(r'[^aeiouy]ed$')
+_SOUNDED_LE = re.compile(r'[^aeiouy]les?$')
+_SOUNDED_ES = re.compile(r'(?:[sxz]|[cs]h|[cg])es$')
+_SOUNDED_ED = re.compile(r'[td]ed$')
+
+
+def get_index():
+    """The CMUdict syllable index, a dict from lowercased word to syllable count. Loaded on first use."""
+    return CMUDICT.get()
+
+
+def estimate_syllables(word):
+    """Estimates syllables of a lowercased word that is not in CMUdict by counting its vowel groups."""
+    count = len(_VOWEL_GROUPS.findall(word)) + len(_HIATUS.findall(word))
+    if count > 1:
+        if _SILENT_E.search(word) and not _SOUNDED_LE.search(word):
+            count -= 1
+        elif _SILENT_ES.search(word) and not _SOUNDED_ES.search(word) and not _SOUNDED_LE.search(word):
+            count -= 1
+        elif _SILENT_ED.search(word) and not _SOUNDED_ED.search(word):
+            count -= 1
+    return max(count, 1)
+
+
+def count_syllables(word):
+    """Syllables in a lowercased word, from CMUdict if it knows the word and estimated otherwise."""
+    try:
+        syllables = get_index()[word]
+    except KeyError:
+        count('syllables_estimated')
+        return estimate_syllables(word)
+    count('syllables_from_cmudict')
+    return syllables
@@ -1,12 +1,19 @@
-import textstat
+from homer.profiling import stage
 
 
 class FleschReading(object):
     """
     https://en.wikipedia.org/wiki/Flesch%E2%80%93Kincaid_readability_tests#Flesch_reading_ease
     """
-    def __init__(self, text):
-        self.score = textstat.flesch_reading_ease(text)
+    def __init__(self, text=None, counts=None):
+        """Scores `counts`, a `homer.readability.ReadabilityCounts`, when given. Otherwise asks textstat to score
+        the raw `text`."""
+        if counts is not None:
+            self.score = counts.flesch_reading_ease()
+        else:
+            import textstat
+            with stage('textstat'):
+                self.score = textstat.flesch_reading_ease(text)
         self.difficulty_threshold = 60
 
     def is_difficult(self):
@@ -34,8 +41,16 @@ class DaleChall(object):
     https://en.wikipedia.org/wiki/Dale%E2%80%93Chall_readability_formula
     """
 
-    def __init__(self, text):
-        self.score = round(textstat.dale_chall_readability_score(text), 1)
+    def __init__(self, text=None, counts=None):
+        """Scores `counts`, a `homer.readability.ReadabilityCounts`, when given. Otherwise asks textstat to score
+        the raw `text`."""
+        if counts is not None:
+            score = counts.dale_chall_score()
+        else:
+            import textstat
+            with stage('textstat'):
+                score = textstat.dale_chall_readability_score(text)
+        self.score = round(score, 1)
 
     def grade(self):
         if self.score <= 4.9:
@@ -0,0 +1,101 @@
+"""
+Interned tokens, shared by every text analyzed in a process.
+
+Every distinct token gets a small integer id the first time it is seen. Sentences store ids in `array('I')` buffers
+rather than strings or `Word` objects, and per token facts (is it a word, is it 'and', its lowercased form, its
+syllables) are kept once per id in compact arrays.
+
+Tokens are kept until `Vocabulary.clear`, so a process that goes on analyzing new texts, e.g. `homer.server`, clears
+the vocabulary once it grows past a bound, at a moment when it holds no analyzed text.
+"""
+import threading
+from array import array
+from homer.profiling import count as count_in_profile
+
+# Bits of `Vocabulary.flags`.
+IS_WORD = 1
+IS_AND = 2
+
+
+class Vocabulary(object):
+    """
+    Maps tokens to ids and back, and keeps per token flags, the id of the lowercased token and cached syllable counts.
+    """
+
+    def __init__(self):
+        self._ids = {}
+        self.strings = []
+        self.flags = bytearray()
+        self.normalized = array('I')
+        # Syllable count plus one, zero when not counted yet.
+        self._syllables = bytearray()
+        # Bumped by `clear`, so that what was built from the ids handed out before can tell it is stale.
+        self.generation = 0
+        self._on_clear = []
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.strings)
+
+    def id_of(self, token):
+        """Id of `token`, or None when it has not been seen."""
+        return self._ids.get(token)
+
+    def intern(self, token):
+        """Id of `token`, adding it to the vocabulary if needed."""
+        token_id = self._ids.get(token)
+        if token_id is None:
+            with self._lock:
+                token_id = self._ids.get(token)
+                if token_id is None:
+                    token_id = self._add(token)
+        return token_id
+
+    def _add(self, token):
+        normalized = token.strip().lower()
+        normalized_id = None
+        if normalized != token:
+            normalized_id = self._ids.get(normalized)
+            if normalized_id is None:
+                normalized_id = self._add(normalized)
+        token_id = len(self.strings)
+        is_word = token.isalpha() or token.isdigit()
+        self.strings.append(token)
+        self.flags.append((IS_WORD if is_word else 0) | (IS_AND if normalized == 'and' else 0))
+        self._syllables.append(0)
+        self.normalized.append(token_id if normalized_id is None else normalized_id)
+        # Published last: `intern` and `id_of` look ids up without the lock, and must only find complete entries.
+        self._ids[token] = token_id
+        return token_id
+
+    def clear(self):
+        """
+        Forgets every token, freeing the memory they take. The ids handed out before, and the sentences and `Word`s
+        holding them, are no longer valid, so only clear a vocabulary while no text is analyzed and none is kept.
+        """
+        with self._lock:
+            self._ids = {}
+            self.strings = []
+            self.flags = bytearray()
+            self.normalized = array('I')
+            self._syllables = bytearray()
+            self.generation += 1
+        for callback in self._on_clear:
+            callback()
+
+    def on_clear(self, callback):
+        """Calls `callback()` after every `clear`, e.g. to drop a cache keyed by id."""
+        self._on_clear.append(callback)
+
+    def syllables(self, token_id, count):
+        """Syllables of the token with `token_id`, counted with `count(token)` the first time only."""
+        syllables = self._syllables[token_id]
+        if syllables:
+            count_in_profile('syllable_cache_hits')
+        else:
+            syllables = min(count(self.strings[token_id]), 254) + 1
+            self._syllables[token_id] = syllables
+        return syllables - 1
+
+
+VOCABULARY = Vocabulary()
@@ -101,6 +101,12 @@ setup(
         'terminaltables==3.1.0',
         'textstat==0.5.6',
     ],
+    extras_require={
+        # homer.corpus
+        'corpus': ['numpy'],
+        # YAML lexicon packs, see homer.lexicon
+        'yaml': ['PyYAML'],
+    },
     setup_requires=['nltk==3.4.1'],
     cmdclass={'install': install}
 )
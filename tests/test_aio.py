@@ -0,0 +1,115 @@
+import asyncio
+import threading
+import unittest
+from unittest import mock
+from homer import aio, analyzer, batch
+from homer.aio import AsyncAnalyzer, analyze_async
+
+
+class TestAsyncAnalysis(unittest.TestCase):
+
+    def setUp(self):
+        self.text = open('moby_dick.txt').read()
+
+    def test_analyze(self):
+        analysis = asyncio.run(analyze_async(self.text, 'Moby Dick', 'Herman Melville'))
+        self.assertTrue(analysis.complete)
+        expected = batch.summarize(analyzer.Article('Moby Dick', 'Herman Melville', self.text))
+        self.assertEqual(expected, analysis.summary)
+
+    def test_timeout_returns_paragraphs_analyzed_so_far(self):
+        text = '\n\n'.join([self.text] * 50)
+
+        async def run():
+            async with AsyncAnalyzer(workers=1) as async_analyzer:
+                return await async_analyzer.analyze(text, timeout=0.05)
+        analysis = asyncio.run(run())
+        self.assertFalse(analysis.complete)
+        total_paragraphs = 50 * len(analyzer.Article('', '', self.text).paragraphs)
+        self.assertLess(analysis.article.total_paragraphs, total_paragraphs)
+        self.assertIsNone(analysis.summary)
+
+    def test_timeout_while_every_worker_is_busy(self):
+        release = threading.Event()
+
+        def analyze(*args):
+            release.wait(5)
+            return 'done'
+
+        async def run():
+            async with AsyncAnalyzer(workers=1) as async_analyzer:
+                busy = asyncio.ensure_future(async_analyzer.analyze(self.text))
+                await asyncio.sleep(0.05)
+                loop = asyncio.get_running_loop()
+                start = loop.time()
+                analysis = await async_analyzer.analyze(self.text, 'Moby Dick', timeout=0.05)
+                elapsed = loop.time() - start
+                release.set()
+                await busy
+                # The dropped analysis gave its slot back.
+                self.assertEqual(async_analyzer.max_pending, async_analyzer._slots._value)
+                return analysis, elapsed
+        with mock.patch('homer.aio.analyze', analyze):
+            analysis, elapsed = asyncio.run(run())
+        self.assertLess(elapsed, 1)
+        self.assertEqual((0, None, False), (analysis.article.total_paragraphs, analysis.summary, analysis.complete))
+        self.assertEqual('Moby Dick', analysis.article.name)
+
+    def test_nothing_is_summarized_once_stopped(self):
+        # Set once the first paragraph is analyzed.
+        stop = mock.Mock()
+        stop.is_set.side_effect = lambda: stop.is_set.call_count > 1
+        with mock.patch('homer.aio.summarize') as summarize:
+            analysis = aio.analyze(self.text, stop=stop)
+        summarize.assert_not_called()
+        self.assertEqual((1, None, False), (analysis.article.total_paragraphs, analysis.summary, analysis.complete))
+
+    def test_cancel(self):
+        text = '\n\n'.join([self.text] * 50)
+
+        async def run():
+            async with AsyncAnalyzer(workers=1, max_pending=1) as async_analyzer:
+                task = asyncio.ensure_future(async_analyzer.analyze(text))
+                waiting = asyncio.ensure_future(async_analyzer.analyze(self.text))
+                await asyncio.sleep(0.05)
+                task.cancel()
+                with self.assertRaises(asyncio.CancelledError):
+                    await task
+                # The slot of the cancelled analysis is free again, and the worker is no longer busy with it.
+                return await asyncio.wait_for(waiting, timeout=5)
+        self.assertTrue(asyncio.run(run()).complete)
+
+    def test_slots_are_held_until_the_thread_is_done(self):
+        lock = threading.Lock()
+        release = threading.Event()
+        # Analyses running now, and the most that ran at once.
+        running = [0, 0]
+
+        def analyze(*args):
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            release.wait(5)
+            with lock:
+                running[0] -= 1
+            return 'done'
+
+        async def run():
+            async with AsyncAnalyzer(workers=4, max_pending=1) as async_analyzer:
+                task = asyncio.ensure_future(async_analyzer.analyze(self.text))
+                await asyncio.sleep(0.05)
+                task.cancel()
+                with self.assertRaises(asyncio.CancelledError):
+                    await task
+                waiting = asyncio.ensure_future(async_analyzer.analyze(self.text))
+                await asyncio.sleep(0.05)
+                self.assertFalse(waiting.done())
+                release.set()
+                return await asyncio.wait_for(waiting, timeout=5)
+        with mock.patch('homer.aio.analyze', analyze):
+            self.assertEqual('done', asyncio.run(run()))
+        self.assertEqual(1, running[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import os
+import pickle
+import unittest
+from homer import analyzer, batch, resources
+
+
+class TestBatch(unittest.TestCase):
+
+    def test_expand_paths(self):
+        self.assertEqual(['moby_dick.txt', 'python_paradox.txt', 'stats.txt'],
+                         [os.path.basename(path) for path in batch.expand_paths(['.'])])
+        self.assertEqual(['./stats.txt'], batch.expand_paths(['./st*.txt']))
+        self.assertEqual(['stats.txt'], batch.expand_paths(['stats.txt', 'stats.txt']))
+
+    def test_analyze_files(self):
+        paths = ['moby_dick.txt', 'stats.txt']
+        results = dict(batch.analyze_files(paths, author='homer', workers=2))
+        self.assertEqual(set(paths), set(results))
+        for path in paths:
+            article = analyzer.Article(path, 'homer', open(path).read())
+            self.assertEqual(batch.summarize(article), results[path])
+
+    def test_needed_resources(self):
+        self.assertEqual([resources.NLTK, resources.CMUDICT], batch.needed_resources())
+        self.assertEqual([resources.NLTK, resources.STOPWORDS], batch.needed_resources(['most_repeated_words']))
+        self.assertEqual([resources.NLTK], batch.needed_resources(['reading_time']))
+        self.assertEqual([], batch.needed_resources(['reading_time'], tokenizer='regex'))
+        self.assertEqual([resources.CMUDICT], batch.needed_resources(['flesch'], tokenizer='regex'))
+        self.assertEqual([], batch.needed_resources(['name', 'total_paragraphs']))
+
+    def test_summary_is_picklable(self):
+        summary = batch.analyze_file('stats.txt')
+        self.assertEqual(summary, pickle.loads(pickle.dumps(summary)))
+        self.assertEqual(156, summary['total_words'])
+
+    def test_missing_file(self):
+        self.assertIn('error', batch.analyze_file('missing.txt'))
+
+
+if __name__ == "__main__":
+    unittest.main()
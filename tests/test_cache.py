@@ -0,0 +1,117 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+import contextlib
+from homer import analyzer, batch
+from homer.cache import AnalysisCache, CachedArticle
+from homer.cmdline_printer import ArticlePrinter
+from homer.lexicon import Lexicon
+from homer.serializers import write_article
+
+
+def printed(article):
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        printer = ArticlePrinter(article)
+        printer.print_article_stats()
+        printer.print_paragraph_stats()
+    return output.getvalue()
+
+
+class TestAnalysisCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'cache.sqlite')
+        self.text = open('moby_dick.txt').read()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_hit_prints_the_same_stats(self):
+        with AnalysisCache(self.path) as cache:
+            article = cache.article('Moby Dick', 'Herman Melville', self.text)
+            self.assertIsInstance(article, analyzer.Article)
+        with AnalysisCache(self.path) as cache:
+            cached = cache.article('Moby Dick', 'Herman Melville', self.text)
+        self.assertIsInstance(cached, CachedArticle)
+        self.assertEqual(printed(article), printed(cached))
+        self.assertEqual(article.get_readability_scores(), cached.get_readability_scores())
+        self.assertEqual([str(word) for word in article.get_vague_words()],
+                         [str(word) for word in cached.get_vague_words()])
+
+    def test_structured_output_of_a_hit(self):
+        expected = {}
+        for output_format in ('json', 'csv'):
+            output = io.StringIO()
+            write_article(analyzer.Article('Moby Dick', 'Herman Melville', self.text), output, output_format)
+            expected[output_format] = output.getvalue()
+        for _ in range(2):
+            for output_format in ('json', 'csv'):
+                with AnalysisCache(self.path) as cache:
+                    output = io.StringIO()
+                    write_article(cache.article('Moby Dick', 'Herman Melville', self.text), output, output_format)
+                self.assertEqual(expected[output_format], output.getvalue())
+
+    def test_summary(self):
+        with AnalysisCache(self.path) as cache:
+            expected = batch.summarize(analyzer.Article('Moby Dick', 'Herman Melville', self.text))
+            self.assertEqual(expected, cache.summary('Moby Dick', 'Herman Melville', self.text))
+            self.assertEqual(expected, cache.summary('Moby Dick', 'Herman Melville', self.text))
+            self.assertEqual(1, len(cache))
+
+    def test_summary_only_computes_metrics_asked_for(self):
+        article = analyzer.Article('Moby Dick', 'Herman Melville', self.text)
+        with AnalysisCache(self.path) as cache:
+            self.assertEqual(batch.summarize(article, ['name', 'total_words']),
+                             cache.summary('Moby Dick', 'Herman Melville', self.text, ['name', 'total_words']))
+            self.assertEqual({'metrics': {'total_words': article.total_words}}, cache.get_record(self.text))
+            self.assertEqual(batch.summarize(article, ['total_words', 'flesch']),
+                             cache.summary('', '', self.text, ['total_words', 'flesch']))
+            self.assertEqual(['total_words', 'flesch'], list(cache.get_record(self.text)['metrics']))
+            self.assertIsInstance(cache.article('', '', self.text), analyzer.Article)
+            self.assertIsInstance(cache.article('', '', self.text), CachedArticle)
+            self.assertEqual(batch.summarize(article), cache.summary('Moby Dick', 'Herman Melville', self.text))
+
+    def test_key_depends_on_text_and_lexicon(self):
+        with AnalysisCache(self.path) as cache:
+            custom = AnalysisCache(self.path, lexicon=Lexicon(intensifiers=['whale']))
+            self.assertNotEqual(cache.key(self.text), cache.key(self.text + ' '))
+            self.assertNotEqual(cache.key(self.text), custom.key(self.text))
+            custom.close()
+
+    def test_hit_keeps_the_words_of_its_lexicon(self):
+        lexicon = Lexicon(vague_words=['ocean', 'whale'])
+        text = 'The ocean was calm. The whale swam in the ocean.'
+        for _ in range(2):
+            with AnalysisCache(self.path, lexicon=lexicon) as cache:
+                article = cache.article('', '', text)
+                self.assertEqual(['ocean', 'whale', 'ocean'], [str(word) for word in article.get_vague_words()])
+                self.assertTrue(all(word.is_vague_word() for word in article.get_vague_words()))
+        self.assertIsInstance(article, CachedArticle)
+
+    def test_least_recently_used_are_evicted(self):
+        texts = ['The whale number %d swam. It was very big.' % number for number in range(3)]
+        with AnalysisCache(self.path) as cache:
+            cache.summary('', '', texts[0])
+            size = cache.size
+        # Room for two of the entries, which are about the same size.
+        with AnalysisCache(self.path, max_bytes=size * 5 // 2) as cache:
+            cache.summary('', '', texts[1])
+            cache.get_record(texts[0])
+            cache.summary('', '', texts[2])
+            self.assertEqual(2, len(cache))
+            self.assertIsNotNone(cache.get_record(texts[0]))
+            self.assertIsNone(cache.get_record(texts[1]))
+            self.assertIsNotNone(cache.get_record(texts[2]))
+
+    def test_analyze_files_with_cache(self):
+        summary = batch.analyze_file('stats.txt', cache_path=self.path)
+        self.assertEqual(summary, batch.analyze_file('stats.txt', cache_path=self.path))
+        self.assertEqual(batch.analyze_file('stats.txt'), summary)
+
+
+if __name__ == "__main__":
+    unittest.main()
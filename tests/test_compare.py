@@ -0,0 +1,58 @@
+import io
+import json
+import unittest
+from homer.analyzer import Article
+from homer.compare import compare, ADDED, REMOVED, CHANGED, MOVED
+from homer.metrics import compute
+from homer.serializers import write_comparison
+
+
+class TestCompare(unittest.TestCase):
+
+    def setUp(self):
+        self.text = open('moby_dick.txt').read()
+        self.paragraphs = self.text.split('\n\n')
+
+    def test_same_text(self):
+        comparison = compare(self.text, self.text)
+        self.assertEqual([], comparison.changes)
+        self.assertEqual(0, comparison.analyzed)
+        self.assertFalse(any(comparison.deltas.values()))
+        self.assertFalse(comparison.easier_to_read)
+
+    def test_matches_two_analyses(self):
+        new_text = self.text.replace('Call me Ishmael', 'Call me Ahab, perhaps')
+        comparison = compare(self.text, new_text)
+        self.assertEqual(1, comparison.analyzed)
+        self.assertEqual(compute(Article('', '', self.text), comparison.before), comparison.before)
+        self.assertEqual(compute(Article('', '', new_text), comparison.after), comparison.after)
+        [change] = comparison.changes
+        self.assertEqual((CHANGED, 1, 1), change[:3])
+        self.assertEqual(1, change.deltas['compulsive_hedgers'])
+
+    def test_added_removed_and_moved(self):
+        paragraphs = self.paragraphs
+        new_text = '\n\n'.join([paragraphs[0], paragraphs[2], paragraphs[1]] + paragraphs[3:-1] +
+                               ['A new closing paragraph. It is very short.'])
+        comparison = compare(self.text, new_text)
+        self.assertEqual(1, comparison.analyzed)
+        self.assertEqual([(MOVED, 3, 2), (ADDED, None, 10), (REMOVED, 10, None)],
+                         [change[:3] for change in comparison.changes])
+        self.assertEqual({}, comparison.changes[1].deltas)
+        self.assertEqual(comparison.changes[1].after['sentences'] - comparison.changes[2].before['sentences'],
+                         comparison.deltas['total_sentences'])
+
+    def test_write_comparison(self):
+        comparison = compare(self.text, self.text.replace('Call me Ishmael', 'Call me Ahab, perhaps'))
+        out = io.StringIO()
+        write_comparison(comparison, out, 'json')
+        document = json.loads(out.getvalue())
+        self.assertEqual(CHANGED, document['paragraphs'][0]['status'])
+        self.assertEqual(comparison.deltas['total_words'], document['article']['total_words']['delta'])
+        out = io.StringIO()
+        write_comparison(comparison, out, 'csv')
+        self.assertEqual(2, len(out.getvalue().splitlines()))
+
+
+if __name__ == "__main__":
+    unittest.main()
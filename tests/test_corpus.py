@@ -0,0 +1,65 @@
+import unittest
+from homer import analyzer, corpus
+from homer.corpus import SENTENCES, PARAGRAPHS
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class TestCorpus(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.articles = [
+            analyzer.Article('Moby Dick', 'Herman Melville', open('moby_dick.txt').read()),
+            analyzer.Article('Stats', 'homer', open('stats.txt').read()),
+            analyzer.Article('The Python Paradox', 'Paul Graham', open('python_paradox.txt').read()),
+        ]
+        cls.corpus = corpus.Corpus(cls.articles)
+
+    def test_columns(self):
+        total_sentences = sum(article.total_sentences for article in self.articles)
+        self.assertEqual(total_sentences, len(self.corpus.column(SENTENCES, 'words')))
+        self.assertEqual(sum(article.total_words for article in self.articles),
+                         self.corpus.column(SENTENCES, 'words').sum())
+        self.assertEqual(sum(article.total_paragraphs for article in self.articles),
+                         len(self.corpus.column(PARAGRAPHS, 'flesch_reading_ease')))
+        self.assertEqual(sum(len(article.get_vague_words()) for article in self.articles),
+                         self.corpus.column(PARAGRAPHS, 'vague_words').sum())
+        with self.assertRaises(ValueError):
+            self.corpus.column(SENTENCES, 'nope')
+
+    def test_percentiles_and_histogram(self):
+        words = sorted(len(sentence) for article in self.articles for paragraph in article.paragraphs
+                       for sentence in paragraph.sentences)
+        percentiles = self.corpus.percentiles(SENTENCES, 'words', [0, 100])
+        self.assertEqual({0: words[0], 100: words[-1]}, percentiles)
+        counts, edges = self.corpus.histogram(SENTENCES, 'words', bins=5)
+        self.assertEqual(len(words), counts.sum())
+        self.assertEqual(6, len(edges))
+        self.assertEqual(len(words), self.corpus.describe(SENTENCES, 'words')['count'])
+
+    def test_by_author(self):
+        totals = self.corpus.by_author(SENTENCES, 'words', 'sum')
+        self.assertEqual({article.author: article.total_words for article in self.articles}, totals)
+        means = self.corpus.by_author(PARAGRAPHS, 'sentences', 'mean')
+        self.assertAlmostEqual(self.articles[1].avg_sentences_per_para, means['homer'])
+        medians = self.corpus.by_author(SENTENCES, 'words', 'median')
+        self.assertEqual(set(totals), set(medians))
+        with self.assertRaises(ValueError):
+            self.corpus.by_author(SENTENCES, 'words', 'mode')
+
+    def test_outliers(self):
+        outliers = self.corpus.outliers(SENTENCES, 'words')
+        self.assertTrue(outliers)
+        longest = max((article for article in self.articles), key=lambda article: article.len_of_longest_sentence)
+        self.assertEqual(longest.name, outliers[0]['name'])
+        self.assertEqual(longest.len_of_longest_sentence, outliers[0]['words'])
+        self.assertEqual(['name', 'author', 'paragraph', 'sentence', 'words'], list(outliers[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+import os
+import json
+import pickle
+import tempfile
+import unittest
+from homer import analyzer
+from homer.cache import AnalysisCache
+from homer.lexicon import Lexicon, DEFAULT_LEXICON, INTENSIFIER, COMPULSIVE_HEDGER, VAGUE_WORD
+from homer.lexicon import get_lexicon, load_lexicon
+
+
+class TestLexicon(unittest.TestCase):
+
+    def test_single_words(self):
+        words = 'he is very highly recommended'.split()
+        self.assertEqual([(INTENSIFIER, 2, 3), (INTENSIFIER, 3, 4)], list(DEFAULT_LEXICON.find(words)))
+
+    def test_phrases(self):
+        words = 'it is sort of a fair value and a few more'.split()
+        self.assertEqual([(COMPULSIVE_HEDGER, 2, 4), (VAGUE_WORD, 5, 7), (VAGUE_WORD, 8, 10)],
+                         list(DEFAULT_LEXICON.find(words)))
+
+    def test_longest_phrase_wins(self):
+        lexicon = Lexicon(intensifiers=[], compulsive_hedgers=[], vague_words=['somewhat', 'somewhat like'])
+        self.assertEqual([(VAGUE_WORD, 1, 3)], list(lexicon.find('looks somewhat like rain'.split())))
+        self.assertEqual([(VAGUE_WORD, 1, 2)], list(lexicon.find('looks somewhat good'.split())))
+
+    def test_categories_match_independently(self):
+        lexicon = Lexicon(intensifiers=['really'], compulsive_hedgers=[], vague_words=['really'])
+        self.assertEqual([(INTENSIFIER, 0, 1), (VAGUE_WORD, 0, 1)], list(lexicon.find(['really'])))
+
+    def test_lists_are_normalized(self):
+        lexicon = Lexicon(intensifiers=['Very '], compulsive_hedgers=['Sort  Of'], vague_words=[])
+        self.assertIn('very', lexicon.intensifiers)
+        self.assertEqual([(COMPULSIVE_HEDGER, 0, 2)], list(lexicon.find(['sort', 'of'])))
+
+
+class TestSentencePhrases(unittest.TestCase):
+
+    def test_phrases_in_sentences(self):
+        sentences = [
+            {'line': 'It is sort of fine, a bit odd and kind of nice.', 'hedgers': ['sort of', 'a bit', 'kind of']},
+            {'line': 'A few words are somewhat like others.', 'vague_words': ['a few', 'somewhat like']},
+        ]
+        for data in sentences:
+            sentence = analyzer.Sentence(data['line'])
+            self.assertEqual(data.get('hedgers', []), [str(word) for word in sentence.get_compulsive_hedgers()])
+            self.assertEqual(data.get('vague_words', []), [str(word) for word in sentence.get_vague_words()])
+
+
+class TestLexiconReport(unittest.TestCase):
+
+    def test_report(self):
+        article = analyzer.Article('', '', 'It is very, very good. It is sort of fine.\n\nThe approach is very odd.')
+        report = article.get_lexicon_report()
+        self.assertEqual({'very': 3}, dict(report.counts[INTENSIFIER]))
+        self.assertEqual({'sort of': 1}, dict(report.counts[COMPULSIVE_HEDGER]))
+        self.assertEqual({'approach': 1}, dict(report.counts[VAGUE_WORD]))
+        self.assertEqual([(0, 0, 2), (0, 0, 3), (1, 0, 3)],
+                         [position[1:] for position in report.positions[INTENSIFIER]])
+        self.assertEqual([(0, 1, 2)], [position[1:] for position in report.positions[COMPULSIVE_HEDGER]])
+        self.assertEqual(3, len(article.get_intensifiers()))
+        self.assertIs(report, article.get_lexicon_report())
+
+
+class TestLexiconPacks(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write(self, file_name, content):
+        path = os.path.join(self.directory.name, file_name)
+        with open(path, 'w') as f:
+            f.write(content if isinstance(content, str) else json.dumps(content))
+        return path
+
+    def test_json_pack(self):
+        path = self.write('legal.json', {'vague_words': ['stuff', 'and so on'],
+                                         'intensifiers': {'add': ['plainly'], 'remove': ['very']}})
+        lexicon = load_lexicon(path)
+        self.assertEqual('legal', lexicon.name)
+        self.assertEqual({'stuff', 'and so on'}, lexicon.vague_words)
+        self.assertIn('plainly', lexicon.intensifiers)
+        self.assertNotIn('very', lexicon.intensifiers)
+        self.assertEqual(DEFAULT_LEXICON.compulsive_hedgers, lexicon.compulsive_hedgers)
+
+    def test_yaml_pack(self):
+        path = self.write('team.yaml', 'name: Team\ncompulsive_hedgers:\n  - I reckon\n')
+        try:
+            lexicon = load_lexicon(path)
+        except ImportError:
+            self.skipTest('PyYAML is not installed.')
+        self.assertEqual('Team', lexicon.name)
+        self.assertEqual({'i reckon'}, lexicon.compulsive_hedgers)
+
+    def test_invalid_packs(self):
+        for content in ({'adverbs': ['very']}, {'vague_words': 'stuff'}, {'intensifiers': {'drop': ['very']}}, '[]'):
+            with self.assertRaises(ValueError):
+                load_lexicon(self.write('bad.json', content))
+
+    def test_compiled_once_and_reloaded(self):
+        path = self.write('pack.json', {'vague_words': ['stuff']})
+        lexicon = get_lexicon(path)
+        self.assertIs(lexicon, get_lexicon(path))
+        self.assertIs(DEFAULT_LEXICON, get_lexicon())
+        self.assertIs(lexicon, get_lexicon(lexicon))
+        self.write('pack.json', {'vague_words': ['stuff', 'things']})
+        os.utime(path, ns=(0, 0))
+        reloaded = get_lexicon(path)
+        self.assertIsNot(lexicon, reloaded)
+        self.assertEqual({'stuff', 'things'}, reloaded.vague_words)
+        self.assertNotEqual(lexicon.fingerprint, reloaded.fingerprint)
+
+    def test_article_with_a_pack(self):
+        path = self.write('pack.json', {'vague_words': ['stuff'], 'intensifiers': ['plainly']})
+        text = 'It is plainly stuff. It is very good.\n\nA few things.'
+        article = analyzer.Article('', '', text, lexicon=path)
+        report = article.get_lexicon_report()
+        self.assertEqual({'plainly': 1}, dict(report.counts[INTENSIFIER]))
+        self.assertEqual({'stuff': 1}, dict(report.counts[VAGUE_WORD]))
+        self.assertTrue(article.get_vague_words()[0].is_vague_word())
+        self.assertEqual({'very': 1}, dict(analyzer.Article('', '', text).get_lexicon_report().counts[INTENSIFIER]))
+        # Words are shared per lexicon, a pack does not change the words of another.
+        self.assertTrue(analyzer.get_word('plainly', path).is_intensifier())
+        self.assertFalse(analyzer.get_word('plainly').is_intensifier())
+        article.update(text.replace('A few things.', 'More stuff.'))
+        self.assertEqual({'stuff': 2}, dict(article.get_lexicon_report().counts[VAGUE_WORD]))
+
+    def test_pickled_lexicon_is_compiled_again(self):
+        lexicon = pickle.loads(pickle.dumps(load_lexicon(self.write('pack.json', {'vague_words': ['sort of stuff']}))))
+        self.assertEqual('pack', lexicon.name)
+        self.assertIn((VAGUE_WORD, 1, 4), list(lexicon.find('some sort of stuff'.split())))
+
+    def test_cache_keys_depend_on_the_pack(self):
+        path = self.write('pack.json', {'vague_words': ['stuff']})
+        cache_path = os.path.join(self.directory.name, 'cache.sqlite')
+        with AnalysisCache(cache_path) as cache, AnalysisCache(cache_path, lexicon=path) as pack_cache:
+            self.assertNotEqual(cache.key('Some stuff.'), pack_cache.key('Some stuff.'))
+            self.assertEqual(1, pack_cache.summary('', '', 'Some stuff.')['vague_words'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import os
+import tempfile
+import unittest
+from homer import batch
+from homer.analyzer import Article
+from homer.mapped import MappedText
+from homer.tokenizers import get_tokenizer
+
+
+class TestMappedText(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write(self, content):
+        path = os.path.join(self.directory.name, 'text.txt')
+        with open(path, 'wb') as f:
+            f.write(content.encode('utf-8'))
+        return path
+
+    def assertSameArticle(self, path, tokenizer=None):
+        text = open(path, encoding='utf-8').read()
+        expected = Article('Name', 'Author', text, tokenizer)
+        article = Article.from_file('Name', 'Author', path, tokenizer)
+        self.assertEqual(expected.total_paragraphs, article.total_paragraphs)
+        self.assertEqual([paragraph.paragraph for paragraph in expected.paragraphs],
+                         [paragraph.paragraph for paragraph in article.paragraphs])
+        self.assertEqual([paragraph.offset for paragraph in expected.paragraphs],
+                         [paragraph.offset for paragraph in article.paragraphs])
+        self.assertEqual([paragraph.tokenized_sentences for paragraph in expected.paragraphs],
+                         [paragraph.tokenized_sentences for paragraph in article.paragraphs])
+        self.assertEqual(expected.find(), article.find())
+        self.assertEqual(batch.summarize(expected), batch.summarize(article))
+        self.assertEqual(expected.text, article.text)
+        return article
+
+    def test_same_as_reading_the_file(self):
+        for file_name in ('moby_dick.txt', 'python_paradox.txt', 'stats.txt'):
+            for tokenizer in ('nltk', 'regex'):
+                self.assertSameArticle(file_name, tokenizer)
+
+    def test_newlines_and_unicode(self):
+        path = self.write('Café déjà vu — very odd.\r\nSame paragraph.\r\n\r\n'
+                          'A new one   here.\n 　\n Third, sort of.\r\rFourth.\r\n')
+        self.assertEqual(4, len(MappedText(path).paragraph_spans()))
+        self.assertSameArticle(path)
+
+    def test_text_is_not_kept(self):
+        article = self.assertSameArticle('moby_dick.txt')
+        self.assertIsNone(article._text)
+        for paragraph in article.paragraphs:
+            self.assertIsNone(paragraph._text)
+            self.assertTrue(all(sentence._sentence is None for sentence in paragraph.sentences))
+        self.assertTrue(str(article.longest_sentence))
+
+    def test_paragraph_spans(self):
+        text = 'First.\n\n  \nSecond one.\n\n'
+        with MappedText(self.write(text)) as mapped_text:
+            self.assertEqual(get_tokenizer().paragraph_spans(text), mapped_text.paragraph_spans())
+
+    def test_empty_file(self):
+        article = Article.from_file('', '', self.write(''))
+        self.assertEqual(0, article.total_paragraphs)
+        self.assertEqual('', article.text)
+        self.assertIn('error', batch.analyze_file(self.write(' \n\n ')))
+
+    def test_update(self):
+        path = self.write(open('moby_dick.txt').read())
+        article = Article.from_file('', '', path)
+        article.total_words
+        edited = article.text.replace('Call me Ishmael.', 'Call me Ahab.')
+        self.assertEqual(1, article.update(edited))
+        self.assertEqual(batch.summarize(Article('', '', edited)), batch.summarize(article))
+        self.assertEqual(Article('', '', edited).find(), article.find())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+from homer import analyzer, batch, metrics, profiling
+
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.text = open('stats.txt').read()
+
+    def test_analyze(self):
+        article = analyzer.Article('', '', self.text)
+        values = metrics.analyze(self.text, ['reading_time', 'flesch'])
+        self.assertEqual({'reading_time': article.reading_time, 'flesch': article.flesch_reading.score}, values)
+
+    def test_summary_metrics(self):
+        article = analyzer.Article('Stats', 'homer', self.text)
+        self.assertEqual(batch.summarize(article), metrics.compute(article, metrics.SUMMARY))
+        self.assertEqual(metrics.SUMMARY, list(batch.summarize(article)))
+
+    def test_required_metrics_come_first(self):
+        names = [metric.name for metric in metrics.resolve(['flesch_reading_grade', 'reading_time'])]
+        self.assertEqual(['readability_counts', 'flesch_reading', 'flesch_reading_grade', 'total_words',
+                          'reading_time'], names)
+
+    def test_needs(self):
+        self.assertEqual(frozenset(), metrics.needs(['total_paragraphs', 'name']))
+        self.assertEqual({metrics.SENTENCES}, metrics.needs(['reading_time']))
+        self.assertEqual({metrics.SENTENCES, metrics.SYLLABLES}, metrics.needs(['flesch', 'reading_time']))
+
+    def test_only_needed_stages_run(self):
+        with profiling.profile() as profile:
+            self.assertEqual({'total_paragraphs': 2}, metrics.analyze(self.text, ['total_paragraphs']))
+        self.assertNotIn('build_article', profile.stages)
+        with profiling.profile() as profile:
+            metrics.analyze(self.text, ['reading_time'])
+        self.assertIn('build_article', profile.stages)
+        self.assertNotIn('readability_counts', profile.stages)
+        self.assertNotIn('lexicon_report', profile.stages)
+
+    def test_unknown_metric(self):
+        with self.assertRaises(ValueError):
+            metrics.analyze(self.text, ['reading_time', 'nope'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import json
+import unittest
+from homer import analyzer, profiling
+
+
+class TestProfiling(unittest.TestCase):
+
+    def test_stages_and_counters(self):
+        text = open('stats.txt').read()
+        with profiling.profile() as profile:
+            article = analyzer.Article('', '', text)
+            article.ten_words_with_most_syllables()
+        report = json.loads(profile.to_json())
+        for name in ('build_article', 'split_paragraphs', 'sent_tokenize', 'word_tokenize', 'count_syllables'):
+            self.assertIn(name, report['stages'])
+        self.assertEqual(1, report['stages']['build_article']['calls'])
+        self.assertEqual(article.total_sentences, report['stages']['word_tokenize']['calls'])
+        self.assertEqual(article.total_sentences, report['counters']['sentences'])
+        self.assertEqual(sum(len(paragraph.buffer) for paragraph in article.paragraphs), report['counters']['tokens'])
+
+    def test_nested_stages(self):
+        with profiling.profile() as profile:
+            with profiling.stage('outer'):
+                with profiling.stage('inner'):
+                    pass
+        outer = profile.stages['outer']
+        self.assertGreaterEqual(outer['seconds'], profile.stages['inner']['seconds'])
+        self.assertAlmostEqual(outer['seconds'] - profile.stages['inner']['seconds'], outer['self_seconds'])
+
+    def test_inactive(self):
+        self.assertIsNone(profiling.active())
+        with profiling.stage('nothing'):
+            profiling.count('nothing')
+        with profiling.profile() as profile:
+            self.assertIs(profile, profiling.active())
+            with self.assertRaises(RuntimeError):
+                profiling.profile().__enter__()
+        self.assertEqual({}, profile.stages)
+
+
+if __name__ == "__main__":
+    unittest.main()
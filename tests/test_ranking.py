@@ -0,0 +1,35 @@
+import unittest
+from collections import Counter
+from homer import ranking
+from homer.analyzer import Article
+
+
+class TestRanking(unittest.TestCase):
+
+    def test_top_k_breaks_ties_alphabetically(self):
+        scores = {'pear': 2, 'apple': 2, 'fig': 5, 'kiwi': 1, 'banana': 2}
+        self.assertEqual(['fig', 'apple', 'banana'], ranking.top_k(scores, 3))
+        self.assertEqual(['fig', 'apple', 'banana', 'pear', 'kiwi'], ranking.top_k(scores, 10))
+
+    def test_capitalized_stopwords_are_left_out(self):
+        token_counts = Counter({'The': 5, 'the': 3, 'Whale': 2, 'whale': 2, 'sea': 3, ',': 9})
+        self.assertEqual(['whale', 'sea'], ranking.most_repeated_words(token_counts, 5, stopwords=frozenset(['the'])))
+
+    def test_exclude(self):
+        token_counts = Counter({'whale': 4, 'Ahab': 3, 'sea': 2})
+        self.assertEqual(['sea'], ranking.most_repeated_words(token_counts, 5, stopwords=frozenset(),
+                                                              exclude=['Whale', 'ahab']))
+
+    def test_article(self):
+        article = Article('Moby Dick', 'Herman Melville', open('moby_dick.txt').read())
+        words = article.get_n_most_repeated_words(20)
+        self.assertEqual(20, len(words))
+        self.assertEqual([word.lower() for word in words], words)
+        self.assertEqual(words[1:6], article.get_n_most_repeated_words(5, exclude=[words[0]]))
+        syllables = article.ten_words_with_most_syllables()
+        self.assertEqual(10, len(syllables))
+        self.assertEqual(syllables[:3], article.words_with_most_syllables(3))
+
+
+if __name__ == "__main__":
+    unittest.main()
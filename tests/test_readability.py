@@ -0,0 +1,60 @@
+import unittest
+import textstat
+from homer import analyzer
+from homer.readability import ReadabilityCounts, TOLERANCE
+
+TEXTSTAT_SCORES = {
+    'flesch_reading_ease': textstat.flesch_reading_ease,
+    'flesch_kincaid_grade': textstat.flesch_kincaid_grade,
+    'gunning_fog': textstat.gunning_fog,
+    'smog_index': textstat.smog_index,
+    'coleman_liau_index': textstat.coleman_liau_index,
+    'automated_readability_index': textstat.automated_readability_index,
+    'dale_chall_score': textstat.dale_chall_readability_score,
+}
+
+
+class TestReadabilityCounts(unittest.TestCase):
+
+    def test_counts_add_up(self):
+        first = ReadabilityCounts(sentences=1, words=10, syllables=14, letters=45, polysyllables=1, difficult_words=2)
+        second = ReadabilityCounts(sentences=2, words=5, syllables=6, letters=20, polysyllables=0, difficult_words=1)
+        self.assertEqual(ReadabilityCounts(3, 15, 20, 65, 1, 3), first + second)
+        self.assertEqual(first + second, ReadabilityCounts.total([first, second]))
+
+    def test_flesch_reading_ease(self):
+        counts = ReadabilityCounts(sentences=2, words=20, syllables=30)
+        self.assertAlmostEqual(206.835 - 1.015 * 10 - 84.6 * 1.5, counts.flesch_reading_ease())
+
+    def test_difficult_words_of_any_length(self):
+        # As in textstat's Dale-Chall score, every word off the easy list is difficult, 'hull' and '1851' included.
+        words = [analyzer.get_word(word) for word in ('The', 'hull', 'of', '1851', 'had', 'a', 'harpoon')]
+        counts = ReadabilityCounts.from_words(words)
+        self.assertEqual(7, counts.words)
+        self.assertEqual(3, counts.difficult_words)
+
+    def test_empty_counts(self):
+        for score in ReadabilityCounts().scores().values():
+            self.assertEqual(0.0, score)
+
+
+class TestArticleReadability(unittest.TestCase):
+    texts = [open(file_name).read() for file_name in ('moby_dick.txt', 'python_paradox.txt', 'stats.txt')]
+    articles = [analyzer.Article('', '', text) for text in texts]
+
+    def test_paragraphs_add_up_to_article(self):
+        for article in TestArticleReadability.articles:
+            self.assertEqual(ReadabilityCounts.total(paragraph.readability_counts for paragraph in article.paragraphs),
+                             article.readability_counts)
+            self.assertEqual(article.total_sentences, article.readability_counts.sentences)
+            self.assertEqual(article.total_words, article.readability_counts.words)
+
+    def test_scores_match_textstat(self):
+        for text, article in zip(TestArticleReadability.texts, TestArticleReadability.articles):
+            scores = article.get_readability_scores()
+            for name, textstat_score in TEXTSTAT_SCORES.items():
+                self.assertAlmostEqual(textstat_score(article.text), scores[name], delta=TOLERANCE[name], msg=name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import sys
+import unittest
+import subprocess
+from homer import resources
+
+
+class TestResources(unittest.TestCase):
+
+    def test_loaded_once(self):
+        calls = []
+        resource = resources.Resource('test', lambda: calls.append(1) or len(calls))
+        self.assertFalse(resource.loaded)
+        self.assertEqual(1, resource.get())
+        self.assertEqual(1, resource.get())
+        self.assertTrue(resource.loaded)
+        self.assertEqual([1], calls)
+
+    def test_stopwords(self):
+        self.assertIsInstance(resources.STOPWORDS.get(), frozenset)
+        self.assertIn('the', resources.STOPWORDS.get())
+
+    def test_warmup(self):
+        resources.warmup()
+        self.assertTrue(all(resource.loaded for resource in resources.RESOURCES))
+
+    def test_importing_homer_does_not_import_nltk(self):
+        code = 'import sys, homer.analyzer, homer.cmdline_printer; print("nltk" in sys.modules)'
+        output = subprocess.check_output([sys.executable, '-c', code], env={'PYTHONPATH': '..'})
+        self.assertEqual(b'False', output.strip())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import io
+import csv
+import json
+import unittest
+from homer import analyzer, batch, serializers
+from homer.streaming import ArticleStream
+
+
+class TestSerializers(unittest.TestCase):
+
+    def setUp(self):
+        self.article = analyzer.Article('Stats', 'homer', open('stats.txt').read())
+
+    def write(self, format, fields=None):
+        out = io.StringIO()
+        serializers.write_article(self.article, out, format, fields)
+        return out.getvalue()
+
+    def test_json(self):
+        document = json.loads(self.write('json'))
+        self.assertEqual(batch.summarize(self.article), document['article'])
+        self.assertEqual(2, len(document['paragraphs']))
+        self.assertEqual({'number': 1, 'sentences': 8, 'total_words': 67},
+                         {key: document['paragraphs'][0][key] for key in ('number', 'sentences', 'total_words')})
+
+    def test_ndjson(self):
+        lines = [json.loads(line) for line in self.write('ndjson', ['total_words']).splitlines()]
+        self.assertEqual([{'number': 1, 'total_words': 67, 'type': 'paragraph'},
+                          {'number': 2, 'total_words': 89, 'type': 'paragraph'},
+                          {'total_words': 156, 'type': 'article'}], lines)
+
+    def test_csv(self):
+        rows = list(csv.reader(io.StringIO(self.write('csv', ['total_words', 'sentences']))))
+        self.assertEqual([['number', 'sentences', 'total_words'], ['1', '8', '67'], ['2', '10', '89'],
+                          ['article', '', '156']], rows)
+
+    def test_csv_of_article_fields(self):
+        rows = list(csv.DictReader(io.StringIO(self.write('csv', ['reading_time', 'flesch']))))
+        self.assertEqual(['number', 'flesch', 'reading_time'], list(rows[0]))
+        self.assertEqual(['1', '2', 'article'], [row['number'] for row in rows])
+        self.assertEqual(['', '', str(self.article.reading_time)], [row['reading_time'] for row in rows])
+        self.assertEqual(str(self.article.get_readability_scores()['flesch_reading_ease']), rows[-1]['flesch'])
+
+    def test_aliases_of_paragraph_fields(self):
+        document = json.loads(self.write('json', ['flesch', 'dale_chall']))
+        expected = json.loads(self.write('json', ['flesch_reading_ease', 'dale_chall_score']))
+        self.assertEqual([{'number': record['number'], 'flesch': record['flesch_reading_ease'],
+                           'dale_chall': record['dale_chall_score']} for record in expected['paragraphs']],
+                         document['paragraphs'])
+        self.assertEqual(['flesch', 'dale_chall'], list(document['article']))
+
+    def test_stream_writes_the_same_records(self):
+        out = io.StringIO()
+        with open('stats.txt') as f:
+            serializers.write_stream(ArticleStream('Stats', 'homer', f), out, 'json')
+        self.assertEqual(json.loads(self.write('json')), json.loads(out.getvalue()))
+
+    def test_stream_writes_every_metric_asked_for(self):
+        fields = ['total_words', 'most_repeated_words', 'and_frequency', 'readability_scores']
+        out = io.StringIO()
+        with open('stats.txt') as f:
+            serializers.write_stream(ArticleStream('Stats', 'homer', f, metrics=fields), out, 'ndjson', fields)
+        self.assertEqual(self.write('ndjson', fields), out.getvalue())
+        with open('stats.txt') as f, self.assertRaises(ValueError):
+            serializers.write_stream(ArticleStream('Stats', 'homer', f), io.StringIO(), 'ndjson', fields)
+
+    def test_summaries(self):
+        out = io.StringIO()
+        summaries = [('stats.txt', batch.summarize(self.article)), ('missing.txt', batch.analyze_file('missing.txt'))]
+        serializers.write_summaries(summaries, out, 'ndjson', ['total_words'])
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual({'path': 'stats.txt', 'total_words': 156}, records[0])
+        self.assertEqual(['path', 'error'], list(records[1]))
+
+    def test_unknown_fields_and_formats(self):
+        with self.assertRaises(ValueError):
+            self.write('json', ['total_words', 'nope'])
+        with self.assertRaises(ValueError):
+            self.write('xml')
+
+
+if __name__ == "__main__":
+    unittest.main()
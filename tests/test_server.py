@@ -0,0 +1,242 @@
+import io
+import os
+import sys
+import json
+import tempfile
+import threading
+import unittest
+import subprocess
+from homer.analyzer import Article, LONG_SENTENCE
+from homer.client import BUILTIN_LEXICON, Client, find_server
+from homer.serializers import write_article, write_document
+from homer.server import AnalysisServer, Busy
+
+# Sends a server ever new words, and prints how many tokens its vocabulary held at most, the most memory taken in
+# each quarter of the requests, and the answer to the same text before and after. Run in a process of its own, since
+# it clears the vocabulary shared by every article of the process.
+NEW_WORDS = """
+import json, random, tracemalloc
+from homer.server import AnalysisServer
+from homer.vocabulary import VOCABULARY
+random.seed(0)
+server = AnalysisServer(('127.0.0.1', 0), tokenizer='regex', max_vocabulary=10000)
+request = {'text': 'It is sort of very big and, well, stuff.', 'metrics': ['total_words', 'intensifiers',
+           'compulsive_hedgers', 'vague_words']}
+before = server.submit(server.analyze, request)
+tracemalloc.start()
+largest, peaks = 0, []
+for number in range(2000):
+    text = ' '.join(''.join(random.choice('etaoinshrd') for _ in range(6)) for _ in range(50)) + '.'
+    server.submit(server.analyze, {'text': text, 'metrics': ['total_words'], 'document': str(number % 100)})
+    largest = max(largest, len(VOCABULARY))
+    if number % 500 == 499:
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+print(json.dumps([largest, peaks, before, server.submit(server.analyze, request)]))
+server.close()
+"""
+
+
+def start(address, **kwargs):
+    server = AnalysisServer(address, **kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class TestAnalysisServer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = start(('127.0.0.1', 0), workers=2)
+        cls.client = Client(cls.server.url)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.close()
+
+    def setUp(self):
+        self.text = open('moby_dick.txt').read()
+
+    def test_analyze_as_written_locally(self):
+        document = self.client.analyze(self.text, 'Moby Dick', 'Herman Melville')
+        local, served = io.StringIO(), io.StringIO()
+        write_article(Article('Moby Dick', 'Herman Melville', self.text), local, 'json')
+        write_document(document, served, 'json')
+        self.assertEqual(json.loads(local.getvalue()), json.loads(served.getvalue()))
+
+    def test_metrics_and_findings(self):
+        document = self.client.analyze(self.text, metrics=['reading_time', 'flesch'], paragraphs=False,
+                                       findings=[LONG_SENTENCE])
+        self.assertNotIn('paragraphs', document)
+        self.assertEqual(['reading_time', 'flesch'], list(document['article']))
+        expected = Article('', '', self.text).find([LONG_SENTENCE])
+        self.assertEqual([finding._asdict() for finding in expected], document['findings'])
+
+    def test_document_is_updated(self):
+        self.assertEqual(self.text.count('\n\n') + 1, self.client.analyze(self.text, document='moby')['analyzed'])
+        edited = self.text.replace('Call me Ishmael.', 'Call me Ahab.')
+        document = self.client.analyze(edited, document='moby', tokenizer='nltk')
+        self.assertEqual(1, document['analyzed'])
+        self.assertEqual(self.client.analyze(edited)['article'], document['article'])
+
+    def test_lexicon_is_reloaded(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'pack.json')
+            with open(path, 'w') as f:
+                json.dump({'vague_words': ['whale']}, f)
+            server = start(('127.0.0.1', 0), lexicon_dir=directory)
+            try:
+                client = Client(server.url)
+                text = 'The whale swam. The ship sailed.'
+                analyze = lambda: client.analyze(text, metrics=['vague_words'], lexicon=path, document='pack')
+                self.assertEqual(1, analyze()['article']['vague_words'])
+                with open(path, 'w') as f:
+                    json.dump({'vague_words': ['whale', 'ship']}, f)
+                os.utime(path, ns=(0, 0))
+                self.assertEqual(2, analyze()['article']['vague_words'])
+                self.assertEqual(2, client.analyze(text, metrics=['vague_words'], lexicon='pack.json')['article'][
+                    'vague_words'])
+                with self.assertRaises(ValueError):
+                    client.analyze(text, lexicon=os.path.join(directory, 'missing.json'))
+            finally:
+                server.shutdown()
+                server.close()
+
+    def test_only_allowed_packs_are_read(self):
+        with tempfile.TemporaryDirectory() as directory:
+            packs = os.path.join(directory, 'packs')
+            os.mkdir(packs)
+            outside = os.path.join(directory, 'secret.json')
+            with open(outside, 'w') as f:
+                json.dump({'password': 'hunter2'}, f)
+            os.symlink(outside, os.path.join(packs, 'link.json'))
+            server = start(('127.0.0.1', 0), lexicon_dir=packs)
+            try:
+                client = Client(server.url)
+                for lexicon in (outside, '../secret.json', 'link.json'):
+                    with self.assertRaises(ValueError) as raised:
+                        client.analyze('The whale swam.', lexicon=lexicon)
+                    self.assertNotIn('password', str(raised.exception))
+                with self.assertRaises(ValueError):
+                    self.client.analyze('The whale swam.', lexicon=outside)
+            finally:
+                server.shutdown()
+                server.close()
+
+    def test_builtin_lexicon(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'pack.json')
+            with open(path, 'w') as f:
+                json.dump({'vague_words': ['whale']}, f)
+            server = start(('127.0.0.1', 0), lexicon=path)
+            try:
+                client = Client(server.url)
+                text = 'The whale swam. The ship sailed, and so on.'
+                self.assertEqual(1, client.analyze(text, metrics=['vague_words'])['article']['vague_words'])
+                self.assertEqual(1, client.analyze(text, metrics=['vague_words'], lexicon=path)['article'][
+                    'vague_words'])
+                document = client.analyze(text, metrics=['vague_words'], lexicon=BUILTIN_LEXICON)
+                self.assertEqual(Article('', '', text).get_lexicon_report().total('vague_words'),
+                                 document['article']['vague_words'])
+            finally:
+                server.shutdown()
+                server.close()
+
+    def test_compare(self):
+        edited = self.text.replace('Call me Ishmael.', 'Call me Ahab.')
+        self.assertEqual(1, self.client.compare(self.text, edited)['analyzed'])
+
+    def test_health_and_metrics(self):
+        self.assertEqual('ok', self.client.health()['status'])
+        self.client.analyze('A short text.')
+        metrics = self.client.metrics()
+        self.assertGreater(metrics['requests'], 0)
+        self.assertEqual(2, metrics['queue']['workers'])
+        self.assertIn('p50', metrics['latency_ms'])
+
+    def test_bad_requests(self):
+        with self.assertRaises(ValueError):
+            self.client.analyze(self.text, metrics=['no_such_metric'])
+        with self.assertRaises(ValueError):
+            self.client.analyze(self.text, tokenizer='punkt')
+        with self.assertRaises(ValueError):
+            self.client.request('POST', '/analyze', {'name': 'No text'})
+        with self.assertRaises(ValueError):
+            self.client.request('GET', '/nowhere')
+
+    def test_busy(self):
+        server = AnalysisServer(('127.0.0.1', 0), workers=1, max_pending=0)
+        started, release = threading.Event(), threading.Event()
+
+        def wait(request):
+            started.set()
+            release.wait(5)
+            return request
+        try:
+            worker = threading.Thread(target=server.submit, args=(wait, {}))
+            worker.start()
+            started.wait(5)
+            with self.assertRaises(Busy):
+                server.submit(wait, {})
+            self.assertEqual(1, server.metrics()['queue']['running'])
+            release.set()
+            worker.join()
+            self.assertEqual({'done': True}, server.submit(wait, {'done': True}))
+        finally:
+            release.set()
+            server.close()
+
+    def test_memory_stays_flat_across_documents(self):
+        output = subprocess.check_output([sys.executable, '-c', NEW_WORDS], env=dict(os.environ, PYTHONPATH='..'))
+        largest, peaks, before, after = json.loads(output)
+        # At most the bound and the words of one more text.
+        self.assertLessEqual(largest, 10000 + 51)
+        # The first quarter fills the documents kept as well.
+        self.assertLess(peaks[-1], 1.25 * peaks[1])
+        self.assertEqual(before, after)
+
+
+class TestUnixSocket(unittest.TestCase):
+
+    def test_unix_socket(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'homer.sock')
+            server = start(path)
+            try:
+                client = find_server(path)
+                self.assertEqual('ok', client.health()['status'])
+                self.assertEqual(1, client.analyze('Call me Ishmael.')['article']['total_sentences'])
+            finally:
+                server.shutdown()
+                server.close()
+            self.assertFalse(os.path.exists(path))
+            with self.assertRaises(OSError):
+                client.health()
+
+    def test_only_stale_sockets_are_replaced(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'notes.txt')
+            with open(path, 'w') as f:
+                f.write('Not a socket.')
+            with self.assertRaises(OSError):
+                AnalysisServer(path)
+            self.assertTrue(os.path.isfile(path))
+            path = os.path.join(directory, 'homer.sock')
+            server = start(path)
+            try:
+                with self.assertRaises(OSError):
+                    AnalysisServer(path)
+                self.assertEqual('ok', Client(path).health()['status'])
+            finally:
+                server.shutdown()
+                server._server.server_close()
+            # The socket is left behind, as by a server that was killed.
+            self.assertTrue(os.path.exists(path))
+            server = AnalysisServer(path)
+            server.close()
+            self.assertFalse(os.path.exists(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
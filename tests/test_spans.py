@@ -0,0 +1,60 @@
+import unittest
+from homer.analyzer import Article, Sentence, FINDINGS, LONG_PARAGRAPH, LONG_SENTENCE
+from homer.lexicon import INTENSIFIER, VAGUE_WORD, COMPULSIVE_HEDGER
+
+
+class TestSpans(unittest.TestCase):
+
+    def setUp(self):
+        self.article = Article('Moby Dick', 'Herman Melville', open('moby_dick.txt').read())
+
+    def test_sentences_and_words(self):
+        text = self.article.text
+        for paragraph in self.article.paragraphs:
+            self.assertEqual(paragraph.paragraph, text[paragraph.offset:paragraph.offset + len(paragraph.paragraph)])
+            for sentence in paragraph.sentences:
+                start, end = sentence.span
+                self.assertEqual(sentence.sentence, text[start:end])
+                for word, (start, end) in zip(sentence.words, sentence.word_spans):
+                    self.assertEqual(word.word, text[start:end].lower())
+
+    def test_findings(self):
+        findings = self.article.find()
+        self.assertEqual(sorted(findings, key=lambda finding: finding.start), findings)
+        self.assertEqual(set(FINDINGS), {finding.kind for finding in findings})
+        for finding in findings:
+            self.assertEqual(finding.text, self.article.text[finding.start:finding.end])
+            paragraph = self.article.paragraphs[finding.paragraph]
+            if finding.kind == LONG_PARAGRAPH:
+                self.assertEqual(paragraph.paragraph, finding.text)
+            elif finding.kind == LONG_SENTENCE:
+                self.assertEqual(paragraph.sentences[finding.sentence].sentence, finding.text)
+            else:
+                matches = paragraph.sentences[finding.sentence].lexicon_matches[finding.kind]
+                self.assertIn(' '.join(finding.text.lower().split()), [word.word for word, _ in matches])
+        self.assertEqual(len(self.article.get_vague_words()), len(self.article.find([VAGUE_WORD])))
+        self.assertEqual(len(self.article.get_intensifiers()), len(self.article.find([INTENSIFIER])))
+
+    def test_phrases(self):
+        article = Article('', '', 'Well, it was sort   of hard.\n\nMaybe it was a  little easier.')
+        findings = article.find([COMPULSIVE_HEDGER])
+        self.assertEqual(['sort   of', 'Maybe', 'a  little'], [finding.text for finding in findings])
+        self.assertEqual([0, 1, 1], [finding.paragraph for finding in findings])
+
+    def test_regex_tokenizer(self):
+        article = Article('Moby Dick', 'Herman Melville', open('moby_dick.txt').read(), tokenizer='regex')
+        for finding in article.find([LONG_SENTENCE, VAGUE_WORD]):
+            self.assertEqual(finding.text, article.text[finding.start:finding.end])
+
+    def test_sentence_on_its_own(self):
+        sentence = Sentence('It was "very" cold.')
+        self.assertEqual((0, 19), sentence.span)
+        self.assertEqual([(0, 2), (3, 6), (8, 12), (14, 18)], sentence.word_spans)
+
+    def test_unknown_finding(self):
+        with self.assertRaises(ValueError):
+            self.article.find(['adverbs'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -28,7 +28,17 @@ class TestTextStats(unittest.TestCase):
         self.assertEqual(2, len(TestTextStats.analyzed_text.get_intensifiers()))
 
     def test_compulsive_hedgers(self):
-        self.assertEqual(4, len(TestTextStats.analyzed_text.get_compulsive_hedgers()))
+        self.assertEqual(5, len(TestTextStats.analyzed_text.get_compulsive_hedgers()))
+
+    def test_totals_are_cached_until_invalidated(self):
+        article = analyzer.Article("some_text", "economist", open('stats.txt').read())
+        self.assertIs(article.totals, article.totals)
+        article.paragraphs.pop()
+        self.assertEqual(156, article.total_words)
+        article.invalidate()
+        self.assertEqual(1, article.total_paragraphs)
+        self.assertEqual(67, article.total_words)
+        self.assertEqual(8, article.total_sentences)
 
 if __name__ == "__main__":
     unittest.main()
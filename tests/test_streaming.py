@@ -0,0 +1,67 @@
+import io
+import unittest
+import nltk
+from homer import analyzer, batch, streaming
+
+
+class TestStreaming(unittest.TestCase):
+
+    def test_paragraphs_split_across_chunks(self):
+        text = 'First paragraph.\nStill first.\n\n  \nSecond one.\n\n\nThird.\n'
+        for chunk_size in (1, 2, 5, 17, 1000):
+            paragraphs = list(streaming.iter_paragraphs(io.StringIO(text), chunk_size=chunk_size))
+            self.assertEqual(nltk.tokenize.blankline_tokenize(text), paragraphs, chunk_size)
+
+    def test_paragraphs_of_files(self):
+        for file_name in ('moby_dick.txt', 'stats.txt'):
+            text = open(file_name).read()
+            paragraphs = list(streaming.iter_paragraphs(open(file_name), chunk_size=100))
+            self.assertEqual(nltk.tokenize.blankline_tokenize(text), paragraphs)
+
+    def test_summary_matches_article(self):
+        for file_name in ('moby_dick.txt', 'stats.txt'):
+            stream = streaming.ArticleStream(file_name, 'homer', open(file_name), chunk_size=100)
+            paragraphs = list(stream)
+            article = analyzer.Article(file_name, 'homer', open(file_name).read())
+            self.assertEqual(article.total_paragraphs, len(paragraphs))
+            self.assertEqual(batch.summarize(article), stream.summary())
+
+    def test_only_what_metrics_need(self):
+        stream = streaming.ArticleStream('Moby Dick', 'homer', open('moby_dick.txt'), metrics=['total_words', 'flesch'])
+        paragraphs = list(stream)
+        article = analyzer.Article('Moby Dick', 'homer', open('moby_dick.txt').read())
+        self.assertEqual(batch.summarize(article, ['total_words', 'flesch']), stream.summary())
+        self.assertTrue(all(sentence._lexicon_matches is None for paragraph in paragraphs
+                            for sentence in paragraph.sentences))
+        stream = streaming.ArticleStream('Moby Dick', 'homer', open('moby_dick.txt'), metrics=['total_words'])
+        self.assertTrue(all(paragraph._readability_counts is None for paragraph in stream))
+        self.assertEqual({'total_words': article.total_words}, stream.summary())
+
+    def test_every_metric(self):
+        names = ['most_repeated_words', 'ten_words_with_most_syllables', 'and_frequency', 'readability_scores']
+        stream = streaming.ArticleStream('Moby Dick', 'homer', open('moby_dick.txt'), metrics=names)
+        list(stream)
+        article = analyzer.Article('Moby Dick', 'homer', open('moby_dick.txt').read())
+        self.assertEqual(batch.summarize(article, names), stream.summary())
+
+    def test_empty_text(self):
+        for text in ('', '  \n\n \n', '—'):
+            stream = streaming.ArticleStream('', '', io.StringIO(text))
+            list(stream)
+            summary = stream.summary()
+            self.assertEqual(batch.summarize(analyzer.Article('', '', text)), summary)
+            self.assertEqual((0, 0, ''), (summary['avg_words_per_sentence'], summary['len_of_longest_sentence'],
+                                          summary['longest_sentence']))
+
+    def test_same_paragraphs_as_article(self):
+        text = 'First one.\n\n—\n\nSecond — and last.'
+        for tokenizer in ('nltk', 'regex'):
+            stream = streaming.ArticleStream('', '', io.StringIO(text), chunk_size=3, tokenizer=tokenizer)
+            article = analyzer.Article('', '', text, tokenizer)
+            self.assertEqual([paragraph.paragraph for paragraph in article.paragraphs],
+                             [paragraph.paragraph for paragraph in stream])
+            self.assertEqual(batch.summarize(article), stream.summary())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+from homer import analyzer, syllables
+from homer.vocabulary import VOCABULARY
+
+
+class TestSyllables(unittest.TestCase):
+
+    def test_estimate(self):
+        words = {'make': 1, 'table': 2, 'boxes': 2, 'jumped': 1, 'wanted': 2, 'circulation': 4, 'the': 1, '10': 1}
+        for word, expected in words.items():
+            self.assertEqual(expected, syllables.estimate_syllables(word), word)
+
+    def test_dictionary_words(self):
+        words = {'ocean': 2, 'particular': 4, 'sea': 1, 'whenever': 3}
+        for word, expected in words.items():
+            self.assertEqual(expected, syllables.count_syllables(word), word)
+
+    def test_index_is_loaded_once(self):
+        self.assertIs(syllables.get_index(), syllables.get_index())
+
+    def test_words_missing_from_dictionary(self):
+        self.assertNotIn('blorptastic', syllables.get_index())
+        self.assertEqual(3, syllables.count_syllables('blorptastic'))
+
+    def test_word_caches_syllables(self):
+        word = analyzer.Word('Ocean')
+        self.assertEqual(2, word.syllables)
+        self.assertEqual(2, VOCABULARY.syllables(word.id, lambda word: 99))
+
+
+class TestSyllableRanking(unittest.TestCase):
+
+    def test_words_missing_from_dictionary_are_ranked(self):
+        article = analyzer.Article('', '', 'The blorptasticality cat sat. It was fine.')
+        self.assertEqual('blorptasticality', article.ten_words_with_most_syllables()[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
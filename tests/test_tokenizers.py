@@ -0,0 +1,76 @@
+import unittest
+from homer import tokenizers
+from homer.analyzer import Article, Paragraph
+from homer.batch import summarize
+
+
+def words(tokens):
+    return [token for token in tokens if token.isalpha() or token.isdigit()]
+
+
+class TestRegexTokenizer(unittest.TestCase):
+
+    def setUp(self):
+        self.tokenizer = tokenizers.get_tokenizer('regex')
+
+    def test_sentences_and_tokens(self):
+        sentences = self.tokenizer.tokenize('Mr. Smith didn\'t pay $1,000 for it. "Really?" he asked. '
+                                            'J. R. Tolkien wrote it.')
+        self.assertEqual(['Mr. Smith didn\'t pay $1,000 for it.', '"Really?" he asked.', 'J. R. Tolkien wrote it.'],
+                         [sentence for sentence, _, _ in sentences])
+        self.assertEqual(['Mr.', 'Smith', 'did', "n't", 'pay', '$', '1,000', 'for', 'it', '.'], sentences[0][1])
+        self.assertEqual(['``', 'Really', '?', "''", 'he', 'asked', '.'], sentences[1][1])
+        self.assertEqual(['J.', 'R.', 'Tolkien', 'wrote', 'it', '.'], sentences[2][1])
+
+    def test_spans(self):
+        paragraph = 'He said "stop." Then he left.'
+        for tokenizer in tokenizers.TOKENIZERS.values():
+            for sentence, tokens, spans in tokenizer.tokenize(paragraph):
+                self.assertEqual(2 * len(tokens), len(spans))
+                self.assertEqual(sentence, paragraph[spans[0]:spans[-1]])
+                for token, start, end in zip(tokens, spans[::2], spans[1::2]):
+                    self.assertEqual(token.replace('``', '"').replace("''", '"'), paragraph[start:end])
+
+    def test_paragraph_spans(self):
+        text = 'First.\n\n  \nSecond one.\n\n'
+        self.assertEqual([(0, 6), (11, 22)], self.tokenizer.paragraph_spans(text))
+        self.assertEqual(['First.', 'Second one.'], self.tokenizer.paragraphs(text))
+
+    def test_no_break_before_lowercase(self):
+        sentences = self.tokenizer.tokenize('But look! here come more crowds. Strange!')
+        self.assertEqual(['But look! here come more crowds.', 'Strange!'], [sentence for sentence, _, _ in sentences])
+
+    def test_words_of_a_sentence(self):
+        self.assertEqual(['It', "'s", 'a', 'well-known', 'fact', '.'], self.tokenizer.words("It's a well-known fact."))
+
+    def test_close_to_nltk(self):
+        nltk_tokenizer = tokenizers.get_tokenizer('nltk')
+        for file_name in ('moby_dick.txt', 'python_paradox.txt', 'stats.txt'):
+            # Paragraph replaces em dashes before tokenizing.
+            text = open(file_name).read().replace('—', ' ')
+            nltk_sentences = regex_sentences = nltk_words = regex_words = 0
+            for paragraph in nltk_tokenizer.paragraphs(text):
+                nltk_result = nltk_tokenizer.tokenize(paragraph)
+                regex_result = self.tokenizer.tokenize(paragraph)
+                nltk_sentences += len(nltk_result)
+                regex_sentences += len(regex_result)
+                nltk_words += sum(len(words(tokens)) for _, tokens, _ in nltk_result)
+                regex_words += sum(len(words(tokens)) for _, tokens, _ in regex_result)
+            self.assertAlmostEqual(1, regex_words / nltk_words, delta=0.01, msg=file_name)
+            self.assertAlmostEqual(1, regex_sentences / nltk_sentences, delta=0.1, msg=file_name)
+
+    def test_article(self):
+        text = open('moby_dick.txt').read()
+        article = Article('Moby Dick', 'Herman Melville', text, tokenizer='regex')
+        self.assertIs(self.tokenizer, article.tokenizer)
+        self.assertEqual(Article('Moby Dick', 'Herman Melville', text).total_paragraphs, article.total_paragraphs)
+        self.assertEqual(len(article.paragraphs), article.total_paragraphs)
+        self.assertTrue(summarize(article)['total_words'])
+
+    def test_unknown_tokenizer(self):
+        with self.assertRaises(ValueError):
+            Paragraph('A paragraph.', tokenizer='punkt')
+
+
+if __name__ == "__main__":
+    unittest.main()
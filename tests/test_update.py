@@ -0,0 +1,48 @@
+import unittest
+from homer import analyzer
+
+
+class TestArticleUpdate(unittest.TestCase):
+
+    def setUp(self):
+        self.text = open('moby_dick.txt').read()
+        self.article = analyzer.Article('Moby Dick', 'Herman Melville', self.text)
+        # Fills the caches that update() adjusts.
+        self.article.totals
+        self.article.readability_counts
+        self.article.token_counts
+        self.article.get_lexicon_report()
+
+    def assertSameStats(self, text):
+        expected = analyzer.Article('Moby Dick', 'Herman Melville', text)
+        self.assertEqual(expected.text, self.article.text)
+        self.assertEqual(expected.total_paragraphs, self.article.total_paragraphs)
+        self.assertEqual(expected.totals[:4], self.article.totals[:4])
+        self.assertEqual(len(expected.longest_sentence), len(self.article.longest_sentence))
+        self.assertEqual(expected.readability_counts, self.article.readability_counts)
+        self.assertEqual(expected.get_readability_scores(), self.article.get_readability_scores())
+        self.assertEqual(expected.token_counts, self.article.token_counts)
+        self.assertEqual(expected.get_lexicon_report().counts, self.article.get_lexicon_report().counts)
+        self.assertEqual(expected.find(), self.article.find())
+
+    def test_only_edited_paragraphs_are_analyzed(self):
+        paragraphs = self.article.paragraphs
+        text = self.text.replace('Call me Ishmael', 'Call me Ahab')
+        self.assertEqual(1, self.article.update(text))
+        self.assertIsNot(paragraphs[0], self.article.paragraphs[0])
+        self.assertTrue(all(old is new for old, new in zip(paragraphs[1:], self.article.paragraphs[1:])))
+        self.assertSameStats(text)
+
+    def test_removed_and_added_paragraphs(self):
+        old_paragraphs = self.text.split('\n\n')
+        text = '\n\n'.join(old_paragraphs[1:] + ['A new paragraph. It is very short, sort of.'])
+        self.assertEqual(1, self.article.update(text))
+        self.assertSameStats(text)
+
+    def test_unchanged_text(self):
+        self.assertEqual(0, self.article.update(self.text))
+        self.assertSameStats(self.text)
+
+
+if __name__ == "__main__":
+    unittest.main()
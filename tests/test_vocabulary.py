@@ -0,0 +1,84 @@
+import sys
+import threading
+import unittest
+from homer import analyzer
+from homer.vocabulary import Vocabulary, IS_WORD, IS_AND
+
+
+class TestVocabulary(unittest.TestCase):
+
+    def test_intern(self):
+        vocabulary = Vocabulary()
+        token_id = vocabulary.intern('And')
+        self.assertEqual(token_id, vocabulary.intern('And'))
+        self.assertEqual('And', vocabulary.strings[token_id])
+        self.assertEqual('and', vocabulary.strings[vocabulary.normalized[token_id]])
+        self.assertEqual(IS_WORD | IS_AND, vocabulary.flags[token_id])
+        self.assertEqual(0, vocabulary.flags[vocabulary.intern(',')])
+        self.assertIsNone(vocabulary.id_of('missing'))
+
+    def test_syllables_are_counted_once(self):
+        vocabulary = Vocabulary()
+        token_id = vocabulary.intern('ocean')
+        self.assertEqual(2, vocabulary.syllables(token_id, lambda token: 2))
+        self.assertEqual(2, vocabulary.syllables(token_id, lambda token: 5))
+
+    def test_clear(self):
+        vocabulary = Vocabulary()
+        cleared = []
+        vocabulary.on_clear(lambda: cleared.append(len(vocabulary)))
+        vocabulary.intern('Ocean')
+        vocabulary.clear()
+        self.assertEqual([0], cleared)
+        self.assertEqual(1, vocabulary.generation)
+        self.assertIsNone(vocabulary.id_of('Ocean'))
+        self.assertEqual(0, vocabulary.intern('sea'))
+
+    def test_threads_only_see_complete_entries(self):
+        vocabulary = Vocabulary()
+        tokens = [''.join(chr(ord('a') + number // 26 ** place % 26) for place in range(3)).capitalize()
+                  for number in range(10000)]
+        errors = []
+
+        def intern(offset):
+            try:
+                for number in range(len(tokens)):
+                    token = tokens[(number * 7 + offset) % len(tokens)]
+                    token_id = vocabulary.intern(token)
+                    if (vocabulary.strings[token_id] != token or not vocabulary.flags[token_id] & IS_WORD or
+                            vocabulary.strings[vocabulary.normalized[token_id]] != token.lower()):
+                        errors.append(token)
+            except IndexError as e:
+                errors.append(e)
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=intern, args=(offset,)) for offset in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+        self.assertEqual([], errors)
+        self.assertEqual(2 * len(tokens), len(vocabulary))
+
+
+class TestCompactSentences(unittest.TestCase):
+
+    def test_sentences_share_paragraph_buffer(self):
+        paragraph = analyzer.Paragraph('I love winter. And summer too.')
+        first, second = paragraph.sentences
+        self.assertIs(paragraph.buffer, first.buffer)
+        self.assertIs(paragraph.buffer, second.buffer)
+        self.assertEqual(first.end, second.start)
+        self.assertEqual(['And', 'summer', 'too', '.'], second.tokens)
+        self.assertEqual(['and', 'summer', 'too'], [str(word) for word in second.words])
+        self.assertEqual(1, second.total_and_words)
+
+    def test_words_are_shared(self):
+        self.assertIs(analyzer.get_word('Winter'), analyzer.Sentence('I love winter.').words[2])
+
+
+if __name__ == "__main__":
+    unittest.main()